@@ -2,6 +2,20 @@ from ultralytics import YOLO
 import cv2
 import datetime
 import winsound  
+import os
+
+try:
+    import torch
+    CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    CUDA_AVAILABLE = False
+
+WEIGHTS = "yolov8n.pt"  # Nano model: ~2x faster than yolov8s on CPU, a few mAP points lower
+# Inference size; YOLO cost grows with H*W. 320 keeps people at typical camera
+# distances detectable but misses small/far ones - raise to 480 or 640 if needed
+IMGSZ = 320
+# TensorRT engines only run at the size they were built for
+ENGINE_PATH = f"yolov8n_{IMGSZ}_fp16.engine"
 
 
 def alert_authority(human_count, threshold):
@@ -19,8 +33,25 @@ def alert_authority(human_count, threshold):
     return message
 
 
+def load_model():
+    """Load the detector: a TensorRT FP16 engine on NVIDIA GPUs, exported once
+    for the fixed input size, otherwise the PyTorch checkpoint.
+    Returns (model, extra predict arguments)."""
+    if CUDA_AVAILABLE:
+        if not os.path.exists(ENGINE_PATH):
+            try:
+                print("⚙️ Building TensorRT engine (one-time, takes a few minutes)...")
+                exported = YOLO(WEIGHTS).export(format="engine", half=True, imgsz=IMGSZ, device=0)
+                os.replace(exported, ENGINE_PATH)
+            except Exception as e:
+                print(f"⚠ TensorRT export failed, using PyTorch model: {e}")
+                return YOLO(WEIGHTS), {}
+        return YOLO(ENGINE_PATH, task="detect"), {"half": True, "device": 0}
+    return YOLO(WEIGHTS), {}
+
+
 def main():
-    model = YOLO("yolov8s.pt") 
+    model, predict_args = load_model()
     
     url = "http://192.0.0.4:8080/video"  
     
@@ -42,7 +73,7 @@ def main():
             continue
 
         frame = cv2.resize(frame, (480, 320))
-        results = model(frame, conf=0.5, verbose=False)
+        results = model(frame, conf=0.5, imgsz=IMGSZ, verbose=False, **predict_args)
 
         human_count = 0
         for result in results:
@@ -1,34 +1,137 @@
+import os
+import threading
+from urllib.request import urlopen
 from ultralytics import YOLO
 import cv2
+import numpy as np
+
+try:
+    import torch
+    CUDA_AVAILABLE = torch.cuda.is_available()
+except ImportError:
+    CUDA_AVAILABLE = False
+
+# Load YOLOv8 model (pre-trained on COCO dataset)
+WEIGHTS = "yolov8n.pt"  # Nano model for real-time CPU detection
+# Inference size; YOLO cost grows with H*W. 320 keeps people at typical camera
+# distances detectable but misses small/far ones - raise to 480 or 640 if needed.
+# Boxes come back in 640x480 frame coordinates either way
+IMGSZ = 320
+# TensorRT engines only run at the size they were built for
+ENGINE_PATH = f"yolov8n_{IMGSZ}_fp16.engine"
+
+def read_jpegs(stream):
+    """Yield each JPEG of a multipart MJPEG stream as raw bytes (no decode)"""
+    while True:
+        # Skip the CRLF after the previous part, then the --boundary line
+        line = stream.readline()
+        while line in (b"\r\n", b"\n"):
+            line = stream.readline()
+        if not line:
+            return
+
+        # Part headers run up to a blank line; IP Webcam sends Content-Length
+        length = None
+        line = stream.readline()
+        while line.strip():
+            name, _, value = line.decode('latin-1').partition(':')
+            if name.strip().lower() == 'content-length':
+                length = int(value)
+            line = stream.readline()
+        if not line or length is None:
+            return
+
+        jpeg = stream.read(length)
+        if len(jpeg) < length:
+            return
+        yield jpeg
+
+
+def grab_frames(stream, latest, lock, stop):
+    """Producer thread: keep only the most recent JPEG in a one-slot buffer"""
+    try:
+        for jpeg in read_jpegs(stream):
+            if stop.is_set():
+                break
+            with lock:
+                latest[0] = jpeg  # Frames the consumer never takes are never decoded
+    except OSError as e:
+        print(f"⚠ Camera stream error: {e}")
+    stop.set()
+
+
+def load_model():
+    """Load the detector: a TensorRT FP16 engine on NVIDIA GPUs, exported once
+    for the fixed input size, otherwise the PyTorch checkpoint.
+    Returns (model, extra predict arguments)."""
+    if CUDA_AVAILABLE:
+        if not os.path.exists(ENGINE_PATH):
+            try:
+                print("⚙️ Building TensorRT engine (one-time, takes a few minutes)...")
+                exported = YOLO(WEIGHTS).export(format="engine", half=True, imgsz=IMGSZ, device=0)
+                os.replace(exported, ENGINE_PATH)
+            except Exception as e:
+                print(f"⚠ TensorRT export failed, using PyTorch model: {e}")
+                return YOLO(WEIGHTS), {}
+        return YOLO(ENGINE_PATH, task="detect"), {"half": True, "device": 0}
+    return YOLO(WEIGHTS), {}
+
 
 def main():
-    # Load YOLOv8 model (pre-trained on COCO dataset)
-    model = YOLO("yolov8n.pt")  # Nano model for real-time CPU detection
+    model, predict_args = load_model()
 
     # Mobile IP Webcam URL (replace with your phone's IP)
-    url = "http://192.0.0.4:8080/video"  # <-- change this to your phone's IP
-
-    cap = cv2.VideoCapture(url)
+    base_url = "http://192.0.0.4:8080"  # <-- change this to your phone's IP
+    url = f"{base_url}/video"
 
-    # Optional: request frame size from OpenCV (may not always work for network streams)
-    cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+    # Ask IP Webcam to stream at 640x480 so frames arrive at the processing
+    # size (CAP_PROP_FRAME_WIDTH/HEIGHT are ignored for network streams)
+    try:
+        urlopen(f"{base_url}/settings/video_size?set=640x480", timeout=2).close()
+    except OSError:
+        print("⚠ Could not set stream size on the phone; frames will be resized locally")
 
-    if not cap.isOpened():
+    # Read the MJPEG stream directly so only the frames we process get decoded
+    try:
+        stream = urlopen(url, timeout=5)
+    except OSError:
         print("❌ Error: Could not open mobile camera. Check URL and network.")
         return
 
+    # Grab frames on a separate thread so network reads overlap with detection
+    latest = [None]
+    lock = threading.Lock()
+    stop = threading.Event()
+    grabber = threading.Thread(target=grab_frames, args=(stream, latest, lock, stop), daemon=True)
+    grabber.start()
+
+    # Switched to a half-size decode if the phone sends 1280px+ frames anyway
+    decode_flags = cv2.IMREAD_COLOR
+
     while True:
-        ret, frame = cap.read()
-        if not ret:
-            print("⚠ Failed to grab frame. Retrying...")
-            continue  # Skip frame if grab fails
+        with lock:
+            jpeg, latest[0] = latest[0], None
+        if jpeg is None:
+            if stop.is_set():
+                print("❌ Camera stream ended.")
+                break
+            # No new frame yet - keep the window responsive
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+            continue
+
+        frame = cv2.imdecode(np.frombuffer(jpeg, np.uint8), decode_flags)
+        if frame is None:
+            continue  # Skip corrupt frames
+        if decode_flags == cv2.IMREAD_COLOR and frame.shape[1] >= 1280:
+            decode_flags = cv2.IMREAD_REDUCED_COLOR_2
 
-        # Resize frame to fixed size (ensures consistent processing)
-        frame = cv2.resize(frame, (640, 480))
+        # Resize only if the phone didn't honour the requested stream size
+        if frame.shape[1] != 640 or frame.shape[0] != 480:
+            frame = cv2.resize(frame, (640, 480))
 
         # Run YOLOv8 detection (confidence threshold = 0.5)
-        results = model(frame, conf=0.5)
+        results = model(frame, conf=0.5, imgsz=IMGSZ, **predict_args)
 
         # Count number of people detected
         human_count = 0
@@ -50,7 +153,9 @@ def main():
         if cv2.waitKey(1) & 0xFF == ord('q'):
             break
 
-    cap.release()
+    stop.set()
+    stream.close()
+    grabber.join(timeout=1)
     cv2.destroyAllWindows()
 
 
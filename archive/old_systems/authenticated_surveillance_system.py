@@ -15,6 +15,7 @@ import sqlite3
 import hashlib
 from pathlib import Path
 from PIL import Image, ImageTk
+from user_counts_schema import USER_COUNTS_TRIGGERS, USER_COUNTS_SCHEMA
 
 # Import detection libraries
 try:
@@ -44,6 +45,9 @@ try:
 except ImportError:
     EMAIL_AVAILABLE = False
 
+# How often queued system_logs rows are written, one transaction per batch
+LOG_FLUSH_MS = 1000
+
 class DatabaseManager:
     """Manages user authentication and activity logging"""
     
@@ -109,6 +113,13 @@ class DatabaseManager:
         ''')
         
         conn.commit()
+        
+        # (Re)build user_counts if the table or any of its triggers is missing;
+        # backfill and triggers go in one transaction so no insert is missed
+        cursor.execute("SELECT name FROM sqlite_master WHERE name IN (?, ?, ?, ?, ?)",
+                       ('user_counts', *USER_COUNTS_TRIGGERS))
+        if len(cursor.fetchall()) < 1 + len(USER_COUNTS_TRIGGERS):
+            conn.executescript("BEGIN IMMEDIATE;" + USER_COUNTS_SCHEMA + "COMMIT;")
         conn.close()
     
     def hash_password(self, password):
@@ -205,6 +216,30 @@ class DatabaseManager:
         conn.close()
         return detection_id
     
+    def bulk_insert_detections(self, rows):
+        """Log many detections in one transaction and return their IDs in order
+        
+        rows: iterable of (user_id, session_id, detection_type, confidence, description, image_path)
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany(
+                    """INSERT INTO detections 
+                       (user_id, session_id, detection_type, confidence, description, image_path)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    rows
+                )
+                # IDs from one AUTOINCREMENT transaction are consecutive
+                last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        finally:
+            conn.close()
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+    
     def mark_email_sent(self, detection_id):
         """Mark that email was sent for detection"""
         conn = sqlite3.connect(self.db_path)
@@ -229,6 +264,22 @@ class DatabaseManager:
         conn.commit()
         conn.close()
     
+    def bulk_insert_logs(self, rows):
+        """Log many system actions in one transaction
+        
+        rows: iterable of (user_id, action, details, timestamp), with timestamp
+        in CURRENT_TIMESTAMP's UTC format so batched rows keep their event time
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO system_logs (user_id, action, details, timestamp) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+        finally:
+            conn.close()
+    
     def get_user_email(self, user_id):
         """Get user email by ID"""
         conn = sqlite3.connect(self.db_path)
@@ -479,6 +530,7 @@ class AuthenticatedSurveillanceSystem:
         self.monitoring = False
         self.frame_queue = queue.Queue(maxsize=10)
         self.detection_queue = queue.Queue()
+        self.pending_logs = queue.Queue()  # system_logs rows for the next batch write
         
         # Load AI models (lazy loading)
         self.models = {}
@@ -492,11 +544,8 @@ class AuthenticatedSurveillanceSystem:
         self.detection_thread.start()
         
         # Log system start
-        self.db_manager.log_system_action(
-            self.user_id, 
-            "SYSTEM_START", 
-            f"Surveillance system started for session {self.session_id}"
-        )
+        self.queue_log("SYSTEM_START", f"Surveillance system started for session {self.session_id}")
+        self.root.after(LOG_FLUSH_MS, self.flush_logs)
         
         # Run main loop
         self.root.mainloop()
@@ -683,10 +732,28 @@ class AuthenticatedSurveillanceSystem:
         
         # Also log to database
         if hasattr(self, 'user_id') and self.user_id:
+            self.queue_log("LOG", message)
+    
+    def queue_log(self, action, details=""):
+        """Queue a system_logs row; flush_logs writes the queue in one transaction"""
+        timestamp = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        self.pending_logs.put((self.user_id, action, details, timestamp))
+    
+    def flush_logs(self, reschedule=True):
+        """Write all queued system_logs rows with a single commit"""
+        rows = []
+        while True:
             try:
-                self.db_manager.log_system_action(self.user_id, "LOG", message)
+                rows.append(self.pending_logs.get_nowait())
+            except queue.Empty:
+                break
+        if rows:
+            try:
+                self.db_manager.bulk_insert_logs(rows)
             except Exception:
                 pass  # Don't fail if database logging fails
+        if reschedule:
+            self.root.after(LOG_FLUSH_MS, self.flush_logs)
     
     def update_stats(self):
         """Update statistics display"""
@@ -746,7 +813,7 @@ class AuthenticatedSurveillanceSystem:
             
             if self.cap.isOpened():
                 self.log_message("✅ Camera connected successfully!")
-                self.db_manager.log_system_action(self.user_id, "CAMERA_CONNECT", f"Connected to {ip_url}")
+                self.queue_log("CAMERA_CONNECT", f"Connected to {ip_url}")
                 
                 # Start video display
                 self.update_video_display()
@@ -769,7 +836,7 @@ class AuthenticatedSurveillanceSystem:
         self.stop_btn.config(state='normal')
         
         self.log_message("🎯 Threat monitoring started")
-        self.db_manager.log_system_action(self.user_id, "MONITORING_START", "Threat detection monitoring started")
+        self.queue_log("MONITORING_START", "Threat detection monitoring started")
         
         # Start monitoring thread
         self.monitor_thread = threading.Thread(target=self.monitor_threats, daemon=True)
@@ -782,7 +849,7 @@ class AuthenticatedSurveillanceSystem:
         self.stop_btn.config(state='disabled')
         
         self.log_message("⏹️ Threat monitoring stopped")
-        self.db_manager.log_system_action(self.user_id, "MONITORING_STOP", "Threat detection monitoring stopped")
+        self.queue_log("MONITORING_STOP", "Threat detection monitoring stopped")
     
     def update_video_display(self):
         """Update video display"""
@@ -834,23 +901,23 @@ class AuthenticatedSurveillanceSystem:
         try:
             results = self.models['weapon'](frame)
             
+            descriptions = []
+            rows = []
             for result in results:
                 boxes = result.boxes
                 if boxes is not None:
                     for box in boxes:
                         confidence = float(box.conf[0])
                         if confidence > 0.5:  # Confidence threshold
-                            # Log detection
-                            detection_id = self.db_manager.log_detection(
-                                self.user_id,
-                                self.session_id,
-                                "WEAPON",
-                                confidence,
-                                f"Weapon detected with {confidence:.2f} confidence"
-                            )
-                            
-                            # Send alert
-                            self.send_threat_alert("WEAPON", f"Weapon detected with {confidence:.2f} confidence", detection_id)
+                            description = f"Weapon detected with {confidence:.2f} confidence"
+                            descriptions.append(description)
+                            rows.append((self.user_id, self.session_id, "WEAPON",
+                                         confidence, description, ""))
+            
+            # Log every weapon in this frame with one transaction, then alert
+            detection_ids = self.db_manager.bulk_insert_detections(rows)
+            for description, detection_id in zip(descriptions, detection_ids):
+                self.send_threat_alert("WEAPON", description, detection_id)
         
         except Exception as e:
             self.log_message(f"Weapon detection error: {e}")
@@ -1049,7 +1116,8 @@ Smart Surveillance System
         # End session
         if self.session_id:
             self.db_manager.end_session(self.session_id)
-            self.db_manager.log_system_action(self.user_id, "LOGOUT", "User logged out")
+            self.queue_log("LOGOUT", "User logged out")
+        self.flush_logs(reschedule=False)
         
         # Close window
         self.root.destroy()
@@ -15,6 +15,7 @@ import sqlite3
 import hashlib
 from pathlib import Path
 from PIL import Image, ImageTk
+from user_counts_schema import USER_COUNTS_TRIGGERS, USER_COUNTS_SCHEMA
 
 # Import detection libraries with graceful fallback
 try:
@@ -106,6 +107,13 @@ class DatabaseManager:
         ''')
         
         conn.commit()
+        
+        # (Re)build user_counts if the table or any of its triggers is missing;
+        # backfill and triggers go in one transaction so no insert is missed
+        cursor.execute("SELECT name FROM sqlite_master WHERE name IN (?, ?, ?, ?, ?)",
+                       ('user_counts', *USER_COUNTS_TRIGGERS))
+        if len(cursor.fetchall()) < 1 + len(USER_COUNTS_TRIGGERS):
+            conn.executescript("BEGIN IMMEDIATE;" + USER_COUNTS_SCHEMA + "COMMIT;")
         conn.close()
     
     def hash_password(self, password):
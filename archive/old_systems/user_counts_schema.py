@@ -0,0 +1,48 @@
+"""
+Per-user session and detection counts for the surveillance database
+
+Shared by the authenticated systems, which create the table and triggers,
+and the data viewer, which only reads from them once they are complete.
+"""
+
+# Per-user counts kept up to date by triggers, so the data viewer's Users tab
+# and top-users report don't re-aggregate sessions and detections
+USER_COUNTS_TRIGGERS = ('user_counts_sessions_ai', 'user_counts_sessions_ad',
+                        'user_counts_detections_ai', 'user_counts_detections_ad')
+USER_COUNTS_SCHEMA = """
+    DROP TRIGGER IF EXISTS user_counts_sessions_ai;
+    DROP TRIGGER IF EXISTS user_counts_sessions_ad;
+    DROP TRIGGER IF EXISTS user_counts_detections_ai;
+    DROP TRIGGER IF EXISTS user_counts_detections_ad;
+    DROP TABLE IF EXISTS user_counts;
+    
+    CREATE TABLE user_counts (
+        user_id INTEGER PRIMARY KEY,
+        session_count INTEGER NOT NULL DEFAULT 0,
+        detection_count INTEGER NOT NULL DEFAULT 0
+    );
+    
+    INSERT INTO user_counts (user_id, session_count, detection_count)
+    SELECT u.id,
+           (SELECT COUNT(*) FROM sessions WHERE user_id = u.id),
+           (SELECT COUNT(*) FROM detections WHERE user_id = u.id)
+    FROM users u;
+    
+    CREATE TRIGGER user_counts_sessions_ai AFTER INSERT ON sessions BEGIN
+        INSERT INTO user_counts (user_id, session_count) VALUES (NEW.user_id, 1)
+        ON CONFLICT(user_id) DO UPDATE SET session_count = session_count + 1;
+    END;
+    
+    CREATE TRIGGER user_counts_sessions_ad AFTER DELETE ON sessions BEGIN
+        UPDATE user_counts SET session_count = session_count - 1 WHERE user_id = OLD.user_id;
+    END;
+    
+    CREATE TRIGGER user_counts_detections_ai AFTER INSERT ON detections BEGIN
+        INSERT INTO user_counts (user_id, detection_count) VALUES (NEW.user_id, 1)
+        ON CONFLICT(user_id) DO UPDATE SET detection_count = detection_count + 1;
+    END;
+    
+    CREATE TRIGGER user_counts_detections_ad AFTER DELETE ON detections BEGIN
+        UPDATE user_counts SET detection_count = detection_count - 1 WHERE user_id = OLD.user_id;
+    END;
+"""
@@ -4,7 +4,29 @@
 Helps you identify the correct IP for your mobile camera
 """
 
+import asyncio
+import http.client
+import os
 import socket
+import sys
+
+# Optional: mDNS discovery of cameras that advertise themselves
+try:
+    from zeroconf import IPVersion, ServiceStateChange
+    from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
+    ZEROCONF_AVAILABLE = True
+except ImportError:
+    ZEROCONF_AVAILABLE = False
+
+# Service types advertised by IP Webcam-style apps, mapped to URL templates
+MDNS_SERVICE_URLS = {
+    "_http._tcp.local.": "http://{ip}:{port}/video",
+    "_rtsp._tcp.local.": "rtsp://{ip}:{port}/",
+}
+
+# _http._tcp is also advertised by printers, NAS boxes and routers; an HTTP
+# service only counts as a camera if its name or TXT record mentions one of these
+CAMERA_HINTS = ("webcam", "camera", "ipcam", "droidcam")
 
 def get_local_ip():
     """Get this computer's IP address"""
@@ -17,11 +39,134 @@ def get_local_ip():
     except Exception:
         return "Unable to determine"
 
+def resolve_numeric(ip, port):
+    """Return the sockaddr for a numeric IPv4 address, or None if ip isn't numeric
+
+    AI_NUMERICHOST keeps getaddrinfo from consulting the system resolver
+    (nsswitch/mDNS plugins), which can stall on some Linux setups.
+    """
+    try:
+        info = socket.getaddrinfo(ip, port, socket.AF_INET, socket.SOCK_STREAM,
+                                  0, socket.AI_NUMERICHOST)
+    except socket.gaierror:
+        return None
+    return info[0][4]
+
+def test_camera_url(host, port=8080, path="/video", timeout=5):
+    """Request path from an IP webcam server, raising on any failure
+
+    Numeric addresses connect straight to resolve_numeric's sockaddr so the
+    resolver is never consulted; hostnames such as phone.local resolve normally.
+    """
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        addr = resolve_numeric(host, port)
+        if addr is not None:
+            conn.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            conn.sock.settimeout(timeout)
+            conn.sock.connect(addr)
+        conn.request("GET", path)
+        response = conn.getresponse()
+        if response.status >= 400:
+            raise http.client.HTTPException(f"HTTP {response.status} {response.reason}")
+    finally:
+        conn.close()
+
+async def _probe_port(semaphore, ip, port, timeout=0.5):
+    """Return True if a TCP connection to ip:port succeeds within timeout"""
+    async with semaphore:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+async def _host_is_up(semaphore, ip, timeout=0.1):
+    """Cheap liveness gate: a connect or a RST on port 80 proves the host exists"""
+    async with semaphore:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, 80), timeout)
+        except ConnectionRefusedError:
+            return True
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        return True
+
+async def _scan_hosts(network_base, common_ports):
+    """Probe every host/port pair in the /24 concurrently"""
+    # Cap in-flight connects so we stay well below the open-file limit
+    semaphore = asyncio.Semaphore(256)
+    hosts = [f"{network_base}.{i}" for i in range(1, 255)]
+
+    # Phase 1: one connect per host; silent hosts are skipped entirely
+    alive = await asyncio.gather(*(_host_is_up(semaphore, ip) for ip in hosts))
+    hosts = [ip for ip, up in zip(hosts, alive) if up]
+
+    # Phase 2: probe the camera ports only on hosts that answered
+    targets = [(ip, port) for ip in hosts for port in common_ports]
+    results = await asyncio.gather(*(_probe_port(semaphore, ip, port) for ip, port in targets))
+    return [target for target, is_open in zip(targets, results) if is_open]
+
+def _looks_like_camera(service_type, name, properties):
+    """True for RTSP services and HTTP services whose name/TXT mention a camera"""
+    if service_type == "_rtsp._tcp.local.":
+        return True
+    text = [name]
+    for key, value in properties.items():
+        text += [key or b"", value or b""]
+    text = " ".join(t.decode("utf-8", "replace") if isinstance(t, bytes) else t for t in text).lower()
+    return any(hint in text for hint in CAMERA_HINTS)
+
+async def _mdns_scan(browse_time=2.0):
+    """Browse mDNS for advertised services; returns [(url, looks_like_camera)]"""
+    found = {}
+
+    def on_service_state_change(zeroconf, service_type, name, state_change):
+        if state_change is ServiceStateChange.Added:
+            found[name] = service_type
+
+    aiozc = AsyncZeroconf()
+    try:
+        browser = AsyncServiceBrowser(aiozc.zeroconf, list(MDNS_SERVICE_URLS),
+                                      handlers=[on_service_state_change])
+        await asyncio.sleep(browse_time)
+        await browser.async_cancel()
+
+        urls = []
+        for name, service_type in found.items():
+            info = AsyncServiceInfo(service_type, name)
+            if not await info.async_request(aiozc.zeroconf, 1000):
+                continue
+            is_camera = _looks_like_camera(service_type, name, info.properties)
+            for ip in info.parsed_addresses(IPVersion.V4Only):
+                urls.append((MDNS_SERVICE_URLS[service_type].format(ip=ip, port=info.port), is_camera))
+        return urls
+    finally:
+        await aiozc.async_close()
+
 def scan_network_for_cameras():
     """Scan local network for potential IP webcam devices"""
+    # One multicast query finds every advertising device. Only a service that
+    # is clearly a camera skips the TCP port scan: IP Webcam itself does not
+    # advertise, so generic HTTP hits must not hide it
+    unverified = []
+    if ZEROCONF_AVAILABLE:
+        print("Browsing mDNS for advertised camera services...")
+        try:
+            mdns_services = asyncio.run(_mdns_scan())
+        except OSError as e:
+            print(f"⚠️ mDNS browse failed: {e}")
+            mdns_services = []
+        cameras = [url for url, is_camera in mdns_services if is_camera]
+        unverified = [url for url, is_camera in mdns_services if not is_camera]
+        if cameras:
+            return cameras + [f"{url} (unverified: generic HTTP service)" for url in unverified]
+
     local_ip = get_local_ip()
     if local_ip == "Unable to determine":
-        return []
+        return [f"{url} (unverified: generic HTTP service)" for url in unverified]
     
     # Get network range (assume /24 subnet)
     ip_parts = local_ip.split('.')
@@ -34,88 +179,71 @@ def scan_network_for_cameras():
     # Common IP webcam ports
     common_ports = [8080, 8081, 4747, 8000]
     
-    # Scan last 50 IPs in the range (most common for DHCP)
-    for i in range(100, 150):
-        test_ip = f"{network_base}.{i}"
-        
-        for port in common_ports:
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(0.5)
-                result = sock.connect_ex((test_ip, port))
-                sock.close()
-                
-                if result == 0:
-                    potential_cameras.append(f"http://{test_ip}:{port}/video")
-                    print(f"✅ Found potential camera at {test_ip}:{port}")
-                    
-            except Exception:
-                continue
+    # Scan the whole /24 - probes run concurrently, so this costs about
+    # the same wall-time as a single timeout. Hits are returned rather than
+    # printed; the caller decides how to report them.
+    for test_ip, port in asyncio.run(_scan_hosts(network_base, common_ports)):
+        potential_cameras.append(f"http://{test_ip}:{port}/video")
     
+    # mDNS HTTP hits the scan did not also find are listed last, marked as such
+    potential_cameras += [f"{url} (unverified: generic HTTP service)"
+                          for url in unverified if url not in potential_cameras]
     return potential_cameras
 
 def show_ip_instructions():
     """Show detailed instructions for finding mobile IP"""
-    local_ip = get_local_ip()
-    
-    print("="*60)
-    print("📱 HOW TO FIND YOUR MOBILE IP WEBCAM ADDRESS")
-    print("="*60)
-    print()
-    print("METHOD 1: Check IP Webcam App")
-    print("-" * 30)
-    print("1. Open 'IP Webcam' app on your Android phone")
-    print("2. Scroll down and tap 'Start server'")
-    print("3. Look at the bottom of the screen")
-    print("4. You'll see something like: 'Access your camera at: http://192.168.0.107:8080'")
-    print("5. Use this EXACT address in the surveillance system")
-    print()
+    if os.environ.get("SURV_QUIET"):
+        return
     
-    print("METHOD 2: Check WiFi Settings")
-    print("-" * 30)
-    print("1. Go to WiFi settings on your phone")
-    print("2. Tap on the connected WiFi network")
-    print("3. Look for 'IP address' - usually starts with 192.168")
-    print("4. Add ':8080/video' to the end")
-    print("   Example: if IP is 192.168.1.105, use http://192.168.1.105:8080/video")
-    print()
-    
-    print("METHOD 3: Common IP Patterns")
-    print("-" * 30)
-    print(f"Your laptop IP: {local_ip}")
-    if local_ip.startswith("192.168.0"):
-        print("Try these common mobile IPs:")
-        print("  - http://192.168.0.105:8080/video")
-        print("  - http://192.168.0.106:8080/video") 
-        print("  - http://192.168.0.107:8080/video")
-        print("  - http://192.168.0.108:8080/video")
-    elif local_ip.startswith("192.168.1"):
-        print("Try these common mobile IPs:")
-        print("  - http://192.168.1.105:8080/video")
-        print("  - http://192.168.1.106:8080/video")
-        print("  - http://192.168.1.107:8080/video")
-        print("  - http://192.168.1.108:8080/video")
-    else:
-        network = '.'.join(local_ip.split('.')[:-1])
-        print(f"Try these IPs in your network ({network}.x):")
-        for i in [105, 106, 107, 108, 109, 110]:
-            print(f"  - http://{network}.{i}:8080/video")
-    print()
-    
-    print("TROUBLESHOOTING TIPS")
-    print("-" * 30)
-    print("❌ If connection fails:")
-    print("  1. Make sure both devices are on the SAME WiFi network")
-    print("  2. Check if your phone's firewall is blocking connections")
-    print("  3. Try restarting the IP Webcam app")
-    print("  4. Try using mobile hotspot from phone, connect laptop to it")
-    print("  5. Some routers block device-to-device communication")
-    print()
+    local_ip = get_local_ip()
     
-    print("✅ Test your IP:")
-    print("  Open your browser and go to: http://YOUR_PHONE_IP:8080")
-    print("  You should see the IP Webcam interface")
-    print("="*60)
+    lines = [
+        "="*60,
+        "📱 HOW TO FIND YOUR MOBILE IP WEBCAM ADDRESS",
+        "="*60,
+        "",
+        "METHOD 1: Check IP Webcam App",
+        "-" * 30,
+        "1. Open 'IP Webcam' app on your Android phone",
+        "2. Scroll down and tap 'Start server'",
+        "3. Look at the bottom of the screen",
+        "4. You'll see something like: 'Access your camera at: http://192.168.0.107:8080'",
+        "5. Use this EXACT address in the surveillance system",
+        "",
+        "METHOD 2: Check WiFi Settings",
+        "-" * 30,
+        "1. Go to WiFi settings on your phone",
+        "2. Tap on the connected WiFi network",
+        "3. Look for 'IP address' - usually starts with 192.168",
+        "4. Add ':8080/video' to the end",
+        "   Example: if IP is 192.168.1.105, use http://192.168.1.105:8080/video",
+        "",
+        "METHOD 3: Common IP Patterns",
+        "-" * 30,
+        f"Your laptop IP: {local_ip}",
+    ]
+    network = local_ip.rsplit('.', 1)[0]
+    lines.append(f"Try these IPs in your network ({network}.x):")
+    for i in (105, 106, 107, 108):
+        lines.append(f"  - http://{network}.{i}:8080/video")
+    lines += [
+        "",
+        "TROUBLESHOOTING TIPS",
+        "-" * 30,
+        "❌ If connection fails:",
+        "  1. Make sure both devices are on the SAME WiFi network",
+        "  2. Check if your phone's firewall is blocking connections",
+        "  3. Try restarting the IP Webcam app",
+        "  4. Try using mobile hotspot from phone, connect laptop to it",
+        "  5. Some routers block device-to-device communication",
+        "",
+        "✅ Test your IP:",
+        "  Open your browser and go to: http://YOUR_PHONE_IP:8080",
+        "  You should see the IP Webcam interface",
+        "="*60,
+    ]
+    # One write instead of ~50 separate print() calls
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main function"""
@@ -147,14 +275,13 @@ def main():
             print("  2. Both devices are on the same WiFi network")
             
     elif choice == "3":
-        test_ip = input("Enter IP address to test (e.g., 192.168.0.107): ").strip()
+        test_ip = input("Enter IP address or hostname to test (e.g., 192.168.0.107): ").strip()
         if test_ip:
             test_url = f"http://{test_ip}:8080/video"
             print(f"Testing: {test_url}")
             
             try:
-                import urllib.request
-                urllib.request.urlopen(test_url, timeout=5)
+                test_camera_url(test_ip)
                 print("✅ IP webcam server is responding!")
                 print(f"Use this URL: {test_url}")
             except Exception as e:
@@ -88,30 +88,29 @@ def main():
     print("3. Console Mode Only")
     print("4. Exit")
     
+    dispatch = {
+        '1': ("Starting GUI mode...", 'surveillance_gui.py'),
+        '2': ("Starting integrated mode...", 'integrated_surveillance.py'),
+        '3': ("Starting console mode...", 'integration.py'),
+    }
+    
     while True:
         try:
-            choice = input("\nEnter your choice (1-4): ")
-            
-            if choice == '1':
-                print("Starting GUI mode...")
-                os.system(f'{sys.executable} surveillance_gui.py')
-                break
-            elif choice == '2':
-                print("Starting integrated mode...")
-                os.system(f'{sys.executable} integrated_surveillance.py')
-                break
-            elif choice == '3':
-                print("Starting console mode...")
-                os.system(f'{sys.executable} integration.py')
-                break
-            elif choice == '4':
-                print("Goodbye!")
-                break
-            else:
-                print("Invalid choice. Please enter 1-4.")
+            choice = input("\nEnter your choice (1-4): ").strip()
         except KeyboardInterrupt:
             print("\nGoodbye!")
             break
+        
+        target = dispatch.get(choice)
+        if target:
+            message, script = target
+            print(message, flush=True)
+            os.execvp(sys.executable, [sys.executable, script])
+        elif choice == '4':
+            print("Goodbye!")
+            break
+        else:
+            print("Invalid choice. Please enter 1-4.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
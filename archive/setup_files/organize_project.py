@@ -178,6 +178,9 @@ Smart_Servellance_System/
 
 def show_final_structure():
     """Show the clean project structure"""
+    if os.environ.get("SURV_QUIET"):
+        return
+    
     print("\n" + "="*60)
     print("📁 CLEAN PROJECT STRUCTURE (What examiner will see)")
     print("="*60)
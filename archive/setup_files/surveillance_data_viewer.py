@@ -4,12 +4,178 @@
 View all user activities, detections, and system logs
 """
 
+import queue
 import sqlite3
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import datetime
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+# user_counts and the triggers that maintain it are created by the surveillance
+# app's DatabaseManager.init_database; the viewer only uses them when complete
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'old_systems'))
+from user_counts_schema import USER_COUNTS_TRIGGERS
+
+# Queries are module-level constants so the connection's statement cache
+# (cached_statements) reuses the compiled statements across refreshes
+USERS_SQL = """
+    SELECT u.id, u.email,
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', u.created_at), 'N/A'),
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', u.last_login), 'Never'),
+           COALESCE(c.session_count, 0) as session_count,
+           COALESCE(c.detection_count, 0) as detection_count
+    FROM users u
+    LEFT JOIN user_counts c ON u.id = c.user_id
+    ORDER BY u.created_at DESC
+"""
+
+# Used when the user_counts summary table couldn't be created; each count is
+# an indexed subquery so sessions and detections are never joined together
+USERS_AGGREGATE_SQL = """
+    SELECT u.id, u.email,
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', u.created_at), 'N/A'),
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', u.last_login), 'Never'),
+           (SELECT COUNT(*) FROM sessions WHERE user_id = u.id) as session_count,
+           (SELECT COUNT(*) FROM detections WHERE user_id = u.id) as detection_count
+    FROM users u
+    ORDER BY u.created_at DESC
+"""
+
+SESSIONS_SQL = """
+    SELECT s.id, u.email,
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', s.login_time), 'N/A'),
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', s.logout_time), 'Active'),
+           CASE WHEN s.duration_minutes THEN printf('%.1f', s.duration_minutes)
+                ELSE 'Active' END as duration,
+           COUNT(d.id) as detection_count
+    FROM sessions s
+    JOIN users u ON s.user_id = u.id
+    LEFT JOIN detections d ON s.id = d.session_id
+    GROUP BY s.id, u.email, s.login_time, s.logout_time, s.duration_minutes
+    ORDER BY s.login_time DESC
+"""
+
+# Detections and logs are paged newest-first. Later pages continue from the
+# last (timestamp, id) seen (keyset pagination) instead of using OFFSET; the
+# raw timestamp is selected as a trailing column for that and not displayed.
+PAGE_SIZE = 200
+
+DETECTIONS_SQL = """
+    SELECT d.id, u.email, d.detection_type,
+           CASE WHEN d.confidence THEN printf('%.2f', d.confidence) ELSE 'N/A' END,
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', d.timestamp), 'N/A'), d.description,
+           CASE WHEN d.email_sent THEN '✅ Yes' ELSE '❌ No' END,
+           d.timestamp
+    FROM detections d
+    JOIN users u ON d.user_id = u.id
+    ORDER BY d.timestamp DESC, d.id DESC
+    LIMIT ?
+"""
+
+DETECTIONS_PAGE_SQL = """
+    SELECT d.id, u.email, d.detection_type,
+           CASE WHEN d.confidence THEN printf('%.2f', d.confidence) ELSE 'N/A' END,
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', d.timestamp), 'N/A'), d.description,
+           CASE WHEN d.email_sent THEN '✅ Yes' ELSE '❌ No' END,
+           d.timestamp
+    FROM detections d
+    JOIN users u ON d.user_id = u.id
+    WHERE (d.timestamp, d.id) < (?, ?)
+    ORDER BY d.timestamp DESC, d.id DESC
+    LIMIT ?
+"""
+
+LOGS_SQL = """
+    SELECT l.id, u.email, l.action, COALESCE(l.details, ''),
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', l.timestamp), 'N/A'), l.timestamp
+    FROM system_logs l
+    JOIN users u ON l.user_id = u.id
+    ORDER BY l.timestamp DESC, l.id DESC
+    LIMIT ?
+"""
+
+LOGS_PAGE_SQL = """
+    SELECT l.id, u.email, l.action, COALESCE(l.details, ''),
+           COALESCE(strftime('%Y-%m-%d %H:%M:%S', l.timestamp), 'N/A'), l.timestamp
+    FROM system_logs l
+    JOIN users u ON l.user_id = u.id
+    WHERE (l.timestamp, l.id) < (?, ?)
+    ORDER BY l.timestamp DESC, l.id DESC
+    LIMIT ?
+"""
+
+# Per-table change fingerprints: row count, newest id, plus the columns the
+# writers UPDATE in place (last_login, logout_time, email_sent). These scan
+# whole tables, so they run on the refresh worker, never the UI thread.
+FINGERPRINT_SQL = """
+    SELECT (SELECT COUNT(*) FROM users), (SELECT MAX(id) FROM users),
+           (SELECT MAX(last_login) FROM users),
+           (SELECT COUNT(*) FROM sessions), (SELECT MAX(id) FROM sessions),
+           (SELECT COUNT(logout_time) FROM sessions),
+           (SELECT COUNT(*) FROM detections), (SELECT MAX(id) FROM detections),
+           (SELECT SUM(email_sent) FROM detections),
+           (SELECT COUNT(*) FROM system_logs), (SELECT MAX(id) FROM system_logs)
+"""
+
+# Notebook tabs in display order, and which tabs each table feeds
+TABS = ('users', 'sessions', 'detections', 'logs', 'stats')
+TABLE_TABS = {
+    'users': {'users', 'stats'},
+    'sessions': {'users', 'sessions', 'stats'},
+    'detections': {'users', 'sessions', 'detections', 'stats'},
+    'logs': {'logs', 'stats'},
+}
+
+STATS_SQL = """
+    SELECT (SELECT COUNT(*) FROM users),
+           (SELECT COUNT(*) FROM sessions),
+           (SELECT COUNT(*) FROM sessions WHERE logout_time IS NULL),
+           (SELECT COUNT(*) FROM detections),
+           (SELECT COUNT(*) FROM detections WHERE email_sent = 1),
+           (SELECT COUNT(*) FROM sessions WHERE login_time >= datetime('now', '-1 day')),
+           (SELECT COUNT(*) FROM detections WHERE timestamp >= datetime('now', '-1 day')),
+           (SELECT MAX(timestamp) FROM system_logs)
+"""
+
+BREAKDOWN_SQL = """
+    SELECT detection_type, COUNT(*) as count, AVG(confidence) as avg_confidence
+    FROM detections 
+    GROUP BY detection_type 
+    ORDER BY count DESC
+"""
+
+TOP_USERS_SQL = """
+    SELECT u.email, COALESCE(c.session_count, 0) as sessions,
+           COALESCE(c.detection_count, 0) as detections
+    FROM users u
+    LEFT JOIN user_counts c ON u.id = c.user_id
+    ORDER BY sessions DESC, detections DESC
+    LIMIT 5
+"""
+
+TOP_USERS_AGGREGATE_SQL = """
+    SELECT u.email,
+           (SELECT COUNT(*) FROM sessions WHERE user_id = u.id) as sessions,
+           (SELECT COUNT(*) FROM detections WHERE user_id = u.id) as detections
+    FROM users u
+    ORDER BY sessions DESC, detections DESC
+    LIMIT 5
+"""
+
+# Indexes for the viewer's join and sort columns: name -> table(columns)
+VIEWER_INDEXES = {
+    'idx_sessions_user_login': 'sessions(user_id, login_time DESC)',
+    'idx_detections_user_ts': 'detections(user_id, timestamp DESC)',
+    'idx_detections_session': 'detections(session_id)',
+    'idx_logs_user_ts': 'system_logs(user_id, timestamp DESC)',
+    'idx_detections_ts': 'detections(timestamp)',
+    'idx_logs_ts': 'system_logs(timestamp)',
+}
+
 class SurveillanceDataViewer:
     """GUI for viewing surveillance system data"""
     
@@ -21,6 +187,20 @@ class SurveillanceDataViewer:
             messagebox.showerror("Error", f"Database not found: {db_path}")
             return
         
+        self.ensure_indexes()
+        self.has_user_counts = self.detect_user_counts()
+        
+        # Long-lived connection for UI-thread paging; refreshes run their
+        # heavy queries on a worker thread with its own connection
+        self.conn = self.open_connection()
+        self.row_q = queue.Queue()
+        self.loading = False
+        self.refresh_pending = False
+        self.data_version = None
+        self.fingerprints = {}
+        self.stale_tabs = set()
+        self.page_size = None  # Fixed once the database exists
+        
         self.root = tk.Tk()
         self.root.title("📊 Surveillance Data Viewer")
         self.root.geometry("1200x700")
@@ -29,8 +209,63 @@ class SurveillanceDataViewer:
         self.setup_ui()
         self.load_data()
     
+    def open_connection(self):
+        """Open a connection tuned for the viewer's read workload"""
+        conn = sqlite3.connect(self.db_path, isolation_level=None,
+                               check_same_thread=False, cached_statements=256)
+        # WAL lets the surveillance system keep writing while we read
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # The viewer never writes through this connection
+        conn.execute("PRAGMA query_only=1")
+        return conn
+    
+    def ensure_indexes(self):
+        """Create indexes for the viewer's join and sort columns
+        
+        ANALYZE scans the whole database, so it only runs when an index
+        was actually missing, not on every launch.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            existing = {name for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'")}
+            if VIEWER_INDEXES.keys() <= existing:
+                return
+            conn.executescript("".join(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {target};\n"
+                for name, target in VIEWER_INDEXES.items()) + "ANALYZE;")
+        except sqlite3.OperationalError as e:
+            # Read-only or locked database - the viewer still works, just slower
+            print(f"⚠️ Could not create indexes: {e}")
+        finally:
+            conn.close()
+    
+    def detect_user_counts(self):
+        """True if the user_counts table and all of its triggers exist
+        
+        Without any one trigger the counts drift, so the viewer falls back
+        to aggregating sessions and detections itself.
+        """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            names = conn.execute(
+                "SELECT name FROM sqlite_master WHERE name IN (?, ?, ?, ?, ?)",
+                ('user_counts', *USER_COUNTS_TRIGGERS)
+            ).fetchall()
+            return len(names) == 1 + len(USER_COUNTS_TRIGGERS)
+        finally:
+            conn.close()
+    
     def setup_ui(self):
         """Setup user interface"""
+        # Backing row lists for the virtualized treeviews
+        self.virtual_views = {}
+        self.row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        
         # Title
         title_label = tk.Label(
             self.root,
@@ -44,6 +279,7 @@ class SurveillanceDataViewer:
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        self.notebook.bind('<<NotebookTabChanged>>', lambda e: self.load_visible_tab())
         
         # Users tab
         self.setup_users_tab()
@@ -89,9 +325,10 @@ class SurveillanceDataViewer:
             self.users_tree.column(col, width=150)
         
         # Scrollbars
-        users_scrollbar_v = ttk.Scrollbar(users_frame, orient='vertical', command=self.users_tree.yview)
+        users_scrollbar_v = ttk.Scrollbar(users_frame, orient='vertical')
         users_scrollbar_h = ttk.Scrollbar(users_frame, orient='horizontal', command=self.users_tree.xview)
-        self.users_tree.configure(yscrollcommand=users_scrollbar_v.set, xscrollcommand=users_scrollbar_h.set)
+        self.users_tree.configure(xscrollcommand=users_scrollbar_h.set)
+        self.setup_virtual_tree(self.users_tree, users_scrollbar_v)
         
         # Pack
         self.users_tree.pack(side='left', fill='both', expand=True, padx=5, pady=5)
@@ -112,9 +349,10 @@ class SurveillanceDataViewer:
             self.sessions_tree.column(col, width=150)
         
         # Scrollbars
-        sessions_scrollbar_v = ttk.Scrollbar(sessions_frame, orient='vertical', command=self.sessions_tree.yview)
+        sessions_scrollbar_v = ttk.Scrollbar(sessions_frame, orient='vertical')
         sessions_scrollbar_h = ttk.Scrollbar(sessions_frame, orient='horizontal', command=self.sessions_tree.xview)
-        self.sessions_tree.configure(yscrollcommand=sessions_scrollbar_v.set, xscrollcommand=sessions_scrollbar_h.set)
+        self.sessions_tree.configure(xscrollcommand=sessions_scrollbar_h.set)
+        self.setup_virtual_tree(self.sessions_tree, sessions_scrollbar_v)
         
         # Pack
         self.sessions_tree.pack(side='left', fill='both', expand=True, padx=5, pady=5)
@@ -135,9 +373,10 @@ class SurveillanceDataViewer:
             self.detections_tree.column(col, width=130)
         
         # Scrollbars
-        detections_scrollbar_v = ttk.Scrollbar(detections_frame, orient='vertical', command=self.detections_tree.yview)
+        detections_scrollbar_v = ttk.Scrollbar(detections_frame, orient='vertical')
         detections_scrollbar_h = ttk.Scrollbar(detections_frame, orient='horizontal', command=self.detections_tree.xview)
-        self.detections_tree.configure(yscrollcommand=detections_scrollbar_v.set, xscrollcommand=detections_scrollbar_h.set)
+        self.detections_tree.configure(xscrollcommand=detections_scrollbar_h.set)
+        self.setup_virtual_tree(self.detections_tree, detections_scrollbar_v)
         
         # Pack
         self.detections_tree.pack(side='left', fill='both', expand=True, padx=5, pady=5)
@@ -161,9 +400,10 @@ class SurveillanceDataViewer:
                 self.logs_tree.column(col, width=150)
         
         # Scrollbars
-        logs_scrollbar_v = ttk.Scrollbar(logs_frame, orient='vertical', command=self.logs_tree.yview)
+        logs_scrollbar_v = ttk.Scrollbar(logs_frame, orient='vertical')
         logs_scrollbar_h = ttk.Scrollbar(logs_frame, orient='horizontal', command=self.logs_tree.xview)
-        self.logs_tree.configure(yscrollcommand=logs_scrollbar_v.set, xscrollcommand=logs_scrollbar_h.set)
+        self.logs_tree.configure(xscrollcommand=logs_scrollbar_h.set)
+        self.setup_virtual_tree(self.logs_tree, logs_scrollbar_v)
         
         # Pack
         self.logs_tree.pack(side='left', fill='both', expand=True, padx=5, pady=5)
@@ -191,262 +431,377 @@ class SurveillanceDataViewer:
         self.stats_text.pack(side='left', fill='both', expand=True, padx=5, pady=5)
         stats_scrollbar.pack(side='right', fill='y')
     
+    def setup_virtual_tree(self, tree, scrollbar):
+        """Drive a treeview's vertical scrolling from a backing row list
+        
+        Only the rows that fit in the viewport are inserted into the widget;
+        scrolling re-renders that window from the backing list.
+        """
+        self.virtual_views[tree] = {'rows': [], 'first': 0, 'scrollbar': scrollbar,
+                                    'fetch_more': None}
+        scrollbar.configure(command=lambda *args: self.on_virtual_scroll(tree, *args))
+        tree.bind('<MouseWheel>', lambda e: self.scroll_virtual_tree(tree, -3 if e.delta > 0 else 3))
+        tree.bind('<Button-4>', lambda e: self.scroll_virtual_tree(tree, -3))
+        tree.bind('<Button-5>', lambda e: self.scroll_virtual_tree(tree, 3))
+        tree.bind('<Configure>', lambda e: self.render_virtual_tree(tree))
+    
+    def set_virtual_rows(self, tree, rows, fetch_more=None):
+        """Replace a virtualized treeview's rows and show the top of the list
+        
+        fetch_more, if given, appends the next page to the backing list and
+        returns False once there is nothing left to load.
+        """
+        view = self.virtual_views[tree]
+        view['rows'] = rows
+        view['first'] = 0
+        view['fetch_more'] = fetch_more
+        self.render_virtual_tree(tree)
+    
+    def visible_row_count(self, tree):
+        """Number of rows that fit in the treeview's current height"""
+        return max(1, tree.winfo_height() // self.row_height)
+    
+    def render_virtual_tree(self, tree):
+        """Insert only the rows currently inside the viewport"""
+        view = self.virtual_views[tree]
+        rows = view['rows']
+        visible = self.visible_row_count(tree)
+        
+        # Page in more rows once the window gets within a screen of the end
+        while view['fetch_more'] and view['first'] + 2 * visible > len(rows):
+            if not view['fetch_more']():
+                view['fetch_more'] = None
+        
+        first = max(0, min(view['first'], len(rows) - visible))
+        last = min(first + visible, len(rows))
+        view['first'] = first
+        
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        for index in range(first, last):
+            tree.insert('', 'end', iid=str(index), values=rows[index])
+        
+        if rows:
+            view['scrollbar'].set(first / len(rows), last / len(rows))
+        else:
+            view['scrollbar'].set(0.0, 1.0)
+    
+    def on_virtual_scroll(self, tree, action, amount, unit=None):
+        """Scrollbar command for a virtualized treeview"""
+        view = self.virtual_views[tree]
+        if action == 'moveto':
+            view['first'] = int(float(amount) * len(view['rows']))
+            self.render_virtual_tree(tree)
+        else:
+            step = int(amount)
+            if unit == 'pages':
+                step *= self.visible_row_count(tree)
+            self.scroll_virtual_tree(tree, step)
+    
+    def scroll_virtual_tree(self, tree, step):
+        """Move a virtualized treeview's window by step rows"""
+        self.virtual_views[tree]['first'] += step
+        self.render_virtual_tree(tree)
+        return 'break'
+    
+    def extend_virtual_rows(self, tree, rows):
+        """Append rows to a virtualized treeview, re-rendering only if they show"""
+        view = self.virtual_views[tree]
+        shown = view['first'] + self.visible_row_count(tree)
+        needs_render = len(view['rows']) < shown
+        view['rows'].extend(rows)
+        if needs_render:
+            self.render_virtual_tree(tree)
+        else:
+            total = len(view['rows'])
+            view['scrollbar'].set(view['first'] / total, min(shown, total) / total)
+    
     def load_data(self):
-        """Load all data from database"""
-        self.load_users_data()
-        self.load_sessions_data()
-        self.load_detections_data()
-        self.load_logs_data()
-        self.load_statistics_data()
-    
-    def load_users_data(self):
-        """Load users data"""
-        # Clear existing data
-        for item in self.users_tree.get_children():
-            self.users_tree.delete(item)
+        """Refresh the visible tab; other changed tabs reload when shown"""
+        if self.loading:
+            # Re-run once the current load finishes
+            self.refresh_pending = True
+            return
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # data_version only moves when another connection commits, so an
+        # unchanged value means no table can have changed
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self.data_version:
+            self.load_visible_tab()
+            return
+        self.data_version = data_version
         
-        cursor.execute("""
-            SELECT u.id, u.email, u.created_at, u.last_login,
-                   COUNT(DISTINCT s.id) as session_count,
-                   COUNT(DISTINCT d.id) as detection_count
-            FROM users u
-            LEFT JOIN sessions s ON u.id = s.user_id
-            LEFT JOIN detections d ON u.id = d.user_id
-            GROUP BY u.id, u.email, u.created_at, u.last_login
-            ORDER BY u.created_at DESC
-        """)
-        
-        for row in cursor.fetchall():
-            user_id, email, created_at, last_login, session_count, detection_count = row
-            
-            # Format dates
-            created_formatted = self.format_datetime(created_at) if created_at else "N/A"
-            last_login_formatted = self.format_datetime(last_login) if last_login else "Never"
+        self.loading = True
+        threading.Thread(target=self.fetch_fingerprints, daemon=True).start()
+        self.root.after(5, self.drain_queue)
+    
+    def apply_fingerprints(self, fingerprints):
+        """Mark the tabs fed by changed tables stale"""
+        # Skip tabs whose tables haven't changed since the last refresh
+        for name, fp in fingerprints.items():
+            if self.fingerprints.get(name) != fp:
+                self.stale_tabs |= TABLE_TABS[name]
+        self.fingerprints = fingerprints
+    
+    def load_visible_tab(self):
+        """Load the selected tab if it's stale, without blocking the UI thread"""
+        if self.loading:
+            return
+        tab = TABS[self.notebook.index(self.notebook.select())]
+        if tab not in self.stale_tabs:
+            return
+        self.stale_tabs.discard(tab)
+        
+        # Detections and logs page in on demand from the viewport
+        if tab == 'detections':
+            self.load_detections_data()
+        elif tab == 'logs':
+            self.load_logs_data()
+        else:
+            self.loading = True
+            threading.Thread(target=self.fetch_all, args=(tab,), daemon=True).start()
+            self.root.after(5, self.drain_queue)
+    
+    def fetch_fingerprints(self):
+        """Worker thread: read each table's change fingerprint for the UI"""
+        conn = self.open_connection()
+        try:
+            row = conn.execute(FINGERPRINT_SQL).fetchone()
+            self.row_q.put(('fingerprints', {
+                'users': row[0:3], 'sessions': row[3:6],
+                'detections': row[6:9], 'logs': row[9:11]}))
+        except sqlite3.Error as e:
+            self.row_q.put(('error', e))
+        finally:
+            conn.close()
+            self.row_q.put(('done',))
+    
+    def fetch_all(self, tab):
+        """Worker thread: run one tab's queries and queue results for the UI"""
+        conn = self.open_connection()
+        try:
+            if tab == 'stats':
+                # One read transaction so the statistics share a snapshot
+                conn.execute("BEGIN")
+                self.row_q.put(('stats', self.fetch_statistics(conn)))
+                conn.execute("COMMIT")
+            else:
+                tree, chunks = {
+                    'users': (self.users_tree, self.fetch_users_rows(conn)),
+                    'sessions': (self.sessions_tree, self.fetch_sessions_rows(conn)),
+                }[tab]
+                self.row_q.put(('reset', tree))
+                for chunk in chunks:
+                    self.row_q.put(('rows', tree, chunk))
+        except sqlite3.Error as e:
+            self.row_q.put(('error', e))
+        finally:
+            conn.close()
+            self.row_q.put(('done',))
+    
+    def drain_queue(self):
+        """Apply queued query results to the widgets a few items per tick"""
+        for _ in range(20):
+            try:
+                item = self.row_q.get_nowait()
+            except queue.Empty:
+                break
             
-            self.users_tree.insert('', 'end', values=(
-                user_id, email, created_formatted, last_login_formatted, session_count, detection_count
-            ))
-        
-        conn.close()
+            kind = item[0]
+            if kind == 'reset':
+                self.set_virtual_rows(item[1], [])
+            elif kind == 'rows':
+                self.extend_virtual_rows(item[1], item[2])
+            elif kind == 'stats':
+                self.show_statistics(item[1])
+            elif kind == 'fingerprints':
+                self.apply_fingerprints(item[1])
+            elif kind == 'error':
+                # Forget the fingerprints so the next refresh retries everything
+                self.fingerprints = {}
+                self.data_version = None
+                messagebox.showerror("Error", f"Failed to load data: {item[1]}")
+            elif kind == 'done':
+                self.loading = False
+                if self.refresh_pending:
+                    self.refresh_pending = False
+                    self.load_data()
+                else:
+                    # The user may have switched tabs while this one loaded
+                    self.load_visible_tab()
+                return
+        
+        self.root.after(5, self.drain_queue)
     
-    def load_sessions_data(self):
-        """Load sessions data"""
-        # Clear existing data
-        for item in self.sessions_tree.get_children():
-            self.sessions_tree.delete(item)
-        
-        conn = sqlite3.connect(self.db_path)
+    def fetch_users_rows(self, conn):
+        """Yield formatted users rows in chunks"""
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT s.id, u.email, s.login_time, s.logout_time, s.duration_minutes,
-                   COUNT(d.id) as detection_count
-            FROM sessions s
-            JOIN users u ON s.user_id = u.id
-            LEFT JOIN detections d ON s.id = d.session_id
-            GROUP BY s.id, u.email, s.login_time, s.logout_time, s.duration_minutes
-            ORDER BY s.login_time DESC
-        """)
-        
-        for row in cursor.fetchall():
-            session_id, email, login_time, logout_time, duration, detection_count = row
-            
-            # Format data
-            login_formatted = self.format_datetime(login_time) if login_time else "N/A"
-            logout_formatted = self.format_datetime(logout_time) if logout_time else "Active"
-            duration_formatted = f"{duration:.1f}" if duration else "Active"
-            
-            self.sessions_tree.insert('', 'end', values=(
-                session_id, email, login_formatted, logout_formatted, duration_formatted, detection_count
-            ))
+        cursor.execute(USERS_SQL if self.has_user_counts else USERS_AGGREGATE_SQL)
         
-        conn.close()
+        # Rows come back display-ready from SQL
+        while True:
+            rows = cursor.fetchmany(200)
+            if not rows:
+                break
+            yield rows
     
-    def load_detections_data(self):
-        """Load detections data"""
-        # Clear existing data
-        for item in self.detections_tree.get_children():
-            self.detections_tree.delete(item)
-        
-        conn = sqlite3.connect(self.db_path)
+    def fetch_sessions_rows(self, conn):
+        """Yield formatted sessions rows in chunks"""
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT d.id, u.email, d.detection_type, d.confidence, d.timestamp, 
-                   d.description, d.email_sent
-            FROM detections d
-            JOIN users u ON d.user_id = u.id
-            ORDER BY d.timestamp DESC
-        """)
-        
-        for row in cursor.fetchall():
-            det_id, email, det_type, confidence, timestamp, description, email_sent = row
-            
-            # Format data
-            timestamp_formatted = self.format_datetime(timestamp) if timestamp else "N/A"
-            confidence_formatted = f"{confidence:.2f}" if confidence else "N/A"
-            email_status = "✅ Yes" if email_sent else "❌ No"
-            
-            self.detections_tree.insert('', 'end', values=(
-                det_id, email, det_type, confidence_formatted, timestamp_formatted, 
-                description, email_status
-            ))
+        cursor.execute(SESSIONS_SQL)
         
-        conn.close()
+        # Rows come back display-ready from SQL
+        while True:
+            rows = cursor.fetchmany(200)
+            if not rows:
+                break
+            yield rows
+    
+    def load_detections_data(self):
+        """Load detections data"""
+        self.detections_cursor = None
+        self.set_virtual_rows(self.detections_tree, [], fetch_more=self.fetch_detections_page)
+    
+    def fetch_detections_page(self):
+        """Append the next page of detections; return False when exhausted"""
+        cursor = self.conn.cursor()
+        if self.detections_cursor is None:
+            cursor.execute(DETECTIONS_SQL, (PAGE_SIZE,))
+        else:
+            cursor.execute(DETECTIONS_PAGE_SQL, (*self.detections_cursor, PAGE_SIZE))
+        rows = cursor.fetchall()
+        
+        # Drop the trailing raw timestamp used only for pagination
+        self.virtual_views[self.detections_tree]['rows'].extend(row[:-1] for row in rows)
+        
+        if rows:
+            self.detections_cursor = (rows[-1][-1], rows[-1][0])
+        return len(rows) == PAGE_SIZE
     
     def load_logs_data(self):
         """Load system logs data"""
-        # Clear existing data
-        for item in self.logs_tree.get_children():
-            self.logs_tree.delete(item)
-        
-        conn = sqlite3.connect(self.db_path)
+        self.logs_cursor = None
+        self.set_virtual_rows(self.logs_tree, [], fetch_more=self.fetch_logs_page)
+    
+    def fetch_logs_page(self):
+        """Append the next page of system logs; return False when exhausted"""
+        cursor = self.conn.cursor()
+        if self.logs_cursor is None:
+            cursor.execute(LOGS_SQL, (PAGE_SIZE,))
+        else:
+            cursor.execute(LOGS_PAGE_SQL, (*self.logs_cursor, PAGE_SIZE))
+        rows = cursor.fetchall()
+        
+        # Drop the trailing raw timestamp used only for pagination
+        self.virtual_views[self.logs_tree]['rows'].extend(row[:-1] for row in rows)
+        
+        if rows:
+            self.logs_cursor = (rows[-1][-1], rows[-1][0])
+        return len(rows) == PAGE_SIZE
+    
+    def fetch_statistics(self, conn):
+        """Run the statistics queries; returns (scalars, breakdown, top users)"""
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT l.id, u.email, l.action, l.details, l.timestamp
-            FROM system_logs l
-            JOIN users u ON l.user_id = u.id
-            ORDER BY l.timestamp DESC
-            LIMIT 1000
-        """)
+        # All scalar statistics in a single statement
+        cursor.execute(STATS_SQL)
+        scalars = cursor.fetchone()
         
-        for row in cursor.fetchall():
-            log_id, email, action, details, timestamp = row
-            
-            # Format timestamp
-            timestamp_formatted = self.format_datetime(timestamp) if timestamp else "N/A"
-            
-            self.logs_tree.insert('', 'end', values=(
-                log_id, email, action, details or "", timestamp_formatted
-            ))
+        # Database size straight from the pager instead of a pragma join
+        if self.page_size is None:
+            self.page_size = cursor.execute("PRAGMA page_size").fetchone()[0]
+        page_count = cursor.execute("PRAGMA page_count").fetchone()[0]
+        scalars += (page_count * self.page_size,)
+        
+        cursor.execute(BREAKDOWN_SQL)
+        breakdown = cursor.fetchall()
         
-        conn.close()
+        cursor.execute(TOP_USERS_SQL if self.has_user_counts else TOP_USERS_AGGREGATE_SQL)
+        top_users = cursor.fetchall()
+        
+        return scalars, breakdown, top_users
     
-    def load_statistics_data(self):
-        """Load and display statistics"""
-        self.stats_text.config(state='normal')
-        self.stats_text.delete(1.0, tk.END)
+    def show_statistics(self, stats):
+        """Render the statistics report"""
+        scalars, breakdown, top_users = stats
+        (total_users, total_sessions, active_sessions, total_detections, emails_sent,
+         recent_logins, recent_detections, last_activity, db_size_bytes) = scalars
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Build the whole report first; one Text insert instead of dozens
+        parts = []
         
         # Overall statistics
-        self.stats_text.insert(tk.END, "📊 SURVEILLANCE SYSTEM STATISTICS\n")
-        self.stats_text.insert(tk.END, "=" * 50 + "\n\n")
-        
-        # Total users
-        cursor.execute("SELECT COUNT(*) FROM users")
-        total_users = cursor.fetchone()[0]
-        self.stats_text.insert(tk.END, f"👤 Total Users: {total_users}\n")
-        
-        # Total sessions
-        cursor.execute("SELECT COUNT(*) FROM sessions")
-        total_sessions = cursor.fetchone()[0]
-        self.stats_text.insert(tk.END, f"🔐 Total Sessions: {total_sessions}\n")
-        
-        # Active sessions
-        cursor.execute("SELECT COUNT(*) FROM sessions WHERE logout_time IS NULL")
-        active_sessions = cursor.fetchone()[0]
-        self.stats_text.insert(tk.END, f"🟢 Active Sessions: {active_sessions}\n")
-        
-        # Total detections
-        cursor.execute("SELECT COUNT(*) FROM detections")
-        total_detections = cursor.fetchone()[0]
-        self.stats_text.insert(tk.END, f"🚨 Total Detections: {total_detections}\n")
-        
-        # Emails sent
-        cursor.execute("SELECT COUNT(*) FROM detections WHERE email_sent = 1")
-        emails_sent = cursor.fetchone()[0]
-        self.stats_text.insert(tk.END, f"📧 Emails Sent: {emails_sent}\n\n")
+        parts.append("📊 SURVEILLANCE SYSTEM STATISTICS\n")
+        parts.append("=" * 50 + "\n\n")
+        parts.append(f"👤 Total Users: {total_users}\n")
+        parts.append(f"🔐 Total Sessions: {total_sessions}\n")
+        parts.append(f"🟢 Active Sessions: {active_sessions}\n")
+        parts.append(f"🚨 Total Detections: {total_detections}\n")
+        parts.append(f"📧 Emails Sent: {emails_sent}\n\n")
         
         # Detection breakdown
-        self.stats_text.insert(tk.END, "🚨 THREAT DETECTION BREAKDOWN\n")
-        self.stats_text.insert(tk.END, "=" * 30 + "\n")
-        
-        cursor.execute("""
-            SELECT detection_type, COUNT(*) as count, AVG(confidence) as avg_confidence
-            FROM detections 
-            GROUP BY detection_type 
-            ORDER BY count DESC
-        """)
-        
-        for row in cursor.fetchall():
-            det_type, count, avg_conf = row
+        parts.append("🚨 THREAT DETECTION BREAKDOWN\n")
+        parts.append("=" * 30 + "\n")
+        
+        for det_type, count, avg_conf in breakdown:
             avg_conf_str = f"{avg_conf:.2f}" if avg_conf else "N/A"
-            self.stats_text.insert(tk.END, f"{det_type}: {count} (avg confidence: {avg_conf_str})\n")
+            parts.append(f"{det_type}: {count} (avg confidence: {avg_conf_str})\n")
         
         # Recent activity
-        self.stats_text.insert(tk.END, "\n📅 RECENT ACTIVITY (Last 24 hours)\n")
-        self.stats_text.insert(tk.END, "=" * 35 + "\n")
-        
-        # Recent logins
-        cursor.execute("""
-            SELECT COUNT(*) FROM sessions 
-            WHERE login_time >= datetime('now', '-1 day')
-        """)
-        recent_logins = cursor.fetchone()[0]
-        self.stats_text.insert(tk.END, f"Recent Logins: {recent_logins}\n")
-        
-        # Recent detections
-        cursor.execute("""
-            SELECT COUNT(*) FROM detections 
-            WHERE timestamp >= datetime('now', '-1 day')
-        """)
-        recent_detections = cursor.fetchone()[0]
-        self.stats_text.insert(tk.END, f"Recent Detections: {recent_detections}\n")
+        parts.append("\n📅 RECENT ACTIVITY (Last 24 hours)\n")
+        parts.append("=" * 35 + "\n")
+        parts.append(f"Recent Logins: {recent_logins}\n")
+        parts.append(f"Recent Detections: {recent_detections}\n")
         
         # Top users by activity
-        self.stats_text.insert(tk.END, "\n👑 TOP USERS BY ACTIVITY\n")
-        self.stats_text.insert(tk.END, "=" * 25 + "\n")
-        
-        cursor.execute("""
-            SELECT u.email, COUNT(DISTINCT s.id) as sessions, COUNT(DISTINCT d.id) as detections
-            FROM users u
-            LEFT JOIN sessions s ON u.id = s.user_id
-            LEFT JOIN detections d ON u.id = d.user_id
-            GROUP BY u.id, u.email
-            ORDER BY sessions DESC, detections DESC
-            LIMIT 5
-        """)
-        
-        for i, row in enumerate(cursor.fetchall(), 1):
-            email, sessions, detections = row
-            self.stats_text.insert(tk.END, f"{i}. {email}: {sessions} sessions, {detections} detections\n")
+        parts.append("\n👑 TOP USERS BY ACTIVITY\n")
+        parts.append("=" * 25 + "\n")
+        
+        for i, (email, sessions, detections) in enumerate(top_users, 1):
+            parts.append(f"{i}. {email}: {sessions} sessions, {detections} detections\n")
         
         # System health
-        self.stats_text.insert(tk.END, "\n💚 SYSTEM HEALTH\n")
-        self.stats_text.insert(tk.END, "=" * 15 + "\n")
+        parts.append("\n💚 SYSTEM HEALTH\n")
+        parts.append("=" * 15 + "\n")
         
-        # Database size
-        cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-        db_size = cursor.fetchone()[0] / (1024 * 1024)  # Convert to MB
-        self.stats_text.insert(tk.END, f"Database Size: {db_size:.2f} MB\n")
+        db_size = db_size_bytes / (1024 * 1024)  # Convert to MB
+        parts.append(f"Database Size: {db_size:.2f} MB\n")
         
-        # Last activity
-        cursor.execute("SELECT MAX(timestamp) FROM system_logs")
-        last_activity = cursor.fetchone()[0]
         if last_activity:
             last_activity_formatted = self.format_datetime(last_activity)
-            self.stats_text.insert(tk.END, f"Last Activity: {last_activity_formatted}\n")
+            parts.append(f"Last Activity: {last_activity_formatted}\n")
         
-        conn.close()
-        self.stats_text.config(state='disabled')
+        # Word wrap is off while the text is swapped so Tk re-flows it only once
+        self.stats_text.config(state='normal', wrap='none')
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, ''.join(parts))
+        self.stats_text.config(state='disabled', wrap=tk.WORD)
     
-    def format_datetime(self, dt_string):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def format_datetime(dt_string):
         """Format datetime string for display"""
+        # SQLite's CURRENT_TIMESTAMP is already in display form
+        if (isinstance(dt_string, str) and len(dt_string) == 19
+                and dt_string[4] == '-' and dt_string[10] == ' '):
+            return dt_string
         try:
-            dt = datetime.datetime.fromisoformat(dt_string.replace('Z', '+00:00'))
+            if dt_string.endswith('Z'):
+                dt_string = dt_string[:-1] + '+00:00'
+            dt = datetime.datetime.fromisoformat(dt_string)
             return dt.strftime('%Y-%m-%d %H:%M:%S')
         except Exception:
             return dt_string if dt_string else "N/A"
     
     def run(self):
         """Run the data viewer"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.conn.close()
 
 def main():
     """Main function"""
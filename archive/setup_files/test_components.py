@@ -2,6 +2,7 @@
 Simple test script to verify GUI components work
 """
 
+import importlib.util
 import tkinter as tk
 from tkinter import messagebox
 import sys
@@ -59,17 +60,11 @@ def test_other_packages():
     
     results = {}
     for package, name in packages.items():
-        try:
-            if package == 'PIL':
-                from PIL import Image
-            elif package == 'ultralytics':
-                from ultralytics import YOLO
-            elif package == 'fer':
-                from fer import FER
-            
+        # find_spec only locates the package, so torch/tensorflow never load
+        if importlib.util.find_spec(package) is not None:
             print(f"✅ {name} available")
             results[package] = True
-        except ImportError:
+        else:
             print(f"❌ {name} not available")
             results[package] = False
     
@@ -6,23 +6,28 @@ ALL FEATURES IN ONE SYSTEM
 """
 
 import cv2
+import numpy as np
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, simpledialog, ttk
 import threading
 import queue
 import time
 import datetime
+import functools
 import json
 import sqlite3
 import hashlib
 import smtplib
 from pathlib import Path
-from PIL import Image, ImageTk
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.image import MIMEImage
+from email.message import EmailMessage
+import io
 import os
+import wave
+import shutil
 import concurrent.futures
+import contextlib
+import inspect
+from collections import deque
 
 # Optional torch import to prefer GPU when available
 try:
@@ -38,18 +43,406 @@ try:
 except ImportError:
     YOLO_AVAILABLE = False
 
+# Optional OpenVINO runtime for INT8 YOLO inference on CPU-only machines
+try:
+    import openvino  # noqa: F401 - used through Ultralytics' OpenVINO backend
+    OPENVINO_AVAILABLE = True
+except ImportError:
+    OPENVINO_AVAILABLE = False
+
+# Optional ONNX Runtime: prepacks conv weights once per session on CPU
+try:
+    import onnxruntime  # noqa: F401 - used through Ultralytics' ONNX backend
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
 try:
     from fer import FER
     FER_AVAILABLE = True
 except ImportError:
     FER_AVAILABLE = False
 
+# Optional libjpeg-turbo bindings for faster alert snapshots
+try:
+    from turbojpeg import TurboJPEG
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+ALERT_JPEG_QUALITY = 80
+ALERT_MAX_WIDTH = 1280  # Larger alert frames are downscaled before encoding
+
+# Alert email body; only the per-alert fields are substituted
+ALERT_EMAIL_TEMPLATE = """
+🛡️ SMART SURVEILLANCE SYSTEM - SECURITY ALERT
+
+⚠️ ALERT TYPE: {alert_type}
+⏰ TIME: {timestamp}
+👤 USER: {user}
+🔍 DETECTION ID: {detection_ids}
+
+📋 ALERT DETAILS:
+{message}
+
+📊 DETECTION SUMMARY:
+{summary}
+🚨 RECOMMENDED ACTIONS:
+✓ Check surveillance feed immediately
+✓ Verify threat level in monitored area
+✓ Contact security if necessary
+✓ Review recorded evidence
+
+📧 This alert was automatically sent to: {user}
+🤖 Generated by: Complete Smart Surveillance System
+"""
+
 try:
     import winsound
     SOUND_AVAILABLE = True
 except ImportError:
     SOUND_AVAILABLE = False
 
+# Models may load on several threads at once; torch.load stays patched until
+# the last mmap_weights() block exits
+TORCH_LOAD_MMAP = TORCH_AVAILABLE and 'mmap' in inspect.signature(torch.load).parameters
+_mmap_lock = threading.Lock()
+_mmap_users = 0
+_original_torch_load = None
+
+@contextlib.contextmanager
+def mmap_weights():
+    """Make torch.load memory-map checkpoint files while models are loading.
+    Pages are read on demand instead of the whole file being copied into RAM
+    first (PyTorch >= 2.1). Checkpoints that cannot be mapped load normally.
+    """
+    global _mmap_users, _original_torch_load
+    if not TORCH_LOAD_MMAP:
+        yield
+        return
+    
+    with _mmap_lock:
+        if _mmap_users == 0:
+            original_load = _original_torch_load = torch.load
+            
+            def load(f, *args, **kwargs):
+                if isinstance(f, (str, os.PathLike)) and 'mmap' not in kwargs:
+                    try:
+                        return original_load(f, *args, mmap=True, **kwargs)
+                    except RuntimeError:
+                        pass  # Legacy (non-zip) checkpoint
+                return original_load(f, *args, **kwargs)
+            
+            torch.load = load
+        _mmap_users += 1
+    try:
+        yield
+    finally:
+        with _mmap_lock:
+            _mmap_users -= 1
+            if _mmap_users == 0:
+                torch.load = _original_torch_load
+
+# Weapon model class ids -> display names (only these classes count as weapons)
+WEAPON_NAMES = {0: "KNIFE", 1: "GUN", 2: "SWORD", 3: "PISTOL", 4: "RIFLE"}
+
+# Face box colour per dominant emotion (BGR); anything else is drawn neutral blue
+EMOTION_COLORS = {
+    'angry': (0, 0, 255), 'fear': (0, 0, 255), 'disgust': (0, 0, 255),  # Red for negative emotions
+    'happy': (0, 255, 0), 'surprise': (0, 255, 0),                      # Green for positive emotions
+}
+NEUTRAL_EMOTION_COLOR = (255, 0, 0)
+
+def summary_style(results):
+    """(status text, banner colour) for the on-frame detection summary"""
+    if results['weapons']:
+        return "CRITICAL WEAPON THREAT", (0, 0, 255)
+    if len(results['people']) >= 5:
+        return "CROWD DETECTED", (0, 165, 255)
+    return "MONITORING ACTIVE", (0, 128, 0)
+
+# Tk video panel size
+DISPLAY_SIZE = (800, 600)
+
+# Alert beep patterns: (frequency Hz, beep ms, gap ms, count)
+BEEP_PATTERNS = {
+    'weapon': (1500, 200, 100, 5),    # CRITICAL - 5 rapid high-pitched beeps
+    'crowd': (1000, 300, 200, 3),     # HIGH - 3 medium beeps
+    'behavior': (800, 400, 300, 2),   # MEDIUM - 2 warning beeps
+    'test': (1000, 100, 0, 1),
+}
+
+def build_beep_wav(freq, beep_ms, gap_ms, count, rate=22050):
+    """Render a whole beep pattern as one in-memory 16-bit mono WAV"""
+    t = np.arange(int(rate * beep_ms / 1000)) / rate
+    tone = np.sin(2 * np.pi * freq * t)
+    # 5 ms fade in/out so beeps do not click
+    fade = min(len(tone) // 2, int(rate * 0.005))
+    if fade:
+        ramp = np.linspace(0.0, 1.0, fade)
+        tone[:fade] *= ramp
+        tone[-fade:] *= ramp[::-1]
+    tone = (tone * 0.6 * 32767).astype('<i2')
+    gap = np.zeros(int(rate * gap_ms / 1000), dtype='<i2')
+    pcm = np.concatenate([np.concatenate([tone, gap]) for _ in range(count)])
+    
+    buf = io.BytesIO()
+    with wave.open(buf, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm.tobytes())
+    return buf.getvalue()
+
+# Prepared model exports (INT8 OpenVINO IR, ONNX, TorchScript), keyed by weights content
+MODEL_CACHE_DIR = Path.home() / '.cache' / 'surveillance'
+
+def weights_digest(path):
+    """Short SHA-256 of a weights file, so retrained weights never hit a stale export"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+# One export at a time: two loaders may ask for the same file, and Ultralytics
+# writes exports next to the weights
+_export_lock = threading.Lock()
+
+def cached_export(path, fmt, suffix, **export_args):
+    """Return the cached export of a .pt model, making it on first use"""
+    target = MODEL_CACHE_DIR / f"{Path(path).stem}-{weights_digest(path)}{suffix}"
+    if target.exists():
+        return target
+    with _export_lock:
+        if not target.exists():
+            print(f"⚙️ Preparing {fmt} model for {path} (one-time)...")
+            with mmap_weights():
+                source = YOLO(path)
+            # Ultralytics writes the export next to the weights; move it into the cache
+            exported = Path(source.export(format=fmt, **export_args))
+            MODEL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(exported), str(target))
+    return target
+
+def load_yolo(path):
+    """Load a YOLO model from its prepared export in MODEL_CACHE_DIR.
+    Without a GPU an INT8 OpenVINO export is preferred, then ONNX Runtime, whose
+    session packs the conv weights once at load instead of on every call. On
+    GPU (or when neither runtime is installed) a TorchScript trace is used, which
+    skips building and fusing the PyTorch modules on every launch.
+    Falls back to the plain .pt model. Returns (model, is_int8).
+    """
+    cuda = TORCH_AVAILABLE and torch.cuda.is_available()
+    if OPENVINO_AVAILABLE and not cuda:
+        try:
+            # Post-training quantization calibrated on the small coco8 set
+            ov_dir = cached_export(path, 'openvino', '_int8_openvino_model', int8=True, data='coco8.yaml')
+            return YOLO(str(ov_dir), task='detect'), True
+        except Exception as e:
+            print(f"⚠️ INT8 export/load failed for {path}, using FP32: {e}")
+    
+    if ONNXRUNTIME_AVAILABLE and not cuda:
+        try:
+            onnx_path = cached_export(path, 'onnx', '.onnx', imgsz=640, opset=17, simplify=True)
+            return YOLO(str(onnx_path), task='detect'), False
+        except Exception as e:
+            print(f"⚠️ ONNX export/load failed for {path}: {e}")
+    
+    if TORCH_AVAILABLE:
+        try:
+            # Traced on the device it will run on; the trace fixes device placement
+            device = 'cuda' if cuda else 'cpu'
+            script = cached_export(path, 'torchscript', f'-{device}.torchscript',
+                                   imgsz=640, device=0 if cuda else 'cpu')
+            return YOLO(str(script), task='detect'), False
+        except Exception as e:
+            print(f"⚠️ TorchScript export/load failed for {path}, using .pt: {e}")
+    
+    with mmap_weights():
+        model = YOLO(path)
+    # Inference only: set eval mode and drop autograd bookkeeping once here
+    # instead of relying on every predict call
+    try:
+        model.model.eval()
+        model.model.requires_grad_(False)
+    except Exception:
+        pass
+    return model, False
+
+# Hershey Simplex digits all have the same advance, so a label's width only
+# depends on its text with every digit replaced by '0'
+_DIGITS_TO_ZERO = str.maketrans('123456789', '000000000')
+
+@functools.lru_cache(maxsize=256)
+def _label_shape_width(shape, scale, thickness):
+    return cv2.getTextSize(shape, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0][0]
+
+def label_width(label, scale, thickness):
+    """Pixel width of a FONT_HERSHEY_SIMPLEX label, measured once per label format"""
+    return _label_shape_width(label.translate(_DIGITS_TO_ZERO), scale, thickness)
+
+def rect_polys(x1, y1, x2, y2):
+    """Corner polygons (N, 4, 2) for N axis-aligned rectangles, for one
+    cv2.polylines call covering all of them"""
+    return np.stack([np.stack([x1, y1], -1), np.stack([x2, y1], -1),
+                     np.stack([x2, y2], -1), np.stack([x1, y2], -1)], axis=1).astype(np.int32)
+
+def fill_plates(frame, outer, inner):
+    """Fill each label plate (black outer, white inner) with its own call.
+    A single fillPoly over all plates uses the even-odd rule, so wherever two
+    plates overlap - the usual case for persisted boxes - the overlap would
+    be left unpainted."""
+    for (ox1, oy1, ox2, oy2), (ix1, iy1, ix2, iy2) in zip(outer.tolist(), inner.tolist()):
+        cv2.rectangle(frame, (ox1, oy1), (ox2, oy2), (0, 0, 0), -1)
+        cv2.rectangle(frame, (ix1, iy1), (ix2, iy2), (255, 255, 255), -1)
+
+def render_stamp(draw, size, origin=(0, 0)):
+    """Render draw(img, color) once into a read-only stamp: (pixels, mask, (x, y)),
+    cropped to what was drawn, with (x, y) relative to origin. draw passes every
+    BGR colour through color() so the same calls also paint the coverage mask."""
+    canvas = np.zeros((*size, 3), np.uint8)
+    mask = np.zeros(size, np.uint8)
+    draw(canvas, lambda bgr: bgr)
+    draw(mask, lambda bgr: 255)
+    ys, xs = np.nonzero(mask)
+    y0, y1, x0, x1 = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+    pixels, mask = canvas[y0:y1, x0:x1], mask[y0:y1, x0:x1, None].astype(bool)
+    pixels.setflags(write=False)
+    mask.setflags(write=False)
+    return pixels, mask, (int(x0) - origin[0], int(y0) - origin[1])
+
+def paste_stamp(frame, stamp, x, y):
+    """Copy a render_stamp() stamp into frame at (x, y) + its offset, clipped to the frame"""
+    pixels, mask, (dx, dy) = stamp
+    x, y = x + dx, y + dy
+    h, w = pixels.shape[:2]
+    fx0, fy0 = max(x, 0), max(y, 0)
+    fx1, fy1 = min(x + w, frame.shape[1]), min(y + h, frame.shape[0])
+    if fx0 < fx1 and fy0 < fy1:
+        np.copyto(frame[fy0:fy1, fx0:fx1], pixels[fy0-y:fy1-y, fx0-x:fx1-x],
+                  where=mask[fy0-y:fy1-y, fx0-x:fx1-x])
+
+@functools.lru_cache(maxsize=8)
+def summary_banner(bg_color):
+    """Summary banner (black frame, coloured panel, white border), rendered once per colour"""
+    def draw(img, color):
+        cv2.rectangle(img, (5, 5), (600, 50), color((0, 0, 0)), -1)
+        cv2.rectangle(img, (7, 7), (598, 48), color(bg_color), -1)
+        cv2.rectangle(img, (5, 5), (600, 50), color((255, 255, 255)), 3)
+    return render_stamp(draw, (60, 610))
+
+@functools.lru_cache(maxsize=1)
+def weapon_badge():
+    """Red "!" badge drawn beside weapon labels, positioned by its circle centre"""
+    def draw(img, color):
+        cv2.circle(img, (20, 20), 8, color((0, 0, 255)), -1)
+        cv2.putText(img, "!", (15, 25), cv2.FONT_HERSHEY_SIMPLEX, 0.8, color((255, 255, 255)), 2)
+    return render_stamp(draw, (40, 40), origin=(20, 20))
+
+class SMTPConnectionPool:
+    """Logged-in SMTP connections kept open and reused across alert emails.
+    
+    One pool serves one (host, port, user). checkout() hands out an idle
+    connection that still answers NOOP, or connects + STARTTLS + logs in a new
+    one; login errors propagate to the caller. Connections are retired after
+    max_messages sends or max_idle seconds unused.
+    """
+    
+    def __init__(self, host, port, user, password, size=2, max_messages=100, max_idle=60):
+        self.key = (host, port, user)
+        self.password = password
+        self.max_messages = max_messages
+        self.max_idle = max_idle
+        self._idle = queue.LifoQueue(maxsize=size)  # (server, last_used, messages_sent)
+        self._closed = False
+        # Background reaper closes connections Gmail would drop anyway
+        self._reaper = threading.Thread(target=self._reap_idle, daemon=True)
+        self._reaper.start()
+    
+    def _connect(self):
+        host, port, user = self.key
+        server = smtplib.SMTP(host, port, timeout=30)
+        try:
+            server.starttls()
+            server.login(user, self.password)
+        except Exception:
+            self._quit(server)
+            raise
+        return server
+    
+    @staticmethod
+    def _quit(server):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+    
+    @contextlib.contextmanager
+    def checkout(self):
+        """Borrow a healthy connection for the duration of a with-block"""
+        server = None
+        while server is None:
+            try:
+                server, _, sent = self._idle.get_nowait()
+            except queue.Empty:
+                server, sent = self._connect(), 0
+                break
+            try:
+                if server.noop()[0] != 250:
+                    raise smtplib.SMTPServerDisconnected("NOOP failed")
+            except Exception:
+                self._quit(server)
+                server = None
+        
+        try:
+            yield server
+        except Exception:
+            # State of the session is unknown after a failed send; don't reuse it
+            self._quit(server)
+            raise
+        self._checkin(server, sent + 1)
+    
+    def _checkin(self, server, sent):
+        if self._closed or sent >= self.max_messages:
+            self._quit(server)
+            return
+        try:
+            self._idle.put_nowait((server, time.time(), sent))
+        except queue.Full:
+            self._quit(server)
+    
+    def _reap_idle(self):
+        while not self._closed:
+            time.sleep(15)
+            keep = []
+            while True:
+                try:
+                    entry = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if time.time() - entry[1] > self.max_idle:
+                    self._quit(entry[0])
+                else:
+                    keep.append(entry)
+            for entry in reversed(keep):
+                try:
+                    self._idle.put_nowait(entry)
+                except queue.Full:
+                    self._quit(entry[0])
+    
+    def close(self):
+        """Quit every idle connection; connections in use are closed on checkin"""
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait()[0])
+            except queue.Empty:
+                break
+
 class DatabaseManager:
     """Manages user authentication and data logging"""
     
@@ -175,6 +568,20 @@ class DatabaseManager:
         cursor.execute("UPDATE detections SET beep_played = TRUE WHERE id = ?", (detection_id,))
         conn.commit()
         conn.close()
+    
+    # Flag updates that can be queued for apply_flag_updates
+    FLAG_COLUMNS = {'mark_email_sent': 'email_sent', 'mark_beep_played': 'beep_played'}
+    
+    def apply_flag_updates(self, updates):
+        """Apply a batch of (FLAG_COLUMNS key, detection_id) updates in one transaction"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        try:
+            for op, detection_id in updates:
+                cursor.execute(f"UPDATE detections SET {self.FLAG_COLUMNS[op]} = TRUE WHERE id = ?", (detection_id,))
+            conn.commit()
+        finally:
+            conn.close()
 
 class AuthenticationWindow:
     """User authentication window with email login"""
@@ -359,8 +766,10 @@ class CompleteSurveillanceSystem:
             'smtp_port': 587,
             'sender_email': '',
             'sender_password': '',
-            'use_app_password': True 
+            'use_app_password': True,
+            'keep_evidence_on_disk': False  # Also archive alert snapshots in alerts/
         }
+        self._email_config_cache = None  # Parsed configs/email_config.json, shared by both loaders
         self.load_email_config()
 
         # Try to auto-configure email if config file exists
@@ -374,6 +783,7 @@ class CompleteSurveillanceSystem:
             self.email_config['sender_email'] = env_sender
         if env_pass:
             self.email_config['sender_password'] = env_pass
+        self._resolve_smtp_credentials()
 
         # If we have a sender email configured (env or config), enable email alerts
         if self.email_config.get('sender_email'):
@@ -390,12 +800,73 @@ class CompleteSurveillanceSystem:
         
         # Threading
         self.video_thread = None
+        # Grabber thread keeps only the newest camera frame; video_loop takes it from here
+        self._grab_thread = None
+        self._frame_ready = threading.Condition()
+        self._latest_frame = None
+        self._frame_seq = 0
+        self._grab_ok = True
+        # Display pipeline: video_loop hands drawn frames to display_loop through a
+        # one-slot queue; only the finished image is passed to the Tk thread
+        self._display_q = queue.Queue(maxsize=1)
+        self._display_thread = None
+        self._display_stop = None  # Per-session stop event for display_loop
+        self._shown_version = -1
+        self._display_image = None
+        self._display_pending = False  # _display_image waits for the Tk tick
+        self.display_refresh_ms = 15
+        self._display_tick_id = None
+        self._display_error_logged = False
+        self._disp_bgr = None  # Resize/RGBA buffers reused for every displayed frame
+        self._disp_rgba = None
+        self._display_photo = None  # Tk image the frames are pasted into (Tk thread only)
+        self._Image = self._ImageTk = None  # PIL modules, imported when monitoring first starts
+        # Finished inference results as (generation, frame_id, results or exception),
+        # pushed by _on_infer_done and drained by video_loop
         self.detection_queue = queue.Queue()
+        # Bumped by stop_monitoring; results tagged with an older generation
+        # belong to a finished session and are dropped
+        self._infer_generation = 0
         # Executor for running inference off the capture/display thread
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.inference_future = None
+        # Two preallocated frames handed to the executor in turn; the slot being
+        # inferred on is never written until its future has been collected
+        self._frame_buffers = None
+        self._buf_idx = 0
+        # Letterboxed YOLO input shared by the weapon and crowd models; built
+        # once per frame on the inference thread (see prepare_yolo_input)
+        self.yolo_imgsz = 640
+        self._yolo_canvas = None
+        self._yolo_resized = None
+        self._yolo_tensor = None
+        self._yolo_geometry = None  # (frame shape, scale, (pad_x, pad_y))
+        # Fixed per-model predict arguments. Ultralytics keeps the predictor it built
+        # on the first call and only re-merges its config when these change, so
+        # passing the same dict every frame avoids re-creating it. conf/classes are
+        # applied inside NMS, which leaves less to post-process in Python.
+        # On Volta (compute capability 7.0) and newer the models run in FP16,
+        # halving weight and activation traffic; older GPUs such as Pascal have
+        # only a fraction of their FP32 throughput in FP16, so they stay FP32
+        self._yolo_half = (TORCH_AVAILABLE and torch.cuda.is_available()
+                           and torch.cuda.get_device_capability() >= (7, 0))
+        self.yolo_args = {
+            'weapon': {'conf': 0.45, 'imgsz': self.yolo_imgsz, 'half': self._yolo_half, 'verbose': False},
+            'crowd': {'conf': 0.5, 'classes': [0], 'imgsz': self.yolo_imgsz, 'half': self._yolo_half, 'verbose': False},
+        }
+        # Haar cascade used to gate FER when no crowd model is loaded (lazy)
+        self._face_cascade = None
         # How many display frames to skip between detection submissions
+        # Starting value; video_loop retunes it once per second from measured latency
         self.detection_interval = 4
+        self.max_detection_interval = 30
+        self._infer_times = deque(maxlen=30)  # Recent detect_threats durations (seconds)
+        self._avg_infer_ms = 0.0
+        self._measured_fps = 0.0
+        # Frame-delta gate: skip inference while the scene is static
+        self.motion_threshold = 2.0  # Mean abs gray-level change on a 160x120 thumbnail
+        self.max_static_seconds = 2.0  # Re-check a static scene at least this often
+        self._prev_gray = None
         # flag used to avoid queuing new inference while one is running
         self._inference_running = False
         
@@ -404,6 +875,28 @@ class CompleteSurveillanceSystem:
         self.last_alert_time = {}
         os.makedirs("alerts", exist_ok=True)
         
+        self._smtp_pool = None  # SMTPConnectionPool, created on the first alert email
+        self._smtp_pool_lock = threading.Lock()
+        self._tj = None  # TurboJPEG encoder, created on first alert (False if unusable)
+        
+        # Beep patterns rendered once; a single player thread plays them in order
+        self._beep_wavs = {k: build_beep_wav(*v) for k, v in BEEP_PATTERNS.items()} if SOUND_AVAILABLE else {}
+        # Beeps play one after another; extra alerts are dropped while a backlog exists
+        self.beep_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='beep')
+        self._beeps_pending = 0
+        self._beeps_lock = threading.Lock()
+        # Alert emails share a bounded pool (sized to the SMTP connection pool)
+        self.alert_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='alert')
+        # Email rate limit per alert type; alerts inside the window are coalesced
+        self.email_min_interval = 30
+        self._last_alert_sent = {}   # alert_type -> time.monotonic() of the last email
+        self._pending_alerts = {}    # alert_type -> {'ids': [...], 'latest': (message, results, frame)}
+        self._alert_lock = threading.Lock()
+        # Detection flag updates go through one writer thread that commits them in batches
+        self._db_queue = queue.Queue()
+        self._db_writer = threading.Thread(target=self._db_writer_loop, daemon=True)
+        self._db_writer.start()
+        
         # Statistics
         self.stats = {
             'weapons_detected': 0,
@@ -423,6 +916,7 @@ class CompleteSurveillanceSystem:
     def load_ai_models(self):
         """Load AI models for detection"""
         try:
+            # Models already handed over by preload_models are not loaded again
             # Weapon detection
             if YOLO_AVAILABLE:
                 weapon_paths = [
@@ -432,11 +926,11 @@ class CompleteSurveillanceSystem:
                     "yolov8n.pt"
                 ]
 
-                for path in weapon_paths:
+                for path in ([] if 'weapon' in self.models else weapon_paths):
                     try:
                         if os.path.exists(path):
-                            self.models['weapon'] = YOLO(path)
-                            self.log_message(f"✅ Weapon detection model loaded: {path}")
+                            self.models['weapon'], int8 = load_yolo(path)
+                            self.log_message(f"✅ Weapon detection model loaded: {path}{' (INT8 OpenVINO)' if int8 else ''}")
                             # Try to move underlying model to GPU if available
                             try:
                                 if TORCH_AVAILABLE and torch.cuda.is_available():
@@ -458,11 +952,11 @@ class CompleteSurveillanceSystem:
                     "yolov8n.pt"
                 ]
 
-                for path in crowd_paths:
+                for path in ([] if 'crowd' in self.models else crowd_paths):
                     try:
                         if os.path.exists(path):
-                            self.models['crowd'] = YOLO(path)
-                            self.log_message(f"✅ Crowd detection model loaded: {path}")
+                            self.models['crowd'], int8 = load_yolo(path)
+                            self.log_message(f"✅ Crowd detection model loaded: {path}{' (INT8 OpenVINO)' if int8 else ''}")
                             try:
                                 if TORCH_AVAILABLE and torch.cuda.is_available():
                                     m = self.models['crowd']
@@ -476,7 +970,7 @@ class CompleteSurveillanceSystem:
                         continue
 
             # Emotion detection
-            if FER_AVAILABLE:
+            if FER_AVAILABLE and 'emotion' not in self.models:
                 self.models['emotion'] = FER(mtcnn=True)
                 self.log_message("✅ Emotion detection model loaded")
 
@@ -516,81 +1010,32 @@ class CompleteSurveillanceSystem:
         if SOUND_AVAILABLE:
             self.log_message("🔊 Testing beep system...")
             # Play a quick test beep
-            threading.Thread(target=lambda: winsound.Beep(1000, 100), daemon=True).start()
-
+            self.play_beep_sound("test")
 
-def preload_models():
-    """Preload AI models before user authentication to avoid startup wait after login.
-    Returns a dict of loaded models (keys: 'weapon', 'crowd', 'emotion').
-    """
-    models = {}
-    try:
-        print("🔄 Preloading AI models (this may take a moment)...")
-        if YOLO_AVAILABLE:
-            weapon_paths = [
-                "AI_models/Object_detection/best.pt",
-                "AI_models/Object_detection/yolov8n.pt",
-                "Object_detection/best.pt",
-                "yolov8n.pt"
-            ]
-            for path in weapon_paths:
-                try:
-                    if os.path.exists(path):
-                        models['weapon'] = YOLO(path)
-                        print(f"✅ Weapon model loaded: {path}")
-                        # try move to CUDA if available
-                        try:
-                            if TORCH_AVAILABLE and torch.cuda.is_available():
-                                m = models['weapon']
-                                if hasattr(m, 'model') and hasattr(m.model, 'to'):
-                                    m.model.to('cuda')
-                                    print("🔧 Weapon model moved to CUDA")
-                        except Exception:
-                            pass
-                        break
-                except Exception:
-                    continue
-
-            crowd_paths = [
-                "AI_models/crowddetection/yolov8s.pt",
-                "AI_models/crowddetection/yolov8n.pt",
-                "crowddetection/yolov8s.pt",
-                "yolov8n.pt"
-            ]
-            for path in crowd_paths:
-                try:
-                    if os.path.exists(path):
-                        models['crowd'] = YOLO(path)
-                        print(f"✅ Crowd model loaded: {path}")
-                        try:
-                            if TORCH_AVAILABLE and torch.cuda.is_available():
-                                m = models['crowd']
-                                if hasattr(m, 'model') and hasattr(m.model, 'to'):
-                                    m.model.to('cuda')
-                                    print("🔧 Crowd model moved to CUDA")
-                        except Exception:
-                            pass
-                        break
-                except Exception:
-                    continue
+        # Warm the models on the inference thread while the user picks a camera
+        if any(k in self.models for k in ('weapon', 'crowd', 'emotion')):
+            self.executor.submit(self.warm_up_models)
 
-        if FER_AVAILABLE:
-            models['emotion'] = FER(mtcnn=True)
-            print("✅ Emotion model loaded")
+    def warm_up_models(self):
+        """Run one dummy inference per model so the first real frame is not slow.
+        Goes through detect_threats so CUDA init, cuDNN autotuning, the YOLO
+        predictors and the input buffers are all set up exactly as for live frames.
+        """
+        start = time.time()
+        dummy = np.zeros((480, 640, 3), dtype=np.uint8)
+        try:
+            self.detect_threats(dummy)
+            # The FER gate skips empty frames, so warm it directly
+            if 'emotion' in self.models:
+                self.models['emotion'].detect_emotions(dummy)
+        except Exception as e:
+            self.log_message(f"⚠️ Model warm-up failed: {e}")
+            return
+        # Cold-start timing must not skew the adaptive detection interval
+        self._infer_times.clear()
+        self.log_message(f"🔥 Models warmed up in {time.time() - start:.1f}s")
 
-    except Exception as e:
-        print(f"❌ Preload models error: {e}")
 
-    print("🔍 Preload complete. Models available:", 
-        f"weapon={'yes' if 'weapon' in models else 'no'}, ",
-        f"crowd={'yes' if 'crowd' in models else 'no'}, ",
-        f"emotion={'yes' if 'emotion' in models else 'no'}")
-    return models
-    
-    
-    
-    
-    # NOTE: preload_models is a top-level helper; method `setup_gui` starts below
     def setup_gui(self):
 
         """Setup main surveillance interface"""
@@ -656,7 +1101,9 @@ def preload_models():
         tk.Label(stats_frame, text="📊 DETECTION STATISTICS", 
                 font=('Arial', 12, 'bold'), bg='#34495e', fg='white').pack(pady=5)
         
+        # Labels are bound to StringVars; update_stats_display refreshes them at most every 100 ms
         self.stats_vars = {}
+        self._stats_refresh_pending = False
         stats_data = [
             ('🔫 Weapons Detected', 'weapons_detected'),
             ('👥 People Detected', 'people_detected'),
@@ -673,9 +1120,9 @@ def preload_models():
             tk.Label(frame, text=label_text, bg='#34495e', fg='white',
                     font=('Arial', 10)).pack(side='left')
             
-            self.stats_vars[key] = tk.Label(frame, text="0", bg='#34495e', fg='#2ecc71',
-                                           font=('Arial', 10, 'bold'))
-            self.stats_vars[key].pack(side='right')
+            self.stats_vars[key] = tk.StringVar(self.root, value="0")
+            tk.Label(frame, textvariable=self.stats_vars[key], bg='#34495e', fg='#2ecc71',
+                    font=('Arial', 10, 'bold')).pack(side='right')
         
         # Alert panel
         alert_frame = tk.Frame(right_frame, bg='#34495e', relief='raised', bd=2)
@@ -849,6 +1296,36 @@ def preload_models():
         self.is_monitoring = True
         self.monitor_btn.config(text="🔴 Stop Monitoring", bg='#e74c3c')
         
+        # Start grabber thread so capture never waits on drawing or the GUI
+        self._latest_frame = None
+        self._grab_ok = True
+        self._grab_thread = threading.Thread(target=self.grab_loop)
+        self._grab_thread.daemon = True
+        self._grab_thread.start()
+        
+        # Start display conversion thread (fresh queue so no frame from a previous session is shown)
+        self._display_q = queue.Queue(maxsize=1)
+        if self._Image is None:
+            # PIL is only needed to show frames, so it is not loaded at startup
+            from PIL import Image, ImageTk
+            self._Image, self._ImageTk = Image, ImageTk
+        if self._disp_bgr is None:
+            w, h = DISPLAY_SIZE
+            self._disp_bgr = np.empty((h, w, 3), dtype=np.uint8)
+            # 4-channel so PIL maps the buffer instead of copying it ('RGB' is
+            # not a mappable mode); the image is a live view of _disp_rgba
+            self._disp_rgba = np.empty((h, w, 4), dtype=np.uint8)
+            self._display_image = self._Image.frombuffer('RGBA', DISPLAY_SIZE, self._disp_rgba, 'raw', 'RGBA', 0, 1)
+        self._display_pending = False
+        self._display_stop = threading.Event()
+        self._display_thread = threading.Thread(target=self.display_loop, args=(self._display_stop,))
+        self._display_thread.daemon = True
+        self._display_thread.start()
+        # Tk-side display refresh; a tick left over from a previous session is cancelled
+        if self._display_tick_id is not None:
+            self.root.after_cancel(self._display_tick_id)
+        self._display_tick_id = self.root.after(self.display_refresh_ms, self._display_tick)
+        
         # Start video thread
         self.video_thread = threading.Thread(target=self.video_loop)
         self.video_thread.daemon = True
@@ -859,189 +1336,400 @@ def preload_models():
     def stop_monitoring(self):
         """Stop video monitoring"""
         self.is_monitoring = False
+        with self._frame_ready:
+            self._frame_ready.notify_all()
+        # Let the grabber finish its current read before the capture is released
+        if self._grab_thread is not None:
+            self._grab_thread.join(timeout=1.0)
+            self._grab_thread = None
         if self.cap:
             self.cap.release()
+        # Stop this session's display thread before another session can start
+        # one; two would race on _display_pending and write _disp_rgba at once
+        if self._display_thread is not None:
+            self._display_stop.set()
+            try:
+                self._display_q.put_nowait(None)  # Wake it from its queue wait
+            except queue.Full:
+                pass
+            self._display_thread.join(timeout=1.0)
+            self._display_thread = None
+        # Let an in-flight inference finish and drop its result so it cannot
+        # show up in the next monitoring session. Its done-callback may still
+        # run after wait() returns, so the generation tag is what actually
+        # keeps a late result out of the next session
+        self._infer_generation += 1
+        if self.inference_future is not None:
+            concurrent.futures.wait([self.inference_future], timeout=1.0)
+            self.inference_future = None
+        while not self.detection_queue.empty():
+            self.detection_queue.get_nowait()
         
         self.monitor_btn.config(text="🟢 Start Monitoring", bg='#2ecc71')
         self.log_message("⏹️ Monitoring stopped")
     
+    def grab_loop(self):
+        """Read frames as fast as the camera delivers them, keeping only the newest"""
+        while self.is_monitoring:
+            try:
+                ret, frame = self.cap.read()
+            except Exception as e:
+                self.log_message(f"❌ Capture error: {e}")
+                ret, frame = False, None
+            
+            with self._frame_ready:
+                self._grab_ok = ret
+                if ret:
+                    # Overwrite any frame video_loop has not picked up yet
+                    self._latest_frame = frame
+                    self._frame_seq += 1
+                self._frame_ready.notify_all()
+            if not ret:
+                break
+    
+    def next_frame(self, last_seq, timeout=1.0):
+        """Take the newest grabbed frame after last_seq; returns (ok, frame, seq)"""
+        with self._frame_ready:
+            self._frame_ready.wait_for(
+                lambda: not self.is_monitoring or not self._grab_ok
+                or (self._latest_frame is not None and self._frame_seq != last_seq),
+                timeout)
+            frame = self._latest_frame
+            if frame is None or self._frame_seq == last_seq:
+                return self._grab_ok and self.is_monitoring, None, last_seq
+            # video_loop draws on the frame in place, so hand it over exclusively
+            self._latest_frame = None
+            return True, frame, self._frame_seq
+    
+    def scene_changed(self, frame):
+        """True when frame differs from the last moving frame by more than motion_threshold"""
+        small = cv2.resize(frame, (160, 120), interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        # Compare against the last frame that counted as motion, so slow drift
+        # still adds up instead of being lost frame to frame
+        if self._prev_gray is not None and cv2.absdiff(gray, self._prev_gray).mean() < self.motion_threshold:
+            return False
+        self._prev_gray = gray
+        return True
+    
     def video_loop(self):
         """Enhanced video processing loop with smooth box persistence"""
         frame_count = 0
+        next_check_frame = 0  # First frame at which the next detection may be submitted
+        frame_seq = 0
+        fps_frames = 0
+        fps_start = time.time()
+        last_submit_time = 0.0
+        self._prev_gray = None
+        cache_version = 0  # Bumped whenever the detection cache changes
+        self._shown_version = -1  # Cache version of the last frame display_loop converted
         
         # Enhanced detection caching system
-        self.persistent_detections = {'weapons': [], 'people': [], 'faces': []}
-        self.detection_timestamps = {'weapons': [], 'people': [], 'faces': []}
+        # Timestamps are appended in time order, so stale boxes are always at the left end
+        self.max_cached_detections = 200  # Hard cap per detection type
+        self.persistent_detections = {k: deque(maxlen=self.max_cached_detections) for k in ('weapons', 'people', 'faces')}
+        self.detection_timestamps = {k: deque(maxlen=self.max_cached_detections) for k in ('weapons', 'people', 'faces')}
         self.box_lifetime = 4.0  # Keep boxes visible for 4 seconds
         
         while self.is_monitoring:
             try:
-                ret, frame = self.cap.read()
+                ret, frame, frame_seq = self.next_frame(frame_seq)
                 if not ret:
                     break
+                if frame is None:
+                    continue  # No new frame yet
                 
                 current_time = time.time()
                 
-                # Submit detection work every detection_interval frames using executor
-                # and collect results from previous inference when available.
-                # This keeps the capture/display loop responsive while inference runs.
-                if frame_count % self.detection_interval == 0:
-                    # If a previous inference finished, collect and process its results
-                    if self.inference_future is not None and self.inference_future.done():
-                        try:
-                            new_results = self.inference_future.result()
-                            if new_results['weapons'] or new_results['people'] or new_results['faces']:
-                                self.log_message(f"🔍 DETECTIONS: Weapons={len(new_results['weapons'])}, People={len(new_results['people'])}, Faces={len(new_results['faces'])}")
-                                for detection_type in ['weapons', 'people', 'faces']:
-                                    for detection in new_results[detection_type]:
-                                        self.persistent_detections[detection_type].append(detection)
-                                        self.detection_timestamps[detection_type].append(current_time)
-
-                                if self.has_threats(new_results):
-                                    self.log_message("🚨 THREAT DETECTED - Processing alerts...")
-                                    # pass the latest frame for context
-                                    self.handle_threat_detection(new_results, frame)
-
-                                self.update_statistics(new_results)
-                        except Exception as e:
-                            self.log_message(f"❌ Inference result error: {e}")
-                        finally:
-                            self.inference_future = None
+                # Once per second, match the detection interval to how long inference
+                # actually takes so frames are submitted as fast as the worker finishes
+                fps_frames += 1
+                if current_time - fps_start >= 1.0:
+                    self._measured_fps = fps_frames / (current_time - fps_start)
+                    fps_frames = 0
+                    fps_start = current_time
+                    if self._infer_times:
+                        self._avg_infer_ms = 1000 * sum(self._infer_times) / len(self._infer_times)
+                        interval = int(self._avg_infer_ms * self._measured_fps / 1000)
+                        self.detection_interval = min(self.max_detection_interval, max(1, interval))
+                
+                # Apply results as soon as the inference callback delivers them,
+                # not only on detection frames
+                while True:
+                    try:
+                        generation, frame_id, new_results = self.detection_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    # A late result from a previous session; the job in flight
+                    # now (if any) is not the one that finished
+                    if generation != self._infer_generation:
+                        continue
+                    # The buffer that frame was inferred on is free again
+                    self.inference_future = None
+                    if isinstance(new_results, Exception):
+                        self.log_message(f"❌ Inference result error: {new_results}")
+                        continue
+                    try:
+                        if new_results['weapons'] or new_results['people'] or new_results['faces']:
+                            self.log_message(f"🔍 DETECTIONS: Weapons={len(new_results['weapons'])}, People={len(new_results['people'])}, Faces={len(new_results['faces'])}")
+                            for detection_type in ['weapons', 'people', 'faces']:
+                                for detection in new_results[detection_type]:
+                                    self.persistent_detections[detection_type].append(detection)
+                                    self.detection_timestamps[detection_type].append(current_time)
+                            cache_version += 1
+
+                            if self.has_threats(new_results):
+                                self.log_message("🚨 THREAT DETECTED - Processing alerts...")
+                                # pass the latest frame for context
+                                self.handle_threat_detection(new_results, frame)
 
+                            self.update_statistics(new_results)
+                    except Exception as e:
+                        self.log_message(f"❌ Inference result error: {e}")
+                
+                # Submit detection work at most every detection_interval frames using executor.
+                # This keeps the capture/display loop responsive while inference runs.
+                # The deadline is set from the interval current at submit time, so a
+                # retuned interval applies to the very next submission
+                # Near-identical frames are skipped, but a static scene is still
+                # re-checked every max_static_seconds
+                moved = self.scene_changed(frame)
+                if frame_count >= next_check_frame:
                     # If no inference is running, submit current frame for detection
-                    if self.inference_future is None:
+                    if self.inference_future is None and (
+                            moved or current_time - last_submit_time >= self.max_static_seconds):
                         try:
-                            frame_for_infer = frame.copy()
+                            frame_for_infer = self._inference_slot(frame)
+                            np.copyto(frame_for_infer, frame)
                             self.inference_future = self.executor.submit(self.detect_threats, frame_for_infer)
+                            self.inference_future.add_done_callback(
+                                lambda future, generation=self._infer_generation, frame_id=frame_seq:
+                                    self._on_infer_done(generation, frame_id, future))
+                            self._buf_idx ^= 1
+                            last_submit_time = current_time
+                            next_check_frame = frame_count + self.detection_interval
                         except Exception as e:
+                            self.inference_future = None
                             self.log_message(f"❌ Failed to submit inference: {e}")
                 
                 # Clean old detections from cache
+                cutoff = current_time - self.box_lifetime
                 for detection_type in ['weapons', 'people', 'faces']:
-                    # Remove detections older than box_lifetime
-                    valid_indices = []
-                    for i, timestamp in enumerate(self.detection_timestamps[detection_type]):
-                        if current_time - timestamp < self.box_lifetime:
-                            valid_indices.append(i)
-                    
-                    # Keep only valid (recent) detections
-                    self.persistent_detections[detection_type] = [
-                        self.persistent_detections[detection_type][i] for i in valid_indices
-                    ]
-                    self.detection_timestamps[detection_type] = [
-                        self.detection_timestamps[detection_type][i] for i in valid_indices
-                    ]
-                
-                # Always draw all persistent detections
-                display_results = {
-                    'weapons': self.persistent_detections['weapons'].copy(),
-                    'people': self.persistent_detections['people'].copy(),
-                    'faces': self.persistent_detections['faces'].copy()
-                }
-                
-                # Draw detections with enhanced visibility
-                frame = self.draw_detections(frame, display_results)
+                    # Remove detections older than box_lifetime from the oldest end
+                    timestamps = self.detection_timestamps[detection_type]
+                    detections = self.persistent_detections[detection_type]
+                    while timestamps and timestamps[0] <= cutoff:
+                        timestamps.popleft()
+                        detections.popleft()
+                        cache_version += 1
                 
-                # Update GUI display with optimized refresh
-                self.update_video_display(frame)
+                # A static frame with unchanged boxes would look the same as
+                # what is already on screen, so leave the display alone
+                # A frame only counts as shown once display_loop has converted
+                # it; a dropped one is redrawn from the next frame
+                if moved or cache_version != self._shown_version:
+                    # Always draw all persistent detections
+                    display_results = {
+                        'weapons': list(self.persistent_detections['weapons']),
+                        'people': list(self.persistent_detections['people']),
+                        'faces': list(self.persistent_detections['faces'])
+                    }
+                    
+                    # Draw detections with enhanced visibility
+                    frame = self.draw_detections(frame, display_results)
+                    
+                    # Update GUI display with optimized refresh
+                    self.update_video_display(frame, cache_version)
                 
                 frame_count += 1
-                time.sleep(0.01)  # Faster refresh for smoother display
                 
             except Exception as e:
                 self.log_message(f"❌ Video error: {e}")
                 break
     
+    def _on_infer_done(self, generation, frame_id, future):
+        """Executor callback: hand a finished inference to video_loop"""
+        try:
+            self.detection_queue.put((generation, frame_id, future.result()))
+        except Exception as e:
+            self.detection_queue.put((generation, frame_id, e))
+    
+    def _inference_slot(self, frame):
+        """Idle inference buffer, (re)allocated only when the frame size changes"""
+        if self._frame_buffers is None or self._frame_buffers[0].shape != frame.shape:
+            self._frame_buffers = [np.empty(frame.shape, dtype=frame.dtype) for _ in range(2)]
+            self._buf_idx = 0
+        return self._frame_buffers[self._buf_idx]
+    
+    def prepare_yolo_input(self, frame):
+        """Letterbox a frame once for both YOLO models.
+        
+        On CUDA this returns a reusable half-precision tensor that the weapon
+        and crowd models share, so the frame is resized and uploaded once
+        instead of once per model. Without CUDA the frame itself is returned
+        and Ultralytics preprocesses it as before.
+        """
+        if not (TORCH_AVAILABLE and torch.cuda.is_available()):
+            self._yolo_geometry = None
+            return frame
+        
+        size = self.yolo_imgsz
+        if self._yolo_geometry is None or self._yolo_geometry[0] != frame.shape:
+            # New camera size: recompute the letterbox and (re)allocate buffers
+            h, w = frame.shape[:2]
+            scale = min(size / h, size / w)
+            nw, nh = round(w * scale), round(h * scale)
+            self._yolo_geometry = (frame.shape, scale, ((size - nw) // 2, (size - nh) // 2))
+            self._yolo_canvas = np.full((size, size, 3), 114, dtype=np.uint8)  # Ultralytics pad grey
+            self._yolo_resized = np.empty((nh, nw, 3), dtype=np.uint8)
+            if self._yolo_tensor is None:
+                # In the models' precision, so Ultralytics does not cast it again
+                dtype = torch.float16 if self._yolo_half else torch.float32
+                self._yolo_tensor = torch.empty((1, 3, size, size), dtype=dtype, device='cuda')
+        
+        _, _, (left, top) = self._yolo_geometry
+        nh, nw = self._yolo_resized.shape[:2]
+        cv2.resize(frame, (nw, nh), dst=self._yolo_resized, interpolation=cv2.INTER_LINEAR)
+        # BGR -> RGB by reversing channels while filling the padded canvas
+        self._yolo_canvas[top:top + nh, left:left + nw] = self._yolo_resized[:, :, ::-1]
+        
+        # One upload: uint8 HWC -> float16/32 CHW in [0, 1] on the GPU
+        chw = torch.from_numpy(self._yolo_canvas).permute(2, 0, 1).unsqueeze(0)
+        self._yolo_tensor.copy_(chw.to('cuda', non_blocking=True))
+        self._yolo_tensor.div_(255)
+        return self._yolo_tensor
+    
+    def to_frame_coords(self, xyxy):
+        """Map YOLO boxes from the letterboxed input back onto the frame"""
+        if self._yolo_geometry is None:
+            return xyxy
+        _, scale, (left, top) = self._yolo_geometry
+        xyxy = np.array(xyxy, dtype=np.float32)
+        xyxy[..., [0, 2]] -= left
+        xyxy[..., [1, 3]] -= top
+        xyxy /= scale
+        return xyxy
+    
+    def may_contain_faces(self, frame, results):
+        """Cheap check before FER: a detected person, or a Haar face hit without a crowd model"""
+        if 'crowd' in self.models:
+            return bool(results['people'])
+        
+        if self._face_cascade is None:
+            cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+            # An unusable cascade must never hide faces from FER
+            self._face_cascade = cascade if not cascade.empty() else False
+        if self._face_cascade is False:
+            return True
+        
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = self._face_cascade.detectMultiScale(gray, scaleFactor=1.3, minNeighbors=5)
+        return len(faces) > 0
+    
     def detect_threats(self, frame):
         """Detect threats using AI models"""
+        start = time.perf_counter()
         results = {
             'weapons': [],
             'people': [],
             'faces': [],
-            'emotions': []
+            'emotions': [],
+            # Face threat summary filled while faces are collected, so the
+            # threat check and alert handling never re-scan the face list
+            'max_distress': 0.0,       # Highest angry/fear confidence
+            'suspicious_faces': []     # angry/fear faces above the alert threshold
         }
         
         try:
+            # Resize/upload once; both YOLO models run on the same input
+            yolo_source = None
+            if 'weapon' in self.models or 'crowd' in self.models:
+                yolo_source = self.prepare_yolo_input(frame)
+            
             # Enhanced weapon detection - only real weapons (knife, gun, sword, pistol, rifle)
             if 'weapon' in self.models:
-                # Higher confidence thresholds to avoid false positives from metals
-                for conf_threshold in [0.45, 0.55, 0.65]:
-                    weapon_results = self.models['weapon'](frame, verbose=False, conf=conf_threshold)
-                    for r in weapon_results:
-                        boxes = r.boxes
-                        if boxes is not None:
-                            for box in boxes:
-                                conf = float(box.conf[0])
-                                cls = int(box.cls[0])
-                                
-                                # Filter for actual weapon classes only (0=knife, 1=gun, 2=sword, 3=pistol, 4=rifle)
-                                valid_weapon_classes = [0, 1, 2, 3, 4]  # Only real weapons
-                                
-                                if conf > conf_threshold and cls in valid_weapon_classes:
-                                    x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                                    
-                                    # Additional size filter - weapons should be reasonably sized
-                                    bbox_width = x2 - x1
-                                    bbox_height = y2 - y1
-                                    bbox_area = bbox_width * bbox_height
-                                    
-                                    # Filter out too small or too large detections (likely false positives)
-                                    if 500 < bbox_area < 100000:  # Reasonable weapon size
-                                        results['weapons'].append({
-                                            'bbox': (int(x1), int(y1), int(x2), int(y2)),
-                                            'confidence': conf,
-                                            'class': cls
-                                        })
-                                        weapon_names = {0: "KNIFE", 1: "GUN", 2: "SWORD", 3: "PISTOL", 4: "RIFLE"}
-                                        weapon_type = weapon_names.get(cls, "WEAPON")
-                                        self.log_message(f"🔍 REAL WEAPON FOUND: {weapon_type} (Class={cls}), Conf={conf:.3f}")
-                    # If weapons found, break to avoid duplicates
-                    if results['weapons']:
-                        break
+                # Higher confidence threshold to avoid false positives from metals. One
+                # forward pass: retrying at 0.55/0.65 when nothing passed 0.45 could
+                # only return a subset of this pass, so those passes never found anything
+                conf_threshold = self.yolo_args['weapon']['conf']
+                valid_weapon_classes = [0, 1, 2, 3, 4]  # Only real weapons
+                weapon_results = self.models['weapon'].predict(yolo_source, **self.yolo_args['weapon'])
+                for r in weapon_results:
+                    boxes = r.boxes
+                    if boxes is None or len(boxes) == 0:
+                        continue
+                    # One device->host copy per result: rows are x1, y1, x2, y2, conf, cls
+                    data = boxes.data.cpu().numpy()
+                    confs = data[:, 4]
+                    clses = data[:, 5].astype(int)
+                    xyxy = self.to_frame_coords(data[:, :4])
+                    
+                    # Additional size filter - weapons should be reasonably sized;
+                    # too small or too large detections are likely false positives
+                    areas = (xyxy[:, 2] - xyxy[:, 0]) * (xyxy[:, 3] - xyxy[:, 1])
+                    keep = ((confs > conf_threshold) & np.isin(clses, valid_weapon_classes)
+                            & (areas > 500) & (areas < 100000))
+                    
+                    for (x1, y1, x2, y2), conf, cls in zip(xyxy[keep], confs[keep], clses[keep]):
+                        conf = float(conf)
+                        cls = int(cls)
+                        results['weapons'].append({
+                            'bbox': (int(x1), int(y1), int(x2), int(y2)),
+                            'confidence': conf,
+                            'class': cls
+                        })
+                        weapon_type = WEAPON_NAMES.get(cls, "WEAPON")
+                        self.log_message(f"🔍 REAL WEAPON FOUND: {weapon_type} (Class={cls}), Conf={conf:.3f}")
             
             # People detection
             if 'crowd' in self.models:
-                people_results = self.models['crowd'](frame, verbose=False)
+                people_results = self.models['crowd'].predict(yolo_source, **self.yolo_args['crowd'])
                 for r in people_results:
                     boxes = r.boxes
-                    if boxes is not None:
-                        for box in boxes:
-                            conf = float(box.conf[0])
-                            cls = int(box.cls[0])
-                            if cls == 0 and conf > 0.5:  # Person class
-                                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                                results['people'].append({
-                                    'bbox': (int(x1), int(y1), int(x2), int(y2)),
-                                    'confidence': conf
-                                })
+                    if boxes is None or len(boxes) == 0:
+                        continue
+                    # One device->host copy per result instead of three per box
+                    data = boxes.data.cpu().numpy()
+                    people = data[(data[:, 5] == 0) & (data[:, 4] > 0.5)]  # Person class
+                    for (x1, y1, x2, y2), conf in zip(self.to_frame_coords(people[:, :4]), people[:, 4]):
+                        results['people'].append({
+                            'bbox': (int(x1), int(y1), int(x2), int(y2)),
+                            'confidence': float(conf)
+                        })
             
-            # Emotion detection
-            if 'emotion' in self.models:
+            # Emotion detection - FER's MTCNN is the costliest model, so skip it
+            # when nobody is in view
+            if 'emotion' in self.models and self.may_contain_faces(frame, results):
                 try:
                     emotion_results = self.models['emotion'].detect_emotions(frame)
                     for face in emotion_results:
                         x, y, w, h = face['box']
                         dominant = max(face['emotions'], key=face['emotions'].get)
-                        results['faces'].append({
+                        face_info = {
                             'bbox': (x, y, x+w, y+h),
                             'emotions': face['emotions'],
                             'dominant': dominant,
                             'confidence': face['emotions'][dominant]
-                        })
+                        }
+                        results['faces'].append(face_info)
+                        if dominant in ('angry', 'fear'):
+                            results['max_distress'] = max(results['max_distress'], face_info['confidence'])
+                            if face_info['confidence'] > 0.8:
+                                results['suspicious_faces'].append(face_info)
                 except Exception:
                     pass  # FER can be unstable
         
         except Exception as e:
             self.log_message(f"❌ Detection error: {e}")
         
+        self._infer_times.append(time.perf_counter() - start)
         return results
     
     def has_threats(self, results):
         """Check if any threats are detected"""
         return (len(results['weapons']) > 0 or 
                 len(results['people']) > 5 or
-                any(face['dominant'] in ['angry', 'fear'] and face['confidence'] > 0.7 
-                    for face in results['faces']))
+                results['max_distress'] > 0.7)
     
     def handle_threat_detection(self, results, frame):
         """Handle detected threats with alerts and emails"""
@@ -1064,7 +1752,7 @@ def preload_models():
                 
                 # Play urgent beep sound
                 self.play_beep_sound("weapon")
-                self.db_manager.mark_beep_played(detection_id)
+                self._db_queue.put(('mark_beep_played', detection_id))
                 self.stats['beeps_played'] += 1
                 
                 # Send email alert
@@ -1091,7 +1779,7 @@ def preload_models():
                 
                 # Play crowd beep sound
                 self.play_beep_sound("crowd")
-                self.db_manager.mark_beep_played(detection_id)
+                self._db_queue.put(('mark_beep_played', detection_id))
                 self.stats['beeps_played'] += 1
                 
                 # Send email alert
@@ -1104,8 +1792,7 @@ def preload_models():
                 self.stats['threats_blocked'] += 1
         
         # Handle suspicious behavior (MEDIUM)
-        suspicious_faces = [face for face in results['faces'] 
-                          if face['dominant'] in ['angry', 'fear'] and face['confidence'] > 0.8]
+        suspicious_faces = results['suspicious_faces']
         if suspicious_faces:
             if 'behavior' not in self.last_alert_time or current_time - self.last_alert_time['behavior'] > self.alert_cooldown:
                 threat_message = f"😠 SUSPICIOUS BEHAVIOR: {len(suspicious_faces)} suspicious faces!"
@@ -1119,7 +1806,7 @@ def preload_models():
                 
                 # Play behavior beep sound
                 self.play_beep_sound("behavior")
-                self.db_manager.mark_beep_played(detection_id)
+                self._db_queue.put(('mark_beep_played', detection_id))
                 self.stats['beeps_played'] += 1
                 
                 # Send email alert
@@ -1137,312 +1824,443 @@ def preload_models():
     def play_beep_sound(self, threat_type):
         """Play beep sound based on threat type"""
         if not SOUND_AVAILABLE:
+            # No winsound (Linux/macOS): ring the Tk bell in the same rhythm,
+            # scheduled on the Tk event loop rather than a sleeping thread
+            if threat_type in BEEP_PATTERNS and threat_type != "test":
+                self.root.after(0, self._ring_bell, BEEP_PATTERNS[threat_type][3], threat_type)
+            return
+        if threat_type not in self._beep_wavs:
             return
         
-        def play_beeps():
-            try:
-                if threat_type == "weapon":
-                    # CRITICAL - 5 rapid high-pitched beeps
-                    for _ in range(5):
-                        winsound.Beep(1500, 200)
-                        time.sleep(0.1)
-                elif threat_type == "crowd":
-                    # HIGH - 3 medium beeps
-                    for _ in range(3):
-                        winsound.Beep(1000, 300)
-                        time.sleep(0.2)
-                elif threat_type == "behavior":
-                    # MEDIUM - 2 warning beeps
-                    for _ in range(2):
-                        winsound.Beep(800, 400)
-                        time.sleep(0.3)
-                
+        # Beeps already queued keep sounding for seconds; don't let them lag further
+        with self._beeps_lock:
+            if self._beeps_pending > 2:
+                return
+            self._beeps_pending += 1
+        self.beep_executor.submit(self._play_beep, threat_type)
+    
+    def _ring_bell(self, remaining, threat_type):
+        """Tk thread: one bell of a beep pattern; chains the next one with root.after"""
+        try:
+            self.root.bell()
+        except tk.TclError:
+            return  # Window closed
+        if remaining > 1:
+            _, beep_ms, gap_ms, _ = BEEP_PATTERNS[threat_type]
+            self.root.after(beep_ms + gap_ms, self._ring_bell, remaining - 1, threat_type)
+        else:
+            self.log_message(f"🔔 {threat_type.upper()} bell alert played")
+    
+    def _play_beep(self, threat_type):
+        """Play one beep pattern from its WAV buffer (runs on beep_executor)"""
+        try:
+            # winsound cannot play memory images with SND_ASYNC; the executor
+            # thread exists so the synchronous call never blocks anything else
+            winsound.PlaySound(self._beep_wavs[threat_type], winsound.SND_MEMORY)
+            if threat_type != "test":
                 self.log_message(f"🔊 {threat_type.upper()} beep alert played")
-                
-            except Exception as e:
-                self.log_message(f"🔇 Beep error: {e}")
-        
-        # Play in separate thread to avoid blocking
-        beep_thread = threading.Thread(target=play_beeps)
-        beep_thread.daemon = True
-        beep_thread.start()
+        except Exception as e:
+            self.log_message(f"🔇 Beep error: {e}")
+        finally:
+            with self._beeps_lock:
+                self._beeps_pending -= 1
     
     def send_email_alert(self, alert_type, message, results, frame, detection_id):
-        """Send automatic email alert to user"""
+        """Send automatic email alert to user.
+        At most one email per alert type every email_min_interval seconds; alerts
+        raised in between are folded into a single follow-up email.
+        """
         if not self.email_config['enabled']:
             self.log_message("📧 Email not configured - please setup Gmail")
             return
         
-        def send_email():
+        # video_loop draws boxes into this frame right after the alert is raised
+        frame = frame.copy()
+        
+        now = time.monotonic()
+        with self._alert_lock:
+            last = self._last_alert_sent.get(alert_type)
+            if last is not None and now - last < self.email_min_interval:
+                # Too soon after the last email of this type: hold it for the follow-up,
+                # keeping only the newest message/frame as evidence
+                bucket = self._pending_alerts.setdefault(alert_type, {'ids': []})
+                bucket['ids'].append(detection_id)
+                bucket['latest'] = (message, results, frame)
+                if len(bucket['ids']) == 1:
+                    timer = threading.Timer(self.email_min_interval - (now - last),
+                                            self._flush_pending_alert, args=(alert_type,))
+                    timer.daemon = True
+                    timer.start()
+                return
+            self._last_alert_sent[alert_type] = now
+        
+        # Send email on the alert worker pool
+        self.alert_executor.submit(self._send_email, alert_type, message, results, frame, [detection_id])
+    
+    def _flush_pending_alert(self, alert_type):
+        """Timer callback: send the combined email for alerts held back by the rate limit"""
+        with self._alert_lock:
+            bucket = self._pending_alerts.pop(alert_type, None)
+            if not bucket:
+                return
+            self._last_alert_sent[alert_type] = time.monotonic()
+        message, results, frame = bucket['latest']
+        try:
+            self.alert_executor.submit(self._send_email, alert_type, message, results, frame, bucket['ids'])
+        except RuntimeError:
+            pass  # Shutting down
+    
+    def _send_email(self, alert_type, message, results, frame, detection_ids):
+        """Build and send one alert email covering detection_ids (runs on alert_executor)"""
+        def mark_sent():
+            for detection_id in detection_ids:
+                self._db_queue.put(('mark_email_sent', detection_id))
+        
+        if len(detection_ids) > 1:
+            message += f"\n({len(detection_ids)} alerts of this type combined into this email)"
+        
+        # Computed once up front; the error paths below log it too
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        try:
+            # Create email message
+            msg = EmailMessage()
+            sender_email, sender_password = self._smtp_credentials
+            msg['From'] = sender_email
+            msg['To'] = self.user_email
+            msg['Subject'] = f"🚨 SECURITY ALERT: {alert_type}" + (f" x{len(detection_ids)}" if len(detection_ids) > 1 else "")
+            
+            # Add detection details
+            summary = []
+            if results['weapons']:
+                summary.append(f"🔫 WEAPONS: {len(results['weapons'])} detected\n")
+            if results['people']:
+                summary.append(f"👥 PEOPLE: {len(results['people'])} detected\n")
+            if results['faces']:
+                summary.append(f"😊 FACES: {len(results['faces'])} analyzed\n")
+            
+            # Create detailed email body
+            msg.set_content(ALERT_EMAIL_TEMPLATE.format(
+                alert_type=alert_type,
+                timestamp=timestamp,
+                user=self.user_email,
+                detection_ids=', '.join(str(i) for i in detection_ids),
+                message=message,
+                summary=''.join(summary)
+            ))
+            
+            # Attach screenshot evidence - encoded once in memory, no disk round-trip
             try:
-                # Create email message
-                msg = MIMEMultipart()
-                msg['From'] = self.email_config['sender_email']
-                msg['To'] = self.user_email
-                msg['Subject'] = f"🚨 SECURITY ALERT: {alert_type}"
-                
-                timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                img_data = self.encode_alert_jpeg(frame)
+                msg.add_attachment(img_data, maintype='image', subtype='jpeg',
+                                   filename=f'{alert_type}_evidence.jpg')
                 
-                # Create detailed email body
-                body = f"""
-🛡️ SMART SURVEILLANCE SYSTEM - SECURITY ALERT
-
-⚠️ ALERT TYPE: {alert_type}
-⏰ TIME: {timestamp}
-👤 USER: {self.user_email}
-🔍 DETECTION ID: {detection_id}
-
-📋 ALERT DETAILS:
-{message}
+                # Archiving the same bytes is opt-in (works on read-only installs)
+                if self.email_config.get('keep_evidence_on_disk', False):
+                    screenshot_path = f"alerts/alert_{detection_ids[-1]}_{timestamp.replace(':', '-')}.jpg"
+                    with open(screenshot_path, 'wb') as f:
+                        f.write(img_data)
+            except Exception as e:
+                self.log_message(f"📎 Screenshot attach failed: {e}")
+            
+            if not sender_email:
+                self.log_message("📧 Email attempt: No sender configured - cannot send email")
+                mark_sent()
+                return
 
-📊 DETECTION SUMMARY:
-"""
-                
-                # Add detection details
-                if results['weapons']:
-                    body += f"🔫 WEAPONS: {len(results['weapons'])} detected\n"
-                if results['people']:
-                    body += f"👥 PEOPLE: {len(results['people'])} detected\n"
-                if results['faces']:
-                    body += f"😊 FACES: {len(results['faces'])} analyzed\n"
-                
-                body += f"""
-🚨 RECOMMENDED ACTIONS:
-✓ Check surveillance feed immediately
-✓ Verify threat level in monitored area
-✓ Contact security if necessary
-✓ Review recorded evidence
+            if not sender_password:
+                self.log_message("⚠️ Email alert attempted but App Password not configured")
+                self.log_message(f"📧 ALERT LOGGED: {alert_type} detected at {timestamp}")
+                # Still log the alert even if email fails
+                mark_sent()
+                return
 
-📧 This alert was automatically sent to: {self.user_email}
-🤖 Generated by: Complete Smart Surveillance System
-"""
-                
-                msg.attach(MIMEText(body, 'plain'))
-                
-                # Attach screenshot evidence
+            # Send over a pooled connection; login only happens when the pool
+            # has to open one. Catch authentication errors separately for clearer guidance
+            try:
+                with self.smtp_pool(sender_email, sender_password).checkout() as server:
+                    server.send_message(msg, from_addr=sender_email, to_addrs=[self.user_email])
+            except smtplib.SMTPAuthenticationError as auth_err:
+                self.log_message(f"❌ SMTP Authentication failed: {auth_err}")
+                self.log_message("💡 Make sure 2-Step Verification is enabled and you're using a 16-character Gmail App Password")
+                mark_sent()
+                return
+            
+            # Mark as sent
+            mark_sent()
+            self.stats['emails_sent'] += 1
+            
+            self.log_message(f"✅ {alert_type} email sent successfully to {self.user_email}")
+            
+        except Exception as e:
+            self.log_message(f"❌ Email sending failed: {e}")
+            self.log_message(f"📧 ALERT LOGGED: {alert_type} detected at {timestamp}")
+            
+            # Provide specific guidance based on error type
+            error_str = str(e).lower()
+            if "authentication" in error_str or "password" in error_str:
+                self.log_message("💡 Setup Gmail App Password: Gmail Settings > Security > 2FA > App Passwords")
+            elif "connection" in error_str or "network" in error_str:
+                self.log_message("🌐 Check internet connection")
+            else:
+                self.log_message("⚙️ Check Email Settings in system menu")
+    
+    def _resolve_smtp_credentials(self):
+        """Decide the alert sender and app password once; environment variables
+        win over the config file. Call again whenever email_config changes."""
+        env_sender = os.environ.get('SSS_EMAIL') or os.environ.get('SURVEILLANCE_SENDER')
+        env_pass = os.environ.get('SSS_EMAIL_PASS') or os.environ.get('SURVEILLANCE_PASS')
+        
+        if env_sender:
+            sender_email = env_sender
+            self.log_message("📧 Using sender from environment variable SSS_EMAIL")
+        else:
+            sender_email = self.email_config.get('sender_email', self.user_email)
+        
+        if env_pass:
+            sender_password = env_pass
+            self.log_message("🔐 Using app password from environment variable SSS_EMAIL_PASS")
+        else:
+            sender_password = self.email_config.get('sender_password', '')
+        
+        self._smtp_credentials = (sender_email, sender_password)
+    
+    def _db_writer_loop(self, max_batch=32, window=0.1):
+        """Commit queued flag updates, up to max_batch per transaction or whatever
+        arrives within window seconds of the first one; None stops the loop"""
+        running = True
+        while running:
+            batch = [self._db_queue.get()]
+            deadline = time.monotonic() + window
+            while len(batch) < max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
                 try:
-                    screenshot_path = f"alerts/alert_{detection_id}_{timestamp.replace(':', '-')}.jpg"
-                    cv2.imwrite(screenshot_path, frame)
-                    
-                    with open(screenshot_path, 'rb') as f:
-                        img_data = f.read()
-                        image = MIMEImage(img_data)
-                        image.add_header('Content-Disposition', 'attachment', 
-                                       filename=f'{alert_type}_evidence.jpg')
-                        msg.attach(image)
-                except Exception as e:
-                    self.log_message(f"📎 Screenshot attach failed: {e}")
-                
-                # Send email with enhanced authentication
-                server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-                server.starttls()
-                
-                # Prefer environment variables for credentials if provided
-                env_sender = os.environ.get('SSS_EMAIL') or os.environ.get('SURVEILLANCE_SENDER')
-                env_pass = os.environ.get('SSS_EMAIL_PASS') or os.environ.get('SURVEILLANCE_PASS')
-
-                if env_sender:
-                    sender_email = env_sender
-                    self.log_message("📧 Using sender from environment variable SSS_EMAIL")
-                else:
-                    sender_email = self.email_config.get('sender_email', self.user_email)
-
-                if env_pass:
-                    sender_password = env_pass
-                    self.log_message("🔐 Using app password from environment variable SSS_EMAIL_PASS")
-                else:
-                    sender_password = self.email_config.get('sender_password', '')
-
-                if not sender_email:
-                    self.log_message("📧 Email attempt: No sender configured - cannot send email")
-                    self.db_manager.mark_email_sent(detection_id)
-                    return
-
-                if not sender_password:
-                    self.log_message("⚠️ Email alert attempted but App Password not configured")
-                    self.log_message(f"📧 ALERT LOGGED: {alert_type} detected at {timestamp}")
-                    # Still log the alert even if email fails
-                    self.db_manager.mark_email_sent(detection_id)
-                    return
-
-                # Attempt to login - catch authentication errors separately for clearer guidance
+                    batch.append(self._db_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+                batch = [update for update in batch if update is not None]
+            if batch:
                 try:
-                    server.login(sender_email, sender_password)
-                except smtplib.SMTPAuthenticationError as auth_err:
-                    self.log_message(f"❌ SMTP Authentication failed: {auth_err}")
-                    self.log_message("💡 Make sure 2-Step Verification is enabled and you're using a 16-character Gmail App Password")
-                    self.db_manager.mark_email_sent(detection_id)
-                    return
-                except Exception as ex:
-                    self.log_message(f"❌ SMTP login error: {ex}")
-                    self.db_manager.mark_email_sent(detection_id)
-                    return
-                server.sendmail(sender_email, self.user_email, msg.as_string())
-                server.quit()
-                
-                # Mark as sent
-                self.db_manager.mark_email_sent(detection_id)
-                self.stats['emails_sent'] += 1
-                
-                self.log_message(f"✅ {alert_type} email sent successfully to {self.user_email}")
-                
+                    self.db_manager.apply_flag_updates(batch)
+                except Exception as e:
+                    self.log_message(f"❌ Database write failed: {e}")
+    
+    def smtp_pool(self, sender_email, sender_password):
+        """Connection pool for the current SMTP account, replaced when the settings change"""
+        key = (self.email_config['smtp_server'], self.email_config['smtp_port'], sender_email)
+        with self._smtp_pool_lock:
+            pool = self._smtp_pool
+            if pool is None or pool.key != key or pool.password != sender_password:
+                if pool is not None:
+                    pool.close()
+                pool = self._smtp_pool = SMTPConnectionPool(*key, sender_password)
+            return pool
+    
+    def encode_alert_jpeg(self, frame):
+        """JPEG-encode an alert frame with libjpeg-turbo when available, else OpenCV"""
+        h, w = frame.shape[:2]
+        if w > ALERT_MAX_WIDTH:
+            frame = cv2.resize(frame, (ALERT_MAX_WIDTH, round(h * ALERT_MAX_WIDTH / w)),
+                               interpolation=cv2.INTER_AREA)
+        if TURBOJPEG_AVAILABLE and self._tj is not False:
+            try:
+                if self._tj is None:
+                    self._tj = TurboJPEG()
+                return self._tj.encode(frame, quality=ALERT_JPEG_QUALITY)
             except Exception as e:
-                self.log_message(f"❌ Email sending failed: {e}")
-                self.log_message(f"📧 ALERT LOGGED: {alert_type} detected at {timestamp}")
-                
-                # Provide specific guidance based on error type
-                error_str = str(e).lower()
-                if "authentication" in error_str or "password" in error_str:
-                    self.log_message("💡 Setup Gmail App Password: Gmail Settings > Security > 2FA > App Passwords")
-                elif "connection" in error_str or "network" in error_str:
-                    self.log_message("🌐 Check internet connection")
-                else:
-                    self.log_message("⚙️ Check Email Settings in system menu")
-        
-        # Send email in background thread
-        email_thread = threading.Thread(target=send_email)
-        email_thread.daemon = True
-        email_thread.start()
+                # libturbojpeg shared library missing or unusable: OpenCV from now on
+                self.log_message(f"⚠️ TurboJPEG unavailable, using OpenCV: {e}")
+                self._tj = False
+        ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, ALERT_JPEG_QUALITY,
+                                               cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+        if not ok:
+            raise ValueError("JPEG encoding failed")
+        return buf.tobytes()
     
     def draw_detections(self, frame, results):
-        """Ultra-enhanced detection drawing with maximum visibility"""
+        """Ultra-enhanced detection drawing with maximum visibility.
+        Each outline layer (outer box, inner outline, plate border) is drawn
+        for all detections of a kind in one polylines call; the filled label
+        plates and the text are drawn per detection.
+        """
         # Draw weapons (ULTRA THICK RED boxes - MAXIMUM VISIBILITY)
-        for i, weapon in enumerate(results['weapons']):
-            x1, y1, x2, y2 = weapon['bbox']
-            conf = weapon['confidence']
+        if results['weapons']:
+            boxes = np.array([w['bbox'] for w in results['weapons']], dtype=np.int32)
+            x1, y1, x2, y2 = boxes.T
+            labels = [f"DANGER {WEAPON_NAMES.get(w.get('class', 0), 'WEAPON')} DETECTED {w['confidence']:.2f}"
+                      for w in results['weapons']]
+            lw = np.array([label_width(label, 1.2, 4) for label in labels])
             
             # TRIPLE-LAYER weapon boxes for maximum visibility
-            cv2.rectangle(frame, (x1-2, y1-2), (x2+2, y2+2), (0, 0, 255), 8)  # Outer thick red
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 255, 255), 2)      # Inner white outline
-            
-            # Get specific weapon type name based on class
-            weapon_names = {
-                0: "KNIFE",
-                1: "GUN", 
-                2: "SWORD",
-                3: "PISTOL",
-                4: "RIFLE"
-            }
-            weapon_type = weapon_names.get(weapon.get('class', 0), "WEAPON")
-            
-            # Clean weapon label without symbols
-            label = f"DANGER {weapon_type} DETECTED {conf:.2f}"
-            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 1.2, 4)[0]
+            cv2.polylines(frame, rect_polys(x1-2, y1-2, x2+2, y2+2), True, (0, 0, 255), 8)  # Outer thick red
+            cv2.polylines(frame, rect_polys(x1, y1, x2, y2), True, (255, 255, 255), 2)      # Inner white outline
             
             # Multi-layer label background for maximum visibility
-            cv2.rectangle(frame, (x1-5, y1-50), (x1+label_size[0]+25, y1), (0, 0, 0), -1)      # Black background
-            cv2.rectangle(frame, (x1-3, y1-48), (x1+label_size[0]+23, y1-2), (255, 255, 255), -1)  # White background
-            cv2.rectangle(frame, (x1-5, y1-50), (x1+label_size[0]+25, y1), (0, 0, 255), 3)    # Red border
-            cv2.putText(frame, label, (x1+5, y1-20), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 4)
+            fill_plates(frame, np.stack([x1-5, y1-50, x1+lw+25, y1], -1),        # Black background
+                        np.stack([x1-3, y1-48, x1+lw+23, y1-2], -1))                # White background
+            cv2.polylines(frame, rect_polys(x1-5, y1-50, x1+lw+25, y1), True, (0, 0, 255), 3)  # Red border
             
-            # Add blinking effect indicator
-            cv2.circle(frame, (x1-15, y1-25), 8, (0, 0, 255), -1)
-            cv2.putText(frame, "!", (x1-20, y1-20), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+            badge = weapon_badge()
+            for (bx, by), label in zip(boxes[:, :2].tolist(), labels):
+                cv2.putText(frame, label, (bx+5, by-20), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 4)
+                # Add blinking effect indicator (prerendered circle + "!")
+                paste_stamp(frame, badge, bx-15, by-25)
         
         # Draw people (ENHANCED GREEN boxes)
-        for i, person in enumerate(results['people'], 1):
-            x1, y1, x2, y2 = person['bbox']
-            conf = person['confidence']
+        if results['people']:
+            boxes = np.array([p['bbox'] for p in results['people']], dtype=np.int32)
+            x1, y1, x2, y2 = boxes.T
+            # Clean people label without symbols
+            labels = [f"PERSON {i} CONF {p['confidence']:.2f}" for i, p in enumerate(results['people'], 1)]
+            lw = np.array([label_width(label, 0.8, 2) for label in labels])
             
             # Double-layer people boxes
-            cv2.rectangle(frame, (x1-1, y1-1), (x2+1, y2+1), (0, 255, 0), 4)  # Outer green
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 255, 255), 1)      # Inner white
-            
-            # Clean people label without symbols
-            label = f"PERSON {i} CONF {conf:.2f}"
-            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
+            cv2.polylines(frame, rect_polys(x1-1, y1-1, x2+1, y2+1), True, (0, 255, 0), 4)  # Outer green
+            cv2.polylines(frame, rect_polys(x1, y1, x2, y2), True, (255, 255, 255), 1)      # Inner white
             
             # Enhanced label background
-            cv2.rectangle(frame, (x1-2, y1-35), (x1+label_size[0]+15, y1-2), (0, 0, 0), -1)
-            cv2.rectangle(frame, (x1, y1-33), (x1+label_size[0]+13, y1-4), (255, 255, 255), -1)
-            cv2.rectangle(frame, (x1-2, y1-35), (x1+label_size[0]+15, y1-2), (0, 255, 0), 2)
-            cv2.putText(frame, label, (x1+5, y1-15), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
+            fill_plates(frame, np.stack([x1-2, y1-35, x1+lw+15, y1-2], -1),
+                        np.stack([x1, y1-33, x1+lw+13, y1-4], -1))
+            cv2.polylines(frame, rect_polys(x1-2, y1-35, x1+lw+15, y1-2), True, (0, 255, 0), 2)
+            for (bx, by), label in zip(boxes[:, :2].tolist(), labels):
+                cv2.putText(frame, label, (bx+5, by-15), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
         
         # Draw faces with emotions (ENHANCED BLUE boxes)
-        for face in results['faces']:
-            x1, y1, x2, y2 = face['bbox']
-            emotion = face['dominant']
-            conf = face['confidence']
+        if results['faces']:
+            boxes = np.array([f['bbox'] for f in results['faces']], dtype=np.int32)
+            x1, y1, x2, y2 = boxes.T
+            # Clean emotion label without icons
+            labels = [f"EMOTION {f['dominant'].upper()} CONF {f['confidence']:.2f}" for f in results['faces']]
+            lw = np.array([label_width(label, 0.7, 2) for label in labels])
             
             # Color based on emotion intensity
-            if emotion in ['angry', 'fear', 'disgust']:
-                color = (0, 0, 255)  # Red for negative emotions
-            elif emotion in ['happy', 'surprise']:
-                color = (0, 255, 0)  # Green for positive emotions  
-            else:
-                color = (255, 0, 0)  # Blue for neutral emotions
+            colors = [EMOTION_COLORS.get(f['dominant'], NEUTRAL_EMOTION_COLOR) for f in results['faces']]
             
-            # Double-layer emotion boxes
-            cv2.rectangle(frame, (x1-1, y1-1), (x2+1, y2+1), color, 4)
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (255, 255, 255), 1)
+            # Coloured layers are drawn once per colour group
+            groups = [(color, np.array([c == color for c in colors])) for color in set(colors)]
             
-            # Clean emotion label without icons
-            label = f"EMOTION {emotion.upper()} CONF {conf:.2f}"
-            label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
+            # Double-layer emotion boxes
+            for color, sel in groups:
+                cv2.polylines(frame, rect_polys(x1[sel]-1, y1[sel]-1, x2[sel]+1, y2[sel]+1), True, color, 4)
+            cv2.polylines(frame, rect_polys(x1, y1, x2, y2), True, (255, 255, 255), 1)
             
             # Enhanced label background
-            cv2.rectangle(frame, (x1-2, y1-32), (x1+label_size[0]+12, y1-2), (0, 0, 0), -1)
-            cv2.rectangle(frame, (x1, y1-30), (x1+label_size[0]+10, y1-4), (255, 255, 255), -1)
-            cv2.rectangle(frame, (x1-2, y1-32), (x1+label_size[0]+12, y1-2), color, 2)
-            cv2.putText(frame, label, (x1+3, y1-12), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 2)
+            fill_plates(frame, np.stack([x1-2, y1-32, x1+lw+12, y1-2], -1),
+                        np.stack([x1, y1-30, x1+lw+10, y1-4], -1))
+            for color, sel in groups:
+                cv2.polylines(frame, rect_polys(x1[sel]-2, y1[sel]-32, x1[sel]+lw[sel]+12, y1[sel]-2), True, color, 2)
+            for (bx, by), label in zip(boxes[:, :2].tolist(), labels):
+                cv2.putText(frame, label, (bx+3, by-12), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 0), 2)
         
         # Enhanced detection summary with status indicators
         total_detections = len(results['weapons']) + len(results['people']) + len(results['faces'])
         if total_detections > 0:
             # Dynamic summary with threat level - clean text
-            if results['weapons']:
-                status = "CRITICAL WEAPON THREAT"
-                bg_color = (0, 0, 255)
-            elif len(results['people']) >= 5:
-                status = "CROWD DETECTED" 
-                bg_color = (0, 165, 255)
-            else:
-                status = "MONITORING ACTIVE"
-                bg_color = (0, 128, 0)
+            status, bg_color = summary_style(results)
             
             summary = f"{status} | W:{len(results['weapons'])} P:{len(results['people'])} F:{len(results['faces'])}"
             
-            # Enhanced summary display
-            cv2.rectangle(frame, (5, 5), (600, 50), (0, 0, 0), -1)
-            cv2.rectangle(frame, (7, 7), (598, 48), bg_color, -1)
-            cv2.rectangle(frame, (5, 5), (600, 50), (255, 255, 255), 3)
+            # Enhanced summary display, pasted from the prerendered banner
+            paste_stamp(frame, summary_banner(bg_color), 0, 0)
             cv2.putText(frame, summary, (15, 32), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
         
         return frame
     
-    def update_video_display(self, frame):
-        """Optimized video display with reduced lag"""
+    def update_video_display(self, frame, version):
+        """Hand a drawn frame (and the detection cache version it shows) to the
+        display thread, replacing any frame it has not shown yet"""
+        item = (frame, version)
         try:
-            # Resize for display (optimized size)
-            frame = cv2.resize(frame, (800, 600))  # Larger display for better visibility
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert to PIL Image with optimization
-            pil_image = Image.fromarray(frame)
-            photo = ImageTk.PhotoImage(pil_image)
-            
-            # Direct update without threading delay
-            if hasattr(self, 'video_label'):
-                self.video_label.config(image=photo)
-                self.video_label.image = photo  # Keep reference to prevent garbage collection
-            
-        except Exception:
-            pass  # Reduce error logging to prevent console spam
+            self._display_q.put_nowait(item)
+        except queue.Full:
+            try:
+                self._display_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._display_q.put_nowait(item)
+            except queue.Full:
+                pass
+    
+    def display_loop(self, stop):
+        """Resize and colour-convert frames for display off the capture thread,
+        until this session's stop event is set"""
+        while not stop.is_set():
+            try:
+                item = self._display_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if item is None:
+                continue  # Wake-up from stop_monitoring
+            frame, version = item
+            # Tk has not copied the previous image out of _disp_rgba yet; drop
+            # this frame rather than overwrite the buffer under it
+            if self._display_pending:
+                continue
+            try:
+                # Resize for display (larger for better visibility) and convert
+                # into the preallocated buffers
+                cv2.resize(frame, DISPLAY_SIZE, dst=self._disp_bgr)
+                # _display_image maps this buffer, so converting into it is
+                # all that is needed to update the image
+                cv2.cvtColor(self._disp_bgr, cv2.COLOR_BGR2RGBA, dst=self._disp_rgba)
+                
+                # Picked up by _display_tick on the Tk thread; this thread never calls Tk
+                self._display_pending = True
+                self._shown_version = version
+            except Exception:
+                pass  # Reduce error logging to prevent console spam
+    
+    def _display_tick(self):
+        """Tk thread: show the newest converted frame, then reschedule while monitoring"""
+        self._display_tick_id = None
+        if self.is_monitoring:
+            self._display_tick_id = self.root.after(self.display_refresh_ms, self._display_tick)
+        if not self._display_pending:
+            return
+        try:
+            pil_image = self._display_image
+            if pil_image is None or not hasattr(self, 'video_label'):
+                return
+            if self._display_photo is None:
+                # One PhotoImage for the whole session; later frames are pasted into it
+                self._display_photo = self._ImageTk.PhotoImage(pil_image)
+                self.video_label.config(image=self._display_photo)
+                self.video_label.image = self._display_photo  # Keep reference to prevent garbage collection
+            else:
+                self._display_photo.paste(pil_image)
+        except Exception as e:
+            # Report the first failure instead of hiding it; don't spam every frame
+            if not self._display_error_logged:
+                self._display_error_logged = True
+                self.log_message(f"⚠️ Display update failed: {e}")
+        finally:
+            # PhotoImage holds its own copy now; display_loop may reuse the buffer
+            self._display_pending = False
     
     def update_statistics(self, results):
         """Update detection statistics"""
         self.stats['weapons_detected'] += len(results['weapons'])
         self.stats['people_detected'] += len(results['people'])
         self.stats['faces_analyzed'] += len(results['faces'])
+        self.update_stats_display()
     
     def update_stats_display(self):
-        """Update statistics display in GUI"""
-        def update_gui():
-            for stat_name, value in self.stats.items():
-                if stat_name in self.stats_vars:
-                    self.stats_vars[stat_name].config(text=str(value))
-        
-        self.root.after(0, update_gui)
+        """Schedule a statistics refresh in the GUI; calls within 100 ms share one refresh"""
+        if self._stats_refresh_pending:
+            return
+        self._stats_refresh_pending = True
+        self.root.after(100, self._flush_stats_display)
+    
+    def _flush_stats_display(self):
+        """Tk thread: copy the current statistics into the label variables"""
+        self._stats_refresh_pending = False
+        for stat_name, var in self.stats_vars.items():
+            var.set(str(self.stats[stat_name]))
     
     def configure_email(self):
         """Configure Gmail settings"""
@@ -1499,7 +2317,8 @@ def preload_models():
         
         def test_email():
             try:
-                msg = MIMEText("🧪 Test email from Complete Surveillance System\n\nYour automatic threat alerts are working correctly!")
+                msg = EmailMessage()
+                msg.set_content("🧪 Test email from Complete Surveillance System\n\nYour automatic threat alerts are working correctly!")
                 msg['Subject'] = "🧪 Test - Surveillance System Ready"
                 msg['From'] = sender_entry.get()
                 msg['To'] = self.user_email
@@ -1507,7 +2326,7 @@ def preload_models():
                 server = smtplib.SMTP('smtp.gmail.com', 587)
                 server.starttls()
                 server.login(sender_entry.get(), password_entry.get())
-                server.sendmail(sender_entry.get(), self.user_email, msg.as_string())
+                server.send_message(msg, from_addr=sender_entry.get(), to_addrs=[self.user_email])
                 server.quit()
                 
                 messagebox.showinfo("✅ Success", f"Test email sent to {self.user_email}!\n\nAutomatic alerts are now active.")
@@ -1519,6 +2338,7 @@ def preload_models():
             self.email_config['sender_email'] = sender_entry.get()
             self.email_config['sender_password'] = password_entry.get()
             self.email_config['enabled'] = True
+            self._resolve_smtp_credentials()
             
             self.save_email_config()
             messagebox.showinfo("✅ Saved", "Gmail configuration saved!\n\nAutomatic threat alerts enabled.")
@@ -1534,24 +2354,24 @@ def preload_models():
         tk.Button(btn_frame, text="❌ Cancel", command=email_window.destroy,
                  bg='#e74c3c', fg='white', font=('Arial', 11, 'bold')).pack(side='right', padx=5)
     
+    def _read_email_config(self):
+        """Parsed configs/email_config.json (None if missing), read from disk once until saved"""
+        if self._email_config_cache is None:
+            config_path = Path("configs/email_config.json")
+            if not config_path.exists():
+                return None
+            self._email_config_cache = json.loads(config_path.read_bytes())
+        return self._email_config_cache
+    
     def load_email_config(self):
         """Load email configuration"""
         try:
-            config_path = Path("configs/email_config.json")
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    saved_config = json.load(f)
-                    self.email_config.update(saved_config)
+            saved_config = self._read_email_config()
+            if saved_config is not None:
+                self.email_config.update(saved_config)
         except Exception as e:
             self.log_message(f"Email config load error: {e}")
 
-# Ensure module-level functions (if any) that were placed outside the class during
-# refactors are still available as methods on the class. This binds the loader
-# function to the class to avoid AttributeError when __init__ calls it.
-try:
-    CompleteSurveillanceSystem.load_email_config = load_email_config  # type: ignore
-except NameError:
-    pass
     
     def save_email_config(self):
         """Save email configuration"""
@@ -1559,6 +2379,7 @@ except NameError:
             config_path = Path("configs/email_config.json")
             with open(config_path, 'w') as f:
                 json.dump(self.email_config, f, indent=2)
+            self._email_config_cache = None
         except Exception as e:
             self.log_message(f"Email config save error: {e}")
     
@@ -1567,8 +2388,7 @@ except NameError:
         config_path = Path("configs/email_config.json")
         if config_path.exists():
             try:
-                with open(config_path, 'r') as f:
-                    file_config = json.load(f)
+                file_config = self._read_email_config()
                 
                 # Update with file configuration
                 if 'email' in file_config and 'password' in file_config:
@@ -1592,14 +2412,18 @@ except NameError:
             try:
                 with open(config_path, 'w') as f:
                     json.dump(template_config, f, indent=2)
+                self._email_config_cache = None
                 self.log_message("📝 Created email config template: configs/email_config.json")
             except Exception as e:
                 self.log_message(f"❌ Template creation failed: {e}")
     
     def save_frame(self):
         """Save current frame"""
-        if self.cap and self.cap.isOpened():
-            ret, frame = self.cap.read()
+        if self.is_monitoring:
+            # The grabber owns the capture; take a copy of the next fresh frame instead of reading it here
+            with self._frame_ready:
+                ret = self._frame_ready.wait_for(lambda: self._latest_frame is not None, 1.0)
+                frame = self._latest_frame.copy() if ret else None
             if ret:
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"alerts/manual_save_{timestamp}.jpg"
@@ -1614,14 +2438,17 @@ except NameError:
     
     def log_message(self, message):
         """Add message to activity log"""
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        log_entry = "[%s] %s\n" % (time.strftime("%H:%M:%S"), message)
         
         def update_log():
             self.log_text.insert(tk.END, log_entry)
             self.log_text.see(tk.END)
         
-        self.root.after(0, update_log)
+        # The GUI may not exist yet (email config is loaded before setup_gui)
+        try:
+            self.root.after(0, update_log)
+        except AttributeError:
+            pass
         print(message)  # Also print to console
     
     def run(self):
@@ -1639,9 +2466,89 @@ except NameError:
                 self.executor.shutdown(wait=False)
         except Exception:
             pass
+        # Drop queued beeps/emails; the ones in progress finish on their own
+        self.beep_executor.shutdown(wait=False, cancel_futures=True)
+        self.alert_executor.shutdown(wait=False, cancel_futures=True)
+        # Log out of any pooled SMTP connections
+        if self._smtp_pool is not None:
+            self._smtp_pool.close()
+        # Flush pending database flag updates
+        self._db_queue.put(None)
+        self._db_writer.join(timeout=2)
         self.root.quit()
         self.root.destroy()
 
+# CUDA context creation is not safe to race from several loader threads
+_cuda_move_lock = threading.Lock()
+
+def _try_load_yolo(name, paths):
+    """Load the first existing model in paths (moved to CUDA when available), or None"""
+    for path in paths:
+        try:
+            if os.path.exists(path):
+                model, int8 = load_yolo(path)
+                print(f"✅ {name} model loaded: {path}{' (INT8 OpenVINO)' if int8 else ''}")
+                # try move to CUDA if available
+                try:
+                    if TORCH_AVAILABLE and torch.cuda.is_available():
+                        if hasattr(model, 'model') and hasattr(model.model, 'to'):
+                            with _cuda_move_lock:
+                                model.model.to('cuda')
+                            print(f"🔧 {name} model moved to CUDA")
+                except Exception:
+                    pass
+                return model
+        except Exception:
+            continue
+    return None
+
+def preload_models():
+    """Preload AI models before user authentication to avoid startup wait after login.
+    The models load in parallel, so reading one set of weights overlaps with
+    initialising the others. Returns a dict of loaded models (keys: 'weapon',
+    'crowd', 'emotion').
+    """
+    models = {}
+    print("🔄 Preloading AI models (this may take a moment)...")
+    jobs = {}
+    if YOLO_AVAILABLE:
+        weapon_paths = [
+            "AI_models/Object_detection/best.pt",
+            "AI_models/Object_detection/yolov8n.pt",
+            "Object_detection/best.pt",
+            "yolov8n.pt"
+        ]
+        crowd_paths = [
+            "AI_models/crowddetection/yolov8s.pt",
+            "AI_models/crowddetection/yolov8n.pt",
+            "crowddetection/yolov8s.pt",
+            "yolov8n.pt"
+        ]
+        jobs['weapon'] = lambda: _try_load_yolo("Weapon", weapon_paths)
+        jobs['crowd'] = lambda: _try_load_yolo("Crowd", crowd_paths)
+    if FER_AVAILABLE:
+        jobs['emotion'] = lambda: FER(mtcnn=True)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=3, thread_name_prefix='preload') as pool:
+        futures = {pool.submit(job): key for key, job in jobs.items()}
+        for future in concurrent.futures.as_completed(futures):
+            key = futures[future]
+            try:
+                model = future.result()
+            except Exception as e:
+                print(f"❌ Preload models error ({key}): {e}")
+                continue
+            if model is not None:
+                models[key] = model
+                if key == 'emotion':
+                    print("✅ Emotion model loaded")
+
+    print("🔍 Preload complete. Models available:", 
+        f"weapon={'yes' if 'weapon' in models else 'no'}, ",
+        f"crowd={'yes' if 'crowd' in models else 'no'}, ",
+        f"emotion={'yes' if 'emotion' in models else 'no'}")
+    return models
+
 def main():
     """Main application entry point"""
     print("🛡️ Complete Smart Surveillance System")
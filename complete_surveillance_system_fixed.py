@@ -6,6 +6,7 @@ ALL FEATURES IN ONE SYSTEM
 """
 
 import cv2
+import numpy as np
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, simpledialog, ttk
 import threading
@@ -15,6 +16,10 @@ import datetime
 import json
 import sqlite3
 import hashlib
+import hmac
+import atexit
+import bisect
+import contextlib
 try:
     from passlib.context import CryptContext
     PASSLIB_AVAILABLE = True
@@ -22,32 +27,120 @@ except Exception:
     PASSLIB_AVAILABLE = False
 import smtplib
 from pathlib import Path
-from PIL import Image, ImageTk
+from urllib.request import urlopen
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.image import MIMEImage
 import os
 import concurrent.futures
+import filecmp
+import multiprocessing
+from multiprocessing import shared_memory
+
+# The ML stack (torch, ultralytics, TensorRT, FER, ONNX Runtime) is imported by
+# import_ai_libraries() when models are first loaded instead of at startup, so
+# the login window doesn't wait on it. With the inference process running, the
+# GUI process never imports it at all.
+torch = None
+YOLO = None
+FER = None
+ort = None
+TORCH_AVAILABLE = False
+YOLO_AVAILABLE = False
+TENSORRT_AVAILABLE = False
+FER_AVAILABLE = False
+ORT_AVAILABLE = False
+GPU_CAPABILITY = (0, 0)
+YOLO_PRECISION = 'fp32'
+USE_HALF = False
+_ai_libraries_lock = threading.Lock()
+_ai_libraries_imported = False
+
+# Saved alert frames double as the INT8 calibration set
+CALIBRATION_DIR = "alerts"
+MIN_CALIBRATION_FRAMES = 32
+
+EMOTION_ONNX_PATH = "AI_models/facialexpression/emotion.onnx"
+
+def import_ai_libraries():
+    """Import the optional ML libraries (once) and set the *_AVAILABLE flags"""
+    global torch, YOLO, FER, ort, _ai_libraries_imported
+    global TORCH_AVAILABLE, YOLO_AVAILABLE, TENSORRT_AVAILABLE, FER_AVAILABLE, ORT_AVAILABLE
+    global GPU_CAPABILITY, YOLO_PRECISION, USE_HALF
+    with _ai_libraries_lock:
+        if _ai_libraries_imported:
+            return
+        _ai_libraries_imported = True
 
-# Optional torch import to prefer GPU when available
-try:
-    import torch
-    TORCH_AVAILABLE = True
-except Exception:
-    TORCH_AVAILABLE = False
+        # Optional torch import to prefer GPU when available
+        try:
+            import torch
+            TORCH_AVAILABLE = True
+        except Exception:
+            TORCH_AVAILABLE = False
+
+        # Import AI libraries
+        try:
+            from ultralytics import YOLO
+            YOLO_AVAILABLE = True
+        except ImportError:
+            YOLO_AVAILABLE = False
+
+        # YOLO precision from the GPU's compute capability: INT8 TensorRT engines on
+        # Turing+ (7.5), FP16 on Tensor Core GPUs (7.0+), FP32 otherwise.
+        # SSS_YOLO_PRECISION=int8|fp16|fp32 overrides the choice.
+        if TORCH_AVAILABLE and torch.cuda.is_available():
+            GPU_CAPABILITY = torch.cuda.get_device_capability()
+        else:
+            GPU_CAPABILITY = (0, 0)
+        YOLO_PRECISION = os.environ.get('SSS_YOLO_PRECISION') or (
+            'int8' if GPU_CAPABILITY >= (7, 5) else 'fp16' if GPU_CAPABILITY >= (7, 0) else 'fp32')
+        USE_HALF = GPU_CAPABILITY >= (7, 0) and YOLO_PRECISION != 'fp32'
+
+        # Optional TensorRT for compiling YOLO models into GPU engines
+        try:
+            import tensorrt  # noqa: F401
+            TENSORRT_AVAILABLE = True
+        except Exception:
+            TENSORRT_AVAILABLE = False
+
+        try:
+            from fer import FER
+            FER_AVAILABLE = True
+        except ImportError:
+            FER_AVAILABLE = False
+
+        # Optional ONNX Runtime for the emotion CNN
+        try:
+            import onnxruntime as ort
+            ORT_AVAILABLE = True
+        except ImportError:
+            ORT_AVAILABLE = False
 
-# Import AI libraries
+# Optional Numba to compile the per-box filtering
 try:
-    from ultralytics import YOLO
-    YOLO_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    YOLO_AVAILABLE = False
+    NUMBA_AVAILABLE = False
 
+    def njit(*args, **kwargs):
+        """Stand-in decorator: run the function as plain Python"""
+        return lambda func: func
+
+# Weapon model classes 0-4 (knife, gun, sword, pistol, rifle); COCO person is 0
+WEAPON_CLASS_MASK = np.zeros(80, dtype=np.bool_)
+WEAPON_CLASS_MASK[:5] = True
+PERSON_CLASS = 0
+
+# Optional libjpeg-turbo bindings for encoding alert screenshots
 try:
-    from fer import FER
-    FER_AVAILABLE = True
+    from turbojpeg import TurboJPEG
+    TURBOJPEG_AVAILABLE = True
 except ImportError:
-    FER_AVAILABLE = False
+    TURBOJPEG_AVAILABLE = False
+
+ALERT_JPEG_QUALITY = 75
 
 try:
     import winsound
@@ -55,6 +148,264 @@ try:
 except ImportError:
     SOUND_AVAILABLE = False
 
+def write_calibration_data(names):
+    """Write an Ultralytics dataset file over the saved alert frames for INT8
+    calibration; returns its path, or None if there aren't enough frames yet.
+    """
+    frames = list(Path(CALIBRATION_DIR).glob("*.jpg"))
+    if len(frames) < MIN_CALIBRATION_FRAMES:
+        return None
+    os.makedirs("configs", exist_ok=True)
+    data_path = os.path.join("configs", "int8_calibration.yaml")
+    with open(data_path, 'w') as f:
+        # JSON is valid YAML
+        json.dump({'path': os.path.abspath(CALIBRATION_DIR), 'train': '.', 'val': '.',
+                   'names': names}, f)
+    return data_path
+
+def load_yolo(path):
+    """Load a YOLO model, using a TensorRT engine built from the .pt on CUDA GPUs.
+    Engines are cached next to the .pt (INT8 as *_int8.engine) and rebuilt
+    whenever the .pt is newer. INT8 falls back to FP16, and FP16 to the .pt.
+    """
+    if not (TENSORRT_AVAILABLE and TORCH_AVAILABLE and torch.cuda.is_available()) \
+            or YOLO_PRECISION == 'fp32':
+        return YOLO(path)
+
+    stem = os.path.splitext(path)[0]
+    for int8 in ((True, False) if YOLO_PRECISION == 'int8' else (False,)):
+        engine_path = stem + ("_int8.engine" if int8 else ".engine")
+        try:
+            if not os.path.exists(engine_path) or os.path.getmtime(engine_path) < os.path.getmtime(path):
+                model = YOLO(path)
+                export_args = {'half': True}
+                if int8:
+                    data = write_calibration_data(model.names)
+                    if data is None:
+                        print(f"ℹ️ INT8 needs {MIN_CALIBRATION_FRAMES}+ frames in {CALIBRATION_DIR}/; using FP16")
+                        continue
+                    export_args = {'int8': True, 'data': data}
+                print(f"🔧 Building {'INT8' if int8 else 'FP16'} TensorRT engine for {path} (first run only)...")
+                exported = model.export(format='engine', imgsz=640, device=0, **export_args)
+                if exported != engine_path:
+                    os.replace(exported, engine_path)
+            return YOLO(engine_path, task='detect')
+        except Exception as e:
+            print(f"⚠️ {'INT8' if int8 else 'FP16'} TensorRT engine unavailable for {path}: {e}")
+    return YOLO(path)
+
+def load_emotion_model():
+    """FER with OpenCV Haar face detection instead of MTCNN. Its emotion CNN
+    runs on ONNX Runtime when the model is (or can be) converted to ONNX.
+    """
+    detector = FER(mtcnn=False)
+    if not ORT_AVAILABLE or not hasattr(detector, '_classify_emotions'):
+        return detector
+
+    try:
+        if not os.path.exists(EMOTION_ONNX_PATH):
+            # One-time conversion of FER's bundled Keras model
+            import tf2onnx
+            print(f"🔧 Converting emotion model to ONNX: {EMOTION_ONNX_PATH}")
+            tf2onnx.convert.from_keras(detector._FER__emotion_classifier, output_path=EMOTION_ONNX_PATH)
+
+        available = ort.get_available_providers()
+        providers = [p for p in ('CUDAExecutionProvider', 'CPUExecutionProvider') if p in available]
+        session = ort.InferenceSession(EMOTION_ONNX_PATH, providers=providers)
+        input_name = session.get_inputs()[0].name
+
+        # FER batches every face in the frame into one _classify_emotions call
+        def classify_emotions(gray_faces):
+            return session.run(None, {input_name: np.asarray(gray_faces, dtype=np.float32)})[0]
+
+        detector._classify_emotions = classify_emotions
+    except Exception as e:
+        print(f"⚠️ ONNX emotion model unavailable, using Keras: {e}")
+    return detector
+
+@njit(cache=True)
+def filter_boxes(boxes, weapon_class_mask, weapon_conf, person_class, person_conf):
+    """Split an (N, 6) float32 [x1, y1, x2, y2, conf, cls] array into the row
+    indices of plausible weapons and of confident people.
+    """
+    n = boxes.shape[0]
+    weapons = np.empty(n, dtype=np.int64)
+    people = np.empty(n, dtype=np.int64)
+    n_weapons = 0
+    n_people = 0
+    for i in range(n):
+        conf = boxes[i, 4]
+        cls = int(boxes[i, 5])
+        if conf > weapon_conf and 0 <= cls < weapon_class_mask.shape[0] and weapon_class_mask[cls]:
+            # Too small or too large boxes are usually false positives
+            area = (boxes[i, 2] - boxes[i, 0]) * (boxes[i, 3] - boxes[i, 1])
+            if 500 < area < 100000:
+                weapons[n_weapons] = i
+                n_weapons += 1
+        if cls == person_class and conf > person_conf:
+            people[n_people] = i
+            n_people += 1
+    return weapons[:n_weapons], people[:n_people]
+
+def result_boxes(result):
+    """Copy a YOLO result's boxes to the host once, as a contiguous float32 array"""
+    return np.ascontiguousarray(result.boxes.data.cpu().numpy()[:, :6], dtype=np.float32)
+
+def warm_up_filter_boxes():
+    """Compile filter_boxes now so the first real frame doesn't pay for it"""
+    filter_boxes(np.zeros((1, 6), dtype=np.float32), WEAPON_CLASS_MASK, 0.5, PERSON_CLASS, 0.5)
+
+# YOLO input size; frames are letterboxed to this square on the host
+YOLO_IMGSZ = 640
+YOLO_PAD_VALUE = 114  # Ultralytics' letterbox grey
+
+
+class YoloInput:
+    """Letterboxes frames into preallocated buffers and uploads them to
+    reusable CUDA tensors through pinned memory, so feeding YOLO allocates
+    nothing per frame and every model/pass on a frame shares one upload.
+    Uploads run on their own CUDA stream into alternating buffers; YOLO runs
+    on a compute stream (see compute()) that waits only for the upload.
+    Predictions on the tensor come back in letterbox coordinates;
+    unletterbox() maps them onto the original frame.
+    """
+    
+    def __init__(self, size=YOLO_IMGSZ):
+        self.size = size
+        self.canvas = np.full((size, size, 3), YOLO_PAD_VALUE, dtype=np.uint8)
+        self.frame_shape = None
+        self.resized = None
+        self.rgb = None
+        self.scale = 1.0
+        self.pad = (0, 0)
+        self.copy_stream = torch.cuda.Stream()
+        self.compute_stream = torch.cuda.Stream()
+        # Double-buffered: the next frame's upload never touches the buffers the
+        # previous one used; copied[i] marks when pinned[i] may be refilled
+        self.pinned = [torch.empty((1, 3, size, size), dtype=torch.uint8).pin_memory()
+                       for _ in range(2)]
+        self.tensors = [torch.empty((1, 3, size, size), device='cuda',
+                                    dtype=torch.float16 if USE_HALF else torch.float32)
+                        for _ in range(2)]
+        self.copied = [torch.cuda.Event() for _ in range(2)]
+        self.slot = 0
+    
+    def prepare(self, frame):
+        """Letterbox a BGR frame into the CUDA input tensor and return it"""
+        if frame.shape != self.frame_shape:
+            # New camera size: recompute geometry and (re)allocate the resize buffers
+            h, w = frame.shape[:2]
+            self.frame_shape = frame.shape
+            self.scale = min(self.size / h, self.size / w)
+            nw, nh = round(w * self.scale), round(h * self.scale)
+            self.pad = ((self.size - nw) // 2, (self.size - nh) // 2)
+            self.resized = np.empty((nh, nw, 3), dtype=np.uint8)
+            self.rgb = np.empty((nh, nw, 3), dtype=np.uint8)
+            self.canvas[:] = YOLO_PAD_VALUE
+        nh, nw = self.resized.shape[:2]
+        left, top = self.pad
+        cv2.resize(frame, (nw, nh), dst=self.resized, interpolation=cv2.INTER_LINEAR)
+        cv2.cvtColor(self.resized, cv2.COLOR_BGR2RGB, dst=self.rgb)
+        self.canvas[top:top + nh, left:left + nw] = self.rgb
+        
+        slot = self.slot
+        self.slot ^= 1
+        pinned, tensor = self.pinned[slot], self.tensors[slot]
+        # HWC -> CHW into pinned memory once its last upload has been read out
+        self.copied[slot].synchronize()
+        pinned[0].copy_(torch.from_numpy(self.canvas).permute(2, 0, 1))
+        # Async host-to-device copy on the copy stream; the compute stream waits
+        # for it on the GPU, not the host
+        with torch.cuda.stream(self.copy_stream):
+            tensor.copy_(pinned, non_blocking=True)
+            tensor.div_(255)
+            self.copied[slot].record(self.copy_stream)
+        self.compute_stream.wait_event(self.copied[slot])
+        return tensor
+    
+    def compute(self):
+        """Context running YOLO (and reading its results) on the compute stream"""
+        return torch.cuda.stream(self.compute_stream)
+    
+    def unletterbox(self, boxes):
+        """Map (N, 6) box rows from letterbox to frame coordinates, in place"""
+        left, top = self.pad
+        boxes[:, [0, 2]] -= left
+        boxes[:, [1, 3]] -= top
+        boxes[:, :4] /= self.scale
+        return boxes
+
+
+_yolo_input = None
+
+
+def yolo_input():
+    """This process's YoloInput, or None when YOLO runs on the CPU"""
+    global _yolo_input
+    if _yolo_input is None and TORCH_AVAILABLE and torch.cuda.is_available():
+        _yolo_input = YoloInput()
+    return _yolo_input
+
+# Candidate weights for each detector role, in order of preference
+MODEL_CANDIDATES = (
+    ('weapon', "AI_models/Object_detection/best.pt"),
+    ('weapon', "AI_models/Object_detection/yolov8n.pt"),
+    ('weapon', "Object_detection/best.pt"),
+    ('weapon', "yolov8n.pt"),
+    ('crowd', "AI_models/crowddetection/yolov8s.pt"),
+    ('crowd', "AI_models/crowddetection/yolov8n.pt"),
+    ('crowd', "crowddetection/yolov8s.pt"),
+    ('crowd', "yolov8n.pt"),
+)
+MODEL_CACHE_PATH = os.path.join("configs", "models.json")
+
+def resolve_models():
+    """Return {role: [existing candidate paths, best first]}.
+    Each candidate directory is listed once with os.scandir instead of checking
+    every path; the result is cached in configs/models.json and reused while
+    the cache is newer than all candidate directories.
+    """
+    dirs = sorted({os.path.dirname(path) or '.' for _, path in MODEL_CANDIDATES})
+    dir_mtimes = []
+    for d in dirs:
+        try:
+            dir_mtimes.append(os.stat(d).st_mtime)
+        except OSError:
+            pass
+    try:
+        if os.stat(MODEL_CACHE_PATH).st_mtime > max(dir_mtimes, default=0):
+            with open(MODEL_CACHE_PATH, 'r') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    listings = {}
+    for d in dirs:
+        try:
+            with os.scandir(d) as entries:
+                listings[d] = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            listings[d] = set()
+
+    found = {}
+    for role, path in MODEL_CANDIDATES:
+        if os.path.basename(path) in listings[os.path.dirname(path) or '.']:
+            found.setdefault(role, []).append(path)
+    try:
+        os.makedirs("configs", exist_ok=True)
+        with open(MODEL_CACHE_PATH, 'w') as f:
+            json.dump(found, f, indent=2)
+    except OSError:
+        pass
+    return found
+
+def same_weights(path_a, path_b):
+    """True if two model files hold identical weights (so one model can serve both)"""
+    try:
+        return filecmp.cmp(path_a, path_b, shallow=False)
+    except OSError:
+        return False
+
 class DatabaseManager:
     """Manages user authentication and data logging"""
     
@@ -67,11 +418,61 @@ class DatabaseManager:
             self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
         else:
             self.pwd_context = None
+        self._pick_backend()
+        # Passwords already verified this session, keyed by (email, stored hash).
+        # Values are HMACs under a per-process key, so a repeat login skips bcrypt
+        # without the plaintext password ever being kept in memory
+        self._verify_key = os.urandom(32)
+        self._verified = {}
+        # One long-lived connection per thread instead of connecting per call
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close)
         self.init_database()
+        
+        # Detection writes go through a group-commit writer thread: up to
+        # max_batch queued writes (or whatever arrives within max_wait) share
+        # one transaction, so bursts cost one commit instead of one each
+        self.max_batch = 64
+        self.max_wait = 0.010
+        self._write_q = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+    
+    def _conn(self):
+        """Return this thread's connection, opening and tuning it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit: each statement commits on its own, so no transaction
+            # is ever left open on a cached connection
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-20000")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def close(self):
+        """Flush queued writes and close every cached connection (registered with atexit)"""
+        if getattr(self, '_writer', None) and self._writer.is_alive():
+            self._write_q.put(None)
+            self._writer.join(timeout=5)
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections.clear()
+        self._local = threading.local()
     
     def init_database(self):
         """Initialize database tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         
         # Users table
@@ -97,7 +498,8 @@ class DatabaseManager:
             )
         ''')
         
-        # Detections table
+        # Detections table (user_email is left NULL here - join users on user_id;
+        # the column stays for the other apps sharing this database)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS detections (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -113,21 +515,43 @@ class DatabaseManager:
                 FOREIGN KEY (user_id) REFERENCES users (id)
             )
         ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_det_session ON detections(session_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_det_ts ON detections(timestamp)")
         
-        conn.commit()
-        conn.close()
     
-    def hash_password(self, password):
-        """Hash password using bcrypt (passlib). If passlib missing, fallback to SHA256 (not recommended)."""
-        # Prefer the native `bcrypt` module when available for direct, predictable behavior
+    def _pick_backend(self):
+        """Bind the bcrypt implementation once: native bcrypt, else passlib, else none"""
         try:
-            import bcrypt as _bcrypt
+            import bcrypt
+        except ImportError:
+            bcrypt = None
+        self._bcrypt = bcrypt
+        if bcrypt is not None:
+            self._check_bcrypt = self._verify_bcrypt
+        elif self.pwd_context:
+            self._check_bcrypt = self.pwd_context.verify
+        else:
+            self._check_bcrypt = None
+    
+    def _verify_bcrypt(self, password, stored_hash):
+        return self._bcrypt.checkpw(password.encode('utf-8'), stored_hash.encode('utf-8'))
+    
+    @staticmethod
+    def _is_bcrypt(stored_hash):
+        return isinstance(stored_hash, str) and stored_hash.startswith('$2')
+    
+    def _verify(self, password, stored_hash):
+        """Check a password against a bcrypt hash, or a legacy SHA256 hex digest"""
+        if self._check_bcrypt is not None and self._is_bcrypt(stored_hash):
+            return self._check_bcrypt(password, stored_hash)
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored_hash)
+    
+    def hash_password(self, password):
+        """Hash password using bcrypt (native, else passlib). If neither is installed, fallback to SHA256 (not recommended)."""
+        if self._bcrypt is not None:
             # bcrypt.hashpw returns bytes
-            hashed = _bcrypt.hashpw(password.encode('utf-8'), _bcrypt.gensalt())
-            return hashed.decode('utf-8')
-        except Exception:
-            pass
-
+            return self._bcrypt.hashpw(password.encode('utf-8'), self._bcrypt.gensalt()).decode('utf-8')
+        
         # Next prefer passlib if available
         if self.pwd_context:
             return self.pwd_context.hash(password)
@@ -136,22 +560,22 @@ class DatabaseManager:
         return hashlib.sha256(password.encode()).hexdigest()
     
     def create_user(self, email, password):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         try:
             password_hash = self.hash_password(password)
             cursor.execute("INSERT INTO users (email, password_hash) VALUES (?, ?)", 
                          (email, password_hash))
-            conn.commit()
             user_id = cursor.lastrowid
-            conn.close()
             return user_id
         except sqlite3.IntegrityError:
-            conn.close() 
             return None
     
+    def _password_digest(self, password):
+        return hmac.new(self._verify_key, password.encode('utf-8'), hashlib.sha256).digest()
+
     def authenticate_user(self, email, password):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         # Fetch stored hash for the user
         cursor.execute("SELECT id, password_hash FROM users WHERE email = ?", (email,))
@@ -159,62 +583,38 @@ class DatabaseManager:
         user_id = None
         if row:
             user_id_db, stored_hash = row[0], row[1]
+            digest = self._password_digest(password)
+            cached = self._verified.get((email, stored_hash))
+            if cached is not None and hmac.compare_digest(cached, digest):
+                user_id = user_id_db
+        if row and user_id is None:
             try:
-                # First, if stored hash looks like a bcrypt hash (starts with $2), try native bcrypt
-                try:
-                    if isinstance(stored_hash, str) and stored_hash.startswith('$2'):
-                        import bcrypt as _bcrypt
-                        if _bcrypt.checkpw(password.encode('utf-8'), stored_hash.encode('utf-8')):
-                            user_id = user_id_db
-                    # Next, try passlib if available and it recognizes the scheme
-                    elif self.pwd_context and self.pwd_context.identify(stored_hash):
-                        if self.pwd_context.verify(password, stored_hash):
-                            user_id = user_id_db
-                    else:
-                        # Fallback: assume stored hash is SHA256 hex
-                        sha_hash = hashlib.sha256(password.encode()).hexdigest()
-                        if sha_hash == stored_hash:
-                            user_id = user_id_db
-                            # Re-hash with bcrypt (native) for better security if available
-                            try:
-                                import bcrypt as _bcrypt
-                                new_hash = _bcrypt.hashpw(password.encode('utf-8'), _bcrypt.gensalt()).decode('utf-8')
-                                cursor.execute("UPDATE users SET password_hash = ? WHERE id = ?", (new_hash, user_id_db))
-                                conn.commit()
-                                self.log_message(f"🔒 Upgraded password hash for user id {user_id_db} to bcrypt")
-                            except Exception:
-                                # If bcrypt native not available, try passlib re-hash
-                                if self.pwd_context:
-                                    try:
-                                        new_hash = self.pwd_context.hash(password)
-                                        cursor.execute("UPDATE users SET password_hash = ? WHERE id = ?", (new_hash, user_id_db))
-                                        conn.commit()
-                                        self.log_message(f"🔒 Upgraded password hash for user id {user_id_db} to passlib/bcrypt")
-                                    except Exception:
-                                        pass
-                except Exception as e:
-                    # Backend verification error
-                    self.log_message(f"⚠️ Password backend verification error: {e}")
+                if self._verify(password, stored_hash):
+                    user_id = user_id_db
+                    # Legacy SHA256 hash: re-hash with bcrypt (queued with last_login below)
+                    if not self._is_bcrypt(stored_hash) and (self._bcrypt or self.pwd_context):
+                        stored_hash = self.hash_password(password)
+                        self._write_q.put(('password_hash', (stored_hash, user_id_db), None))
+                        print(f"🔒 Upgraded password hash for user id {user_id_db} to bcrypt")
             except Exception as e:
                 # Verification error
-                self.log_message(f"⚠️ Password verification error: {e}")
-        # Update last_login if authenticated
+                print(f"⚠️ Password verification error: {e}")
+            if user_id:
+                self._verified[(email, stored_hash)] = digest
+        # Update last_login if authenticated (queued with any hash upgrade: one commit)
         if user_id:
-            cursor.execute("UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?", (user_id,))
-            conn.commit()
-        conn.close()
+            self._write_q.put(('last_login', user_id, None))
         return user_id
     
     def reset_password(self, email, new_password):
         """Reset password for an existing user"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         try:
             # Check if user exists
             cursor.execute("SELECT id FROM users WHERE email = ?", (email,))
             row = cursor.fetchone()
             if not row:
-                conn.close()
                 return False
             
             user_id = row[0]
@@ -222,48 +622,96 @@ class DatabaseManager:
             new_hash = self.hash_password(new_password)
             # Update password
             cursor.execute("UPDATE users SET password_hash = ? WHERE id = ?", (new_hash, user_id))
-            conn.commit()
-            conn.close()
             return True
         except Exception as e:
             self.log_message(f"❌ Password reset error: {e}")
-            conn.close()
             return False
     
     def create_session(self, user_id, user_email):
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
         cursor.execute("INSERT INTO sessions (user_id, user_email) VALUES (?, ?)", (user_id, user_email))
         session_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
         return session_id
     
-    def log_detection(self, user_id, user_email, session_id, detection_type, confidence, description):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("""INSERT INTO detections 
-                        (user_id, user_email, session_id, detection_type, confidence, description)
-                        VALUES (?, ?, ?, ?, ?, ?)""",
-                    (user_id, user_email, session_id, detection_type, confidence, description))
-        detection_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        return detection_id
+    def log_detection(self, user_id, session_id, detection_type, confidence, description):
+        """Queue a detection for the writer thread; returns a Future for its row id"""
+        future = concurrent.futures.Future()
+        self._write_q.put(('detection',
+                           (user_id, session_id, detection_type, confidence, description),
+                           future))
+        return future
     
     def mark_email_sent(self, detection_id):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("UPDATE detections SET email_sent = TRUE WHERE id = ?", (detection_id,))
-        conn.commit()
-        conn.close()
+        """detection_id may be a row id or the Future returned by log_detection"""
+        self._write_q.put(('email_sent', detection_id, None))
     
     def mark_beep_played(self, detection_id):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()  
-        cursor.execute("UPDATE detections SET beep_played = TRUE WHERE id = ?", (detection_id,))
-        conn.commit()
-        conn.close()
+        """detection_id may be a row id or the Future returned by log_detection"""
+        self._write_q.put(('beep_played', detection_id, None))
+    
+    def _writer_loop(self):
+        """Writer thread: commit queued detection writes in batches"""
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._write_q.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._write_batch(batch)
+                    return
+                batch.append(item)
+            self._write_batch(batch)
+    
+    def _write_batch(self, batch):
+        """Apply a batch of queued writes in a single transaction"""
+        conn = self._conn()
+        # Row ids assigned in this batch; their futures resolve only after COMMIT
+        new_ids = {}
+        try:
+            conn.execute("BEGIN")
+            for kind, args, future in batch:
+                if kind == 'detection':
+                    cursor = conn.execute("""INSERT INTO detections 
+                        (user_id, session_id, detection_type, confidence, description)
+                        VALUES (?, ?, ?, ?, ?)""", args)
+                    new_ids[future] = cursor.lastrowid
+                    continue
+                if kind == 'password_hash':
+                    conn.execute("UPDATE users SET password_hash = ? WHERE id = ?", args)
+                    continue
+                if kind == 'last_login':
+                    conn.execute("UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?", (args,))
+                    continue
+                
+                detection_id = args
+                if isinstance(args, concurrent.futures.Future):
+                    # FIFO queue: the insert was in this batch or an earlier one
+                    detection_id = new_ids.get(args)
+                    if detection_id is None:
+                        if args.exception() is not None:
+                            continue
+                        detection_id = args.result()
+                column = 'email_sent' if kind == 'email_sent' else 'beep_played'
+                conn.execute(f"UPDATE detections SET {column} = TRUE WHERE id = ?", (detection_id,))
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            print(f"❌ Failed to write {len(batch)} detection records: {e}")
+            for kind, args, future in batch:
+                if future is not None:
+                    future.set_exception(e)
+            return
+        
+        for future, detection_id in new_ids.items():
+            future.set_result(detection_id)
 
 class AuthenticationWindow:
     """User authentication window with email login"""
@@ -272,6 +720,9 @@ class AuthenticationWindow:
         self.db_manager = db_manager
         self.user_id = None
         self.user_email = None
+        # bcrypt is deliberately slow; verify off the Tk thread so the UI stays live
+        self._auth_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._auth_future = None
         
         self.root = tk.Tk()
         self.root.title("🔐 Smart Surveillance - Authentication")
@@ -332,10 +783,10 @@ class AuthenticationWindow:
         btn_frame.pack(pady=(10, 0))
         
         # Login button for existing users
-        login_btn = tk.Button(btn_frame, text="🚀 Login (Existing User)", 
+        self.login_btn = tk.Button(btn_frame, text="🚀 Login (Existing User)", 
                             command=self.login, bg='#2ecc71', fg='white', 
                             font=('Arial', 11, 'bold'), pady=8, width=35)
-        login_btn.pack(pady=(0, 8))
+        self.login_btn.pack(pady=(0, 8))
         
         # Separator
         separator_label = tk.Label(btn_frame, text="─── OR ───", 
@@ -366,8 +817,26 @@ class AuthenticationWindow:
             messagebox.showerror("❌ Login Error", 
                             "Please enter both email and password\n\n🔐 Both fields are required to access your account")
             return
+        if self._auth_future is not None:
+            return  # a check is already running
+        
+        self.login_btn.config(state='disabled', text="⏳ Checking password...")
+        self._auth_future = self._auth_pool.submit(self.db_manager.authenticate_user, email, password)
+        self.root.after(50, self._poll_login, email)
+    
+    def _poll_login(self, email):
+        """Wait for the background password check without blocking Tk"""
+        if not self._auth_future.done():
+            self.root.after(50, self._poll_login, email)
+            return
+        future, self._auth_future = self._auth_future, None
+        self.login_btn.config(state='normal', text="🚀 Login (Existing User)")
+        try:
+            user_id = future.result()
+        except Exception as e:
+            messagebox.showerror("❌ Login Error", f"Login failed:\n{e}")
+            return
         
-        user_id = self.db_manager.authenticate_user(email, password)
         if user_id:
             self.user_id = user_id
             self.user_email = email
@@ -377,6 +846,7 @@ class AuthenticationWindow:
                             f"🛡️ Surveillance system ready\n"
                             f"📧 Alert notifications: ACTIVE\n\n"
                             f"Starting your monitoring session...")
+            self._auth_pool.shutdown(wait=False)
             self.root.quit()
         else:
             # Enhanced error with helpful suggestions
@@ -540,7 +1010,8 @@ class AuthenticationWindow:
 class CompleteSurveillanceSystem:
     """Complete surveillance system with all features integrated"""
 
-    def __init__(self, db_manager, user_id=None, user_email=None, preloaded_models=None):
+    def __init__(self, db_manager, user_id=None, user_email=None, preloaded_models=None,
+                 inference_worker=None):
         self.db_manager = db_manager
         self.user_id = user_id
         self.user_email = user_email
@@ -568,6 +1039,21 @@ class CompleteSurveillanceSystem:
         self.camera_type = "none" 
         self.ip_webcam_url = ""
         self.is_monitoring = False
+        # Resolution/fps requested from the camera itself so frames arrive small
+        # instead of being decoded at 1080p and shrunk in Python
+        self.requested_capture = (640, 480, 15)
+        self.capture_size = None  # what the camera actually negotiated
+        self.display_size = (800, 600)
+        # Display frames are resized and converted into preallocated buffers; the
+        # RGB one sits inside a binary PPM that refreshes one reused PhotoImage
+        display_w, display_h = self.display_size
+        ppm_header = f"P6 {display_w} {display_h} 255\n".encode('ascii')
+        self._ppm = bytearray(len(ppm_header) + display_w * display_h * 3)
+        self._ppm[:len(ppm_header)] = ppm_header
+        self._disp_rgb = np.frombuffer(self._ppm, dtype=np.uint8,
+                                       offset=len(ppm_header)).reshape(display_h, display_w, 3)
+        self._disp_buf = np.empty((display_h, display_w, 3), dtype=np.uint8)
+        self._photo = None
 
         # If models were preloaded before authentication, accept them to avoid reload delay
         self.models = preloaded_models or {}
@@ -578,8 +1064,28 @@ class CompleteSurveillanceSystem:
         # Executor for running inference off the capture/display thread
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.inference_future = None
-        # How many display frames to skip between detection submissions
+        # Separate inference process (see InferenceWorker); when present the
+        # executor above is unused and models live in the worker, not here
+        self.inference_worker = inference_worker
+        self.inference_pending = False
+        self._violence_load_attempted = False  # Violence model loads on the first test
+        self._worker_lock = threading.Lock()  # Guards the switch to in-process detection
+        self._oversize_logged = False  # Frames too big for a ring slot are reported once
+        # How many display frames to skip between detection submissions; adapts
+        # to activity: every frame while a detection is recent (detection_hold),
+        # backing off by one per check up to max_detection_interval when quiet
         self.detection_interval = 4
+        self.min_detection_interval = 1
+        self.max_detection_interval = 10
+        self.detection_hold = 3.0
+        self._last_detection_time = 0
+        # Motion gate: skip inference while a 160x120 grey thumbnail stays still,
+        # but never for longer than max_skip_seconds
+        self._thumb_prev = None
+        self.motion_pixel_delta = 20
+        self.motion_min_pixels = 50
+        self.max_skip_seconds = 2.0
+        self._last_submit_time = 0
         # flag used to avoid queuing new inference while one is running
         self._inference_running = False
         
@@ -589,6 +1095,16 @@ class CompleteSurveillanceSystem:
         # Debounce confirmations to avoid false weapon logs
         self._weapon_confirm = {'count': 0, 'last_time': 0}
         os.makedirs("alerts", exist_ok=True)
+
+        # Alert emails are queued for one mail thread that keeps its SMTP session
+        # open; same-type alerts arriving within mail_max_wait share one message
+        self._mail_q = queue.Queue()
+        self._mail_thread = None
+        self._smtp_sender = None
+        self._tj = None  # TurboJPEG encoder, created by the mail thread (False: unusable)
+        self.mail_max_batch = 8
+        self.mail_max_wait = self.alert_cooldown
+        self.smtp_keepalive = 60  # seconds idle between NOOPs
         
         # Statistics
         self.stats = {
@@ -626,6 +1142,8 @@ class CompleteSurveillanceSystem:
         else:
             # keep disabled if missing credentials; user can configure via GUI or env vars
             self.email_config['enabled'] = False
+        if self.email_config['enabled']:
+            self.start_mail_worker()
         
         # Load AI models after GUI is ready
         self.load_ai_models()
@@ -633,19 +1151,21 @@ class CompleteSurveillanceSystem:
     def load_ai_models(self):
         """Load AI models for detection"""
         try:
-            # Weapon detection
-            if YOLO_AVAILABLE:
-                weapon_paths = [
-                    "AI_models/Object_detection/best.pt",
-                    "AI_models/Object_detection/yolov8n.pt",
-                    "Object_detection/best.pt",
-                    "yolov8n.pt"
-                ]
-
-                for path in weapon_paths:
-                    try:
-                        if os.path.exists(path):
-                            self.models['weapon'] = YOLO(path)
+            if self.inference_worker is not None:
+                self.log_message("🔄 Detection models are loading in the inference process...")
+            else:
+                import_ai_libraries()
+                # Weapon detection
+                if YOLO_AVAILABLE:
+                    warm_up_filter_boxes()
+                    model_paths = resolve_models()
+
+                    # Models preloaded before login are kept rather than loaded again
+                    weapon_path = None
+                    for path in ([] if 'weapon' in self.models else model_paths.get('weapon', [])):
+                        try:
+                            self.models['weapon'] = load_yolo(path)
+                            weapon_path = path
                             self.log_message(f"✅ Weapon detection model loaded: {path}")
                             # Try to move underlying model to GPU if available
                             try:
@@ -653,74 +1173,53 @@ class CompleteSurveillanceSystem:
                                     m = self.models['weapon']
                                     if hasattr(m, 'model') and hasattr(m.model, 'to'):
                                         m.model.to('cuda')
-                                        self.log_message("🔧 Weapon model moved to CUDA")
+                                        if USE_HALF:
+                                            m.model.half()
+                                        self.log_message(f"🔧 Weapon model moved to CUDA{' (FP16)' if USE_HALF else ''}")
                             except Exception as e:
                                 self.log_message(f"⚠️ Weapon GPU move failed: {e}")
                             break
-                    except Exception:
-                        continue
-
-                # Crowd detection
-                crowd_paths = [
-                    "AI_models/crowddetection/yolov8s.pt",
-                    "AI_models/crowddetection/yolov8n.pt",
-                    "crowddetection/yolov8s.pt",
-                    "yolov8n.pt"
-                ]
+                        except Exception:
+                            continue
 
-                for path in crowd_paths:
-                    try:
-                        if os.path.exists(path):
-                            self.models['crowd'] = YOLO(path)
+                    # Crowd detection
+                    for path in ([] if 'crowd' in self.models else model_paths.get('crowd', [])):
+                        try:
+                            # Same weights as the weapon model: share it so each
+                            # frame needs one forward pass instead of two
+                            if weapon_path and same_weights(path, weapon_path):
+                                self.models['crowd'] = self.models['weapon']
+                                self.log_message(f"✅ Crowd detection shares the weapon model: {path}")
+                                break
+                            self.models['crowd'] = load_yolo(path)
                             self.log_message(f"✅ Crowd detection model loaded: {path}")
                             try:
                                 if TORCH_AVAILABLE and torch.cuda.is_available():
                                     m = self.models['crowd']
                                     if hasattr(m, 'model') and hasattr(m.model, 'to'):
                                         m.model.to('cuda')
-                                        self.log_message("🔧 Crowd model moved to CUDA")
+                                        if USE_HALF:
+                                            m.model.half()
+                                        self.log_message(f"🔧 Crowd model moved to CUDA{' (FP16)' if USE_HALF else ''}")
                             except Exception as e:
                                 self.log_message(f"⚠️ Crowd GPU move failed: {e}")
                             break
-                    except Exception:
-                        continue
-
-            # Emotion detection
-            if FER_AVAILABLE:
-                self.models['emotion'] = FER(mtcnn=True)
-                self.log_message("✅ Emotion detection model loaded")
+                        except Exception:
+                            continue
 
-            # Try to load optional violence detection model (SlowFast / PyTorchVideo)
-            try:
-                import importlib
-                violence_mod = importlib.import_module('AI_models.violence.violence')
-                # The refactored module exposes load_model/predict helpers
-                if hasattr(violence_mod, 'load_model'):
-                    try:
-                        # Attempt to load the model lazily; may raise ImportError if torch missing
-                        violence_model = violence_mod.load_model()
-                        # Store dict (module, model) so callers can use predict helpers
-                        self.models['violence'] = {
-                            'module': violence_mod,
-                            'model': violence_model
-                        }
-                        self.log_message("✅ Violence detection model loaded (SlowFast)")
-                    except Exception as inner_e:
-                        self.log_message(f"ℹ️ Violence module found but failed to load model: {inner_e}")
-                else:
-                    self.log_message("ℹ️ Violence module found but API not compatible")
-            except Exception as e:
-                # Not critical; just log and continue with details
-                self.log_message(f"ℹ️ Violence module not available or missing dependencies: {e}")
+                # Emotion detection
+                if FER_AVAILABLE and 'emotion' not in self.models:
+                    self.models['emotion'] = load_emotion_model()
+                    self.log_message("✅ Emotion detection model loaded")
 
         except Exception as e:
             self.log_message(f"Model loading error: {e}")
 
-        # Verification of loaded models
-        self.log_message("🔍 MODEL STATUS:")
-        self.log_message(f"  - Weapon model: {'✅ LOADED' if 'weapon' in self.models else '❌ NOT FOUND'}")
-        self.log_message(f"  - Crowd model: {'✅ LOADED' if 'crowd' in self.models else '❌ NOT FOUND'}")
-        self.log_message(f"  - Emotion model: {'✅ LOADED' if 'emotion' in self.models else '❌ NOT FOUND'}")
+        # Verification of loaded models (the worker reports its own when ready)
+        if self.inference_worker is None:
+            self.log_model_status(self.models)
+        else:
+            self.root.after(100, self.poll_inference_status)
 
         # Test beep sound system
         if SOUND_AVAILABLE:
@@ -728,6 +1227,59 @@ class CompleteSurveillanceSystem:
             # Play a quick test beep
             threading.Thread(target=lambda: winsound.Beep(1000, 100), daemon=True).start()
     
+    def user_info_text(self, model_count):
+        """Header line; model_count None while the inference process is still loading"""
+        models = 'loading...' if model_count is None else model_count
+        return f"👤 User: {self.user_email} | 🤖 AI Models: {models} | 📧 Auto-Alerts: {'ON' if self.email_config['enabled'] else 'SETUP NEEDED'}"
+    
+    def log_model_status(self, loaded):
+        """Log which detection models are available and show the count in the header"""
+        self.log_message(f"🤖 {len(loaded)} AI models loaded")
+        self.root.after(0, lambda: self.user_label.config(text=self.user_info_text(len(loaded))))
+        self.log_message("🔍 MODEL STATUS:")
+        self.log_message(f"  - Weapon model: {'✅ LOADED' if 'weapon' in loaded else '❌ NOT FOUND'}")
+        self.log_message(f"  - Crowd model: {'✅ LOADED' if 'crowd' in loaded else '❌ NOT FOUND'}")
+        self.log_message(f"  - Emotion model: {'✅ LOADED' if 'emotion' in loaded else '❌ NOT FOUND'}")
+    
+    def poll_inference_status(self):
+        """Tk timer: relay model status and log lines from the inference process"""
+        worker = self.inference_worker
+        if worker is None:
+            return
+        while True:
+            try:
+                kind, payload = worker.status_q.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'ready':
+                self.log_model_status(payload)
+            else:
+                self.log_message(payload)
+        if worker.process.is_alive():
+            self.root.after(100, self.poll_inference_status)
+        else:
+            self.fall_back_to_in_process(f"exit code {worker.process.exitcode}")
+    
+    def fall_back_to_in_process(self, reason):
+        """The inference process died: report it, drop any frame it still had,
+        and load the models here so the executor path takes over detection"""
+        with self._worker_lock:
+            worker = self.inference_worker
+            if worker is None:
+                return
+            self.inference_worker = None
+            self.inference_pending = False
+        self.log_message(f"❌ Inference process stopped ({reason}); running detection in-process")
+        worker.stop()
+        # Queued ahead of any detect_threats call on the single-worker executor
+        self.executor.submit(self.load_models_in_process)
+    
+    def load_models_in_process(self):
+        """Executor job: load the detection models into this process"""
+        models = preload_models()
+        self.models.update(models)
+        self.log_model_status(models)
+    
     def setup_gui(self):
         """Setup main surveillance interface"""
         self.root = tk.Tk()
@@ -740,10 +1292,11 @@ class CompleteSurveillanceSystem:
         top_frame.pack(fill='x', padx=10, pady=5)
         
         # User info
-        user_info = f"👤 User: {self.user_email} | 🤖 AI Models: {len(self.models)} | 📧 Auto-Alerts: {'ON' if self.email_config['enabled'] else 'SETUP NEEDED'}"
-        user_label = tk.Label(top_frame, text=user_info, 
-                             font=('Arial', 12, 'bold'), bg='#34495e', fg='white')
-        user_label.pack(side='left')
+        # In worker mode the models live in the inference process; its 'ready'
+        # status fills in the count
+        self.user_label = tk.Label(top_frame, text=self.user_info_text(None if self.inference_worker else len(self.models)),
+                                   font=('Arial', 12, 'bold'), bg='#34495e', fg='white')
+        self.user_label.pack(side='left')
         
         # Control buttons
         btn_frame = tk.Frame(top_frame, bg='#34495e')
@@ -834,7 +1387,6 @@ class CompleteSurveillanceSystem:
         
         # Welcome messages
         self.log_message(f"🎉 Welcome {self.user_email}!")
-        self.log_message(f"🤖 {len(self.models)} AI models loaded")
         self.log_message("📧 Email alerts configured for your account")
         self.log_message("🔊 Beep sounds enabled for threats")
         self.log_message("📱 Click 'Camera Setup' to choose camera source")
@@ -972,6 +1524,7 @@ class CompleteSurveillanceSystem:
         
         # Connect to camera
         if self.camera_type == "ip":
+            self.request_ip_webcam_size()
             self.cap = cv2.VideoCapture(self.ip_webcam_url)
         elif self.camera_type == "laptop":
             self.cap = cv2.VideoCapture(self.laptop_camera_index)
@@ -980,11 +1533,8 @@ class CompleteSurveillanceSystem:
             messagebox.showerror("Camera Error", "Failed to connect to camera")
             return
         
-        # Configure camera
-        # Increase capture resolution for a larger display while keeping buffer small
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Configure camera before the first read so the driver negotiates the size
+        self._configure_capture()
         
         self.is_monitoring = True
         self.monitor_btn.config(text="🔴 Stop Monitoring", bg='#e74c3c')
@@ -996,6 +1546,34 @@ class CompleteSurveillanceSystem:
         
         self.log_message("🚀 Monitoring started!")
     
+    def request_ip_webcam_size(self):
+        """Ask the IP Webcam app to stream at the requested size.
+
+        CAP_PROP_FRAME_WIDTH/HEIGHT are ignored for an HTTP MJPEG stream, so the
+        phone has to be told directly through the app's settings endpoint.
+        """
+        width, height, _ = self.requested_capture
+        base_url = self.ip_webcam_url.rsplit('/video', 1)[0]
+        try:
+            urlopen(f"{base_url}/settings/video_size?set={width}x{height}", timeout=2).close()
+            self.log_message(f"📱 Requested {width}x{height} stream from IP webcam")
+        except Exception as e:
+            self.log_message(f"⚠️ Could not set IP webcam resolution: {e}")
+    
+    def _configure_capture(self):
+        """Negotiate capture size/fps with the camera and record what it chose"""
+        width, height, fps = self.requested_capture
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        self.cap.set(cv2.CAP_PROP_FPS, fps)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
+        self.capture_size = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                             int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        if self.capture_size != (width, height):
+            self.log_message(f"📷 Camera delivers {self.capture_size[0]}x{self.capture_size[1]} "
+                             f"(requested {width}x{height})")
+    
     def stop_monitoring(self):
         """Stop video monitoring"""
         self.is_monitoring = False
@@ -1017,6 +1595,9 @@ class CompleteSurveillanceSystem:
                     self.executor.shutdown(wait=False)
                 except Exception:
                     pass
+                if self.inference_worker is not None:
+                    self.inference_worker.stop()
+                self.stop_mail_worker()
                 # close the UI
                 self.root.destroy()
         except Exception as e:
@@ -1025,6 +1606,7 @@ class CompleteSurveillanceSystem:
     def video_loop(self):
         """Enhanced video processing loop with smooth box persistence"""
         frame_count = 0
+        next_check_frame = 0
         
         # Enhanced detection caching system
         self.persistent_detections = {'weapons': [], 'people': [], 'faces': []}
@@ -1042,12 +1624,30 @@ class CompleteSurveillanceSystem:
                 # Submit detection work every detection_interval frames using executor
                 # and collect results from previous inference when available.
                 # This keeps the capture/display loop responsive while inference runs.
-                if frame_count % self.detection_interval == 0:
+                if frame_count >= next_check_frame:
                     # If a previous inference finished, collect and process its results
-                    if self.inference_future is not None and self.inference_future.done():
+                    new_results = None
+                    worker = self.inference_worker
+                    if worker is not None and not worker.process.is_alive():
+                        # A frame in flight would otherwise keep inference_pending set forever
+                        self.fall_back_to_in_process(f"exit code {worker.process.exitcode}")
+                        worker = None
+                    if worker is not None:
+                        new_results = worker.poll()
+                        if new_results is not None:
+                            self.inference_pending = False
+                    elif self.inference_future is not None and self.inference_future.done():
                         try:
                             new_results = self.inference_future.result()
+                        except Exception as e:
+                            self.log_message(f"❌ Inference result error: {e}")
+                        finally:
+                            self.inference_future = None
+                    
+                    if new_results is not None:
+                        try:
                             if new_results['weapons'] or new_results['people'] or new_results['faces']:
+                                self._last_detection_time = current_time
                                 self.log_message(f"🔍 DETECTIONS: Weapons={len(new_results['weapons'])}, People={len(new_results['people'])}, Faces={len(new_results['faces'])}")
                                 for detection_type in ['weapons', 'people', 'faces']:
                                     for detection in new_results[detection_type]:
@@ -1062,32 +1662,42 @@ class CompleteSurveillanceSystem:
                                 self.update_statistics(new_results)
                         except Exception as e:
                             self.log_message(f"❌ Inference result error: {e}")
-                        finally:
-                            self.inference_future = None
 
+                    if current_time - self._last_detection_time < self.detection_hold:
+                        self.detection_interval = self.min_detection_interval
+                    else:
+                        self.detection_interval = min(self.max_detection_interval, self.detection_interval + 1)
+                    next_check_frame = frame_count + self.detection_interval
+                    
                     # If no inference is running, submit current frame for detection
-                    if self.inference_future is None:
+                    # (skipped by the motion gate while the scene is still)
+                    if worker is not None:
+                        if frame.nbytes > SLOT_BYTES:
+                            if not self._oversize_logged:
+                                self._oversize_logged = True
+                                h, w = frame.shape[:2]
+                                self.log_message(f"⚠️ {w}x{h} frames exceed the 1080p inference slot; "
+                                                 "lower the camera resolution to enable detection")
+                        elif not self.inference_pending and self.scene_changed(frame, current_time):
+                            self.inference_pending = worker.submit(frame)
+                            self._last_submit_time = current_time
+                    elif self.inference_future is None and self.scene_changed(frame, current_time):
                         try:
                             frame_for_infer = frame.copy()
                             self.inference_future = self.executor.submit(self.detect_threats, frame_for_infer)
+                            self._last_submit_time = current_time
                         except Exception as e:
                             self.log_message(f"❌ Failed to submit inference: {e}")
                 
                 # Clean old detections from cache
                 for detection_type in ['weapons', 'people', 'faces']:
-                    # Remove detections older than box_lifetime
-                    valid_indices = []
-                    for i, timestamp in enumerate(self.detection_timestamps[detection_type]):
-                        if current_time - timestamp < self.box_lifetime:
-                            valid_indices.append(i)
-                    
-                    # Keep only valid (recent) detections
-                    self.persistent_detections[detection_type] = [
-                        self.persistent_detections[detection_type][i] for i in valid_indices
-                    ]
-                    self.detection_timestamps[detection_type] = [
-                        self.detection_timestamps[detection_type][i] for i in valid_indices
-                    ]
+                    # Timestamps are appended in time order, so detections older
+                    # than box_lifetime are always a prefix: find it and drop it
+                    timestamps = self.detection_timestamps[detection_type]
+                    expired = bisect.bisect_right(timestamps, current_time - self.box_lifetime)
+                    if expired:
+                        del timestamps[:expired]
+                        del self.persistent_detections[detection_type][:expired]
                 
                 # Always draw all persistent detections
                 display_results = {
@@ -1109,89 +1719,26 @@ class CompleteSurveillanceSystem:
                 self.log_message(f"❌ Video error: {e}")
                 break
     
+    def scene_changed(self, frame, current_time):
+        """Cheap motion gate run before each detection submission. True when the
+        thumbnail moved since the last check, a detection is still recent, or
+        inference has been skipped for max_skip_seconds.
+        """
+        thumb = cv2.cvtColor(cv2.resize(frame, (160, 120), interpolation=cv2.INTER_AREA),
+                             cv2.COLOR_BGR2GRAY)
+        prev, self._thumb_prev = self._thumb_prev, thumb
+        if prev is None:
+            return True
+        if current_time - self._last_detection_time < self.detection_hold:
+            return True
+        if current_time - self._last_submit_time >= self.max_skip_seconds:
+            return True
+        _, moved = cv2.threshold(cv2.absdiff(thumb, prev), self.motion_pixel_delta, 255, cv2.THRESH_BINARY)
+        return cv2.countNonZero(moved) > self.motion_min_pixels
+    
     def detect_threats(self, frame):
         """Detect threats using AI models"""
-        results = {
-            'weapons': [],
-            'people': [],
-            'faces': [],
-            'emotions': []
-        }
-        
-        try:
-            # Enhanced weapon detection - only real weapons (knife, gun, sword, pistol, rifle)
-            if 'weapon' in self.models:
-                # Higher confidence thresholds to avoid false positives from metals
-                for conf_threshold in [0.45, 0.55, 0.65]:
-                    weapon_results = self.models['weapon'](frame, verbose=False, conf=conf_threshold)
-                    for r in weapon_results:
-                        boxes = r.boxes
-                        if boxes is not None:
-                            for box in boxes:
-                                conf = float(box.conf[0])
-                                cls = int(box.cls[0])
-                                
-                                # Filter for actual weapon classes only (0=knife, 1=gun, 2=sword, 3=pistol, 4=rifle)
-                                valid_weapon_classes = [0, 1, 2, 3, 4]  # Only real weapons
-                                
-                                if conf > conf_threshold and cls in valid_weapon_classes:
-                                    x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                                    
-                                    # Additional size filter - weapons should be reasonably sized
-                                    bbox_width = x2 - x1
-                                    bbox_height = y2 - y1
-                                    bbox_area = bbox_width * bbox_height
-                                    
-                                    # Filter out too small or too large detections (likely false positives)
-                                    if 500 < bbox_area < 100000:  # Reasonable weapon size
-                                        results['weapons'].append({
-                                            'bbox': (int(x1), int(y1), int(x2), int(y2)),
-                                            'confidence': conf,
-                                            'class': cls
-                                        })
-                                        weapon_names = {0: "KNIFE", 1: "GUN", 2: "SWORD", 3: "PISTOL", 4: "RIFLE"}
-                                        weapon_type = weapon_names.get(cls, "WEAPON")
-                                        self.log_message(f"🔍 REAL WEAPON FOUND: {weapon_type} (Class={cls}), Conf={conf:.3f}")
-                    # If weapons found, break to avoid duplicates
-                    if results['weapons']:
-                        break
-            
-            # People detection
-            if 'crowd' in self.models:
-                people_results = self.models['crowd'](frame, verbose=False)
-                for r in people_results:
-                    boxes = r.boxes
-                    if boxes is not None:
-                        for box in boxes:
-                            conf = float(box.conf[0])
-                            cls = int(box.cls[0])
-                            if cls == 0 and conf > 0.5:  # Person class
-                                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                                results['people'].append({
-                                    'bbox': (int(x1), int(y1), int(x2), int(y2)),
-                                    'confidence': conf
-                                })
-            
-            # Emotion detection
-            if 'emotion' in self.models:
-                try:
-                    emotion_results = self.models['emotion'].detect_emotions(frame)
-                    for face in emotion_results:
-                        x, y, w, h = face['box']
-                        dominant = max(face['emotions'], key=face['emotions'].get)
-                        results['faces'].append({
-                            'bbox': (x, y, x+w, y+h),
-                            'emotions': face['emotions'],
-                            'dominant': dominant,
-                            'confidence': face['emotions'][dominant]
-                        })
-                except Exception:
-                    pass  # FER can be unstable
-        
-        except Exception as e:
-            self.log_message(f"❌ Detection error: {e}")
-        
-        return results
+        return run_detectors(self.models, frame, self.log_message)
     
     def has_threats(self, results):
         """Check if any threats are detected"""
@@ -1223,7 +1770,7 @@ class CompleteSurveillanceSystem:
                     
                     # Log to database
                     detection_id = self.db_manager.log_detection(
-                        self.user_id, self.user_email, self.session_id,
+                        self.user_id, self.session_id,
                         "weapon", top_weapon.get('confidence', 0.9),
                         f"{weapon_count} weapons detected in surveillance area"
                     )
@@ -1252,7 +1799,7 @@ class CompleteSurveillanceSystem:
                 
                 # Log to database
                 detection_id = self.db_manager.log_detection(
-                    self.user_id, self.user_email, self.session_id,
+                    self.user_id, self.session_id,
                     "crowd", 0.9,
                     f"Large crowd of {people_count} people detected"
                 )
@@ -1280,7 +1827,7 @@ class CompleteSurveillanceSystem:
                 
                 # Log to database
                 detection_id = self.db_manager.log_detection(
-                    self.user_id, self.user_email, self.session_id,
+                    self.user_id, self.session_id,
                     "behavior", suspicious_faces[0]['confidence'],
                     f"Suspicious behavior detected: {suspicious_faces[0]['dominant']}"
                 )
@@ -1302,8 +1849,41 @@ class CompleteSurveillanceSystem:
         # Update statistics display
         self.update_stats_display()
 
+    def load_violence_model(self):
+        """Background thread: import and load the optional violence model, then
+        rerun the test. Kept out of startup so the GUI process only pulls in
+        torch/pytorchvideo when someone actually asks for a violence test."""
+        try:
+            import importlib
+            violence_mod = importlib.import_module('AI_models.violence.violence')
+            # The refactored module exposes load_model/predict helpers
+            if hasattr(violence_mod, 'load_model'):
+                try:
+                    # May raise ImportError if torch missing
+                    violence_model = violence_mod.load_model()
+                    # Store dict (module, model) so callers can use predict helpers
+                    self.models['violence'] = {
+                        'module': violence_mod,
+                        'model': violence_model
+                    }
+                    self.log_message("✅ Violence detection model loaded (SlowFast)")
+                except Exception as inner_e:
+                    self.log_message(f"ℹ️ Violence module found but failed to load model: {inner_e}")
+            else:
+                self.log_message("ℹ️ Violence module found but API not compatible")
+        except Exception as e:
+            # Not critical; just log and continue with details
+            self.log_message(f"ℹ️ Violence module not available or missing dependencies: {e}")
+        self.root.after(0, self.run_violence_test)
+    
     def run_violence_test(self):
         """Run a small test using the optional violence detection module (if available)."""
+        # First use: load the module off the Tk thread, then come back here
+        if not self._violence_load_attempted:
+            self._violence_load_attempted = True
+            self.log_message("🔄 Loading violence detection model...")
+            threading.Thread(target=self.load_violence_model, daemon=True).start()
+            return
         try:
             if 'violence' in self.models and isinstance(self.models['violence'], dict):
                 mod = self.models['violence'].get('module')
@@ -1405,45 +1985,186 @@ class CompleteSurveillanceSystem:
         beep_thread.start()
     
     def send_email_alert(self, alert_type, message, results, frame, detection_id):
-        """Send automatic email alert to user"""
+        """Queue an automatic email alert for the mail thread"""
         if not self.email_config['enabled']:
             self.log_message("📧 Email not configured - please setup Gmail")
             return
-        
-        def send_email():
+
+        self._mail_q.put({
+            'alert_type': alert_type,
+            'message': message,
+            'weapons': len(results['weapons']),
+            'people': len(results['people']),
+            'faces': len(results['faces']),
+            # Copy: video_loop draws boxes onto this frame after queuing the alert
+            'frame': frame.copy(),
+            'detection_id': detection_id,
+            'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        })
+        self.start_mail_worker()
+
+    def start_mail_worker(self):
+        """Start the mail thread if it is not already running"""
+        if self._mail_thread is None or not self._mail_thread.is_alive():
+            self._mail_thread = threading.Thread(target=self._mail_worker, daemon=True)
+            self._mail_thread.start()
+
+    def stop_mail_worker(self):
+        """Ask the mail thread to send what it has queued and close its SMTP session"""
+        if self._mail_thread is not None and self._mail_thread.is_alive():
+            self._mail_q.put(None)
+
+    def _mail_worker(self):
+        """Mail thread: batch queued alerts and send them over one SMTP session"""
+        server = None
+        stop = False
+        while not stop:
             try:
-                # Create email message
-                msg = MIMEMultipart()
-                msg['From'] = self.email_config['sender_email']
-                msg['To'] = self.user_email
-                msg['Subject'] = f"🚨 SECURITY ALERT: {alert_type}"
-                
-                timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                
-                # Create detailed email body
-                body = f"""
+                alert = self._mail_q.get(timeout=self.smtp_keepalive)
+            except queue.Empty:
+                # Keep the idle session alive so the next alert skips TLS + AUTH
+                if server is not None:
+                    try:
+                        server.noop()
+                    except Exception:
+                        server = None
+                continue
+            if alert is None:
+                break
+
+            batch = [alert]
+            deadline = time.time() + self.mail_max_wait
+            while len(batch) < self.mail_max_batch:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    alert = self._mail_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if alert is None:
+                    stop = True
+                    break
+                batch.append(alert)
+
+            # One email per alert type, carrying every alert of that type in the batch
+            groups = {}
+            for alert in batch:
+                groups.setdefault(alert['alert_type'], []).append(alert)
+            for alert_type, alerts in groups.items():
+                server = self._send_alert_group(server, alert_type, alerts)
+
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                pass
+
+    def encode_alert_jpeg(self, frame):
+        """JPEG-encode an alert frame with libjpeg-turbo when available, else OpenCV"""
+        if TURBOJPEG_AVAILABLE and self._tj is not False:
+            try:
+                if self._tj is None:
+                    self._tj = TurboJPEG()
+                return self._tj.encode(frame, quality=ALERT_JPEG_QUALITY)
+            except Exception as e:
+                # libturbojpeg shared library missing or unusable: OpenCV from now on
+                self.log_message(f"⚠️ TurboJPEG unavailable, using OpenCV: {e}")
+                self._tj = False
+        ok, buf = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, ALERT_JPEG_QUALITY])
+        if not ok:
+            raise ValueError("JPEG encoding failed")
+        return buf.tobytes()
+
+    def _smtp_connect(self):
+        """Open and authenticate an SMTP session; returns None when it cannot"""
+        # Prefer environment variables for credentials if provided
+        env_sender = os.environ.get('SSS_EMAIL') or os.environ.get('SURVEILLANCE_SENDER')
+        env_pass = os.environ.get('SSS_EMAIL_PASS') or os.environ.get('SURVEILLANCE_PASS')
+
+        if env_sender:
+            sender_email = env_sender
+            self.log_message("📧 Using sender from environment variable SSS_EMAIL")
+        else:
+            sender_email = self.email_config.get('sender_email', self.user_email)
+
+        if env_pass:
+            sender_password = env_pass
+            self.log_message("🔐 Using app password from environment variable SSS_EMAIL_PASS")
+        else:
+            sender_password = self.email_config.get('sender_password', '')
+
+        if not sender_email:
+            self.log_message("📧 Email attempt: No sender configured - cannot send email")
+            return None
+
+        if not sender_password:
+            self.log_message("⚠️ Email alert attempted but App Password not configured")
+            return None
+
+        server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
+        server.starttls()
+
+        # Attempt to login - catch authentication errors separately for clearer guidance
+        try:
+            server.login(sender_email, sender_password)
+        except smtplib.SMTPAuthenticationError as auth_err:
+            self.log_message(f"❌ SMTP Authentication failed: {auth_err}")
+            self.log_message("💡 Make sure 2-Step Verification is enabled and you're using a 16-character Gmail App Password")
+            server.close()
+            return None
+        except Exception as ex:
+            self.log_message(f"❌ SMTP login error: {ex}")
+            server.close()
+            return None
+        self._smtp_sender = sender_email
+        return server
+
+    def _send_alert_group(self, server, alert_type, alerts):
+        """Send one email for a group of same-type alerts; returns the session to reuse"""
+        detection_ids = []
+        try:
+            for alert in alerts:
+                # log_detection hands back a Future; wait for the writer's row id
+                detection_id = alert['detection_id']
+                if isinstance(detection_id, concurrent.futures.Future):
+                    detection_id = detection_id.result(timeout=5)
+                detection_ids.append(detection_id)
+
+            # Create email message
+            msg = MIMEMultipart()
+            msg['From'] = self.email_config['sender_email']
+            msg['To'] = self.user_email
+            msg['Subject'] = f"🚨 SECURITY ALERT: {alert_type}"
+            if len(alerts) > 1:
+                msg['Subject'] += f" ({len(alerts)} alerts)"
+
+            # Create detailed email body
+            body = f"""
 🛡️ SMART SURVEILLANCE SYSTEM - SECURITY ALERT
 
 ⚠️ ALERT TYPE: {alert_type}
-⏰ TIME: {timestamp}
 👤 USER: {self.user_email}
+"""
+            for alert, detection_id in zip(alerts, detection_ids):
+                body += f"""
+⏰ TIME: {alert['timestamp']}
 🔍 DETECTION ID: {detection_id}
 
 📋 ALERT DETAILS:
-{message}
+{alert['message']}
 
 📊 DETECTION SUMMARY:
 """
-                
                 # Add detection details
-                if results['weapons']:
-                    body += f"🔫 WEAPONS: {len(results['weapons'])} detected\n"
-                if results['people']:
-                    body += f"👥 PEOPLE: {len(results['people'])} detected\n"
-                if results['faces']:
-                    body += f"😊 FACES: {len(results['faces'])} analyzed\n"
-                
-                body += f"""
+                if alert['weapons']:
+                    body += f"🔫 WEAPONS: {alert['weapons']} detected\n"
+                if alert['people']:
+                    body += f"👥 PEOPLE: {alert['people']} detected\n"
+                if alert['faces']:
+                    body += f"😊 FACES: {alert['faces']} analyzed\n"
+
+            body += f"""
 🚨 RECOMMENDED ACTIONS:
 ✓ Check surveillance feed immediately
 ✓ Verify threat level in monitored area
@@ -1453,93 +2174,70 @@ class CompleteSurveillanceSystem:
 📧 This alert was automatically sent to: {self.user_email}
 🤖 Generated by: Complete Smart Surveillance System
 """
-                
-                msg.attach(MIMEText(body, 'plain'))
-                
-                # Attach screenshot evidence
+
+            msg.attach(MIMEText(body, 'plain'))
+
+            # Attach screenshot evidence, one image per alert
+            for n, (alert, detection_id) in enumerate(zip(alerts, detection_ids), 1):
                 try:
-                    screenshot_path = f"alerts/alert_{detection_id}_{timestamp.replace(':', '-')}.jpg"
-                    cv2.imwrite(screenshot_path, frame)
-                    
-                    with open(screenshot_path, 'rb') as f:
-                        img_data = f.read()
-                        image = MIMEImage(img_data)
-                        image.add_header('Content-Disposition', 'attachment', 
-                                       filename=f'{alert_type}_evidence.jpg')
-                        msg.attach(image)
+                    # Encode once; the same bytes are saved as evidence and attached
+                    img_data = self.encode_alert_jpeg(alert['frame'])
+                    screenshot_path = f"alerts/alert_{detection_id}_{alert['timestamp'].replace(':', '-')}.jpg"
+                    with open(screenshot_path, 'wb') as f:
+                        f.write(img_data)
+
+                    image = MIMEImage(img_data, 'jpeg')
+                    image.add_header('Content-Disposition', 'attachment',
+                                   filename=f'{alert_type}_evidence_{n}.jpg')
+                    msg.attach(image)
                 except Exception as e:
                     self.log_message(f"📎 Screenshot attach failed: {e}")
-                
-                # Send email with enhanced authentication
-                server = smtplib.SMTP(self.email_config['smtp_server'], self.email_config['smtp_port'])
-                server.starttls()
-                
-                # Prefer environment variables for credentials if provided
-                env_sender = os.environ.get('SSS_EMAIL') or os.environ.get('SURVEILLANCE_SENDER')
-                env_pass = os.environ.get('SSS_EMAIL_PASS') or os.environ.get('SURVEILLANCE_PASS')
 
-                if env_sender:
-                    sender_email = env_sender
-                    self.log_message("📧 Using sender from environment variable SSS_EMAIL")
-                else:
-                    sender_email = self.email_config.get('sender_email', self.user_email)
-
-                if env_pass:
-                    sender_password = env_pass
-                    self.log_message("🔐 Using app password from environment variable SSS_EMAIL_PASS")
-                else:
-                    sender_password = self.email_config.get('sender_password', '')
-
-                if not sender_email:
-                    self.log_message("📧 Email attempt: No sender configured - cannot send email")
+            if server is None:
+                server = self._smtp_connect()
+            if server is None:
+                self.log_message(f"📧 ALERT LOGGED: {alert_type} x{len(alerts)} (email not sent)")
+                # Still log the alert even if email fails
+                for detection_id in detection_ids:
                     self.db_manager.mark_email_sent(detection_id)
-                    return
+                return None
 
-                if not sender_password:
-                    self.log_message("⚠️ Email alert attempted but App Password not configured")
-                    self.log_message(f"📧 ALERT LOGGED: {alert_type} detected at {timestamp}")
-                    # Still log the alert even if email fails
-                    self.db_manager.mark_email_sent(detection_id)
-                    return
+            try:
+                server.sendmail(self._smtp_sender, self.user_email, msg.as_string())
+            except smtplib.SMTPServerDisconnected:
+                # The kept-alive session went stale; reconnect once and retry
+                server = self._smtp_connect()
+                if server is None:
+                    raise
+                server.sendmail(self._smtp_sender, self.user_email, msg.as_string())
+
+            # Mark as sent
+            for detection_id in detection_ids:
+                self.db_manager.mark_email_sent(detection_id)
+            self.stats['emails_sent'] += 1
+
+            self.log_message(f"✅ {alert_type} email ({len(alerts)} alert(s)) sent successfully to {self.user_email}")
+            return server
 
-                # Attempt to login - catch authentication errors separately for clearer guidance
+        except Exception as e:
+            self.log_message(f"❌ Email sending failed: {e}")
+            self.log_message(f"📧 ALERT LOGGED: {alert_type} x{len(alerts)}")
+
+            # Provide specific guidance based on error type
+            error_str = str(e).lower()
+            if "authentication" in error_str or "password" in error_str:
+                self.log_message("💡 Setup Gmail App Password: Gmail Settings > Security > 2FA > App Passwords")
+            elif "connection" in error_str or "network" in error_str:
+                self.log_message("🌐 Check internet connection")
+            else:
+                self.log_message("⚙️ Check Email Settings in system menu")
+            # Drop the session; the next batch opens a fresh one
+            if server is not None:
                 try:
-                    server.login(sender_email, sender_password)
-                except smtplib.SMTPAuthenticationError as auth_err:
-                    self.log_message(f"❌ SMTP Authentication failed: {auth_err}")
-                    self.log_message("💡 Make sure 2-Step Verification is enabled and you're using a 16-character Gmail App Password")
-                    self.db_manager.mark_email_sent(detection_id)
-                    return
-                except Exception as ex:
-                    self.log_message(f"❌ SMTP login error: {ex}")
-                    self.db_manager.mark_email_sent(detection_id)
-                    return
-                server.sendmail(sender_email, self.user_email, msg.as_string())
-                server.quit()
-                
-                # Mark as sent
-                self.db_manager.mark_email_sent(detection_id)
-                self.stats['emails_sent'] += 1
-                
-                self.log_message(f"✅ {alert_type} email sent successfully to {self.user_email}")
-                
-            except Exception as e:
-                self.log_message(f"❌ Email sending failed: {e}")
-                self.log_message(f"📧 ALERT LOGGED: {alert_type} detected at {timestamp}")
-                
-                # Provide specific guidance based on error type
-                error_str = str(e).lower()
-                if "authentication" in error_str or "password" in error_str:
-                    self.log_message("💡 Setup Gmail App Password: Gmail Settings > Security > 2FA > App Passwords")
-                elif "connection" in error_str or "network" in error_str:
-                    self.log_message("🌐 Check internet connection")
-                else:
-                    self.log_message("⚙️ Check Email Settings in system menu")
-        
-        # Send email in background thread
-        email_thread = threading.Thread(target=send_email)
-        email_thread.daemon = True
-        email_thread.start()
+                    server.close()
+                except Exception:
+                    pass
+            return None
     
     def draw_detections(self, frame, results):
         """Ultra-enhanced detection drawing with maximum visibility"""
@@ -1641,18 +2339,21 @@ class CompleteSurveillanceSystem:
     def update_video_display(self, frame):
         """Optimized video display with reduced lag"""
         try:
-            # Resize for display (optimized size)
-            frame = cv2.resize(frame, (800, 600))  # Larger display for better visibility
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Convert to PIL Image with optimization
-            pil_image = Image.fromarray(frame)
-            photo = ImageTk.PhotoImage(pil_image)
+            # Resize for display (optimized size); skipped when the camera already matches
+            if (frame.shape[1], frame.shape[0]) != self.display_size:
+                cv2.resize(frame, self.display_size, dst=self._disp_buf)  # Larger display for better visibility
+                frame = self._disp_buf
+            # BGR -> RGB straight into the PPM pixel data
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._disp_rgb)
             
             # Direct update without threading delay
             if hasattr(self, 'video_label'):
-                self.video_label.config(image=photo)
-                self.video_label.image = photo  # Keep reference to prevent garbage collection
+                if self._photo is None:
+                    self._photo = tk.PhotoImage(data=self._ppm, format='PPM')
+                    self.video_label.config(image=self._photo)
+                else:
+                    # Reload the same image in place instead of creating a new one per frame
+                    self._photo.configure(data=self._ppm, format='PPM')
             
         except Exception:
             pass  # Reduce error logging to prevent console spam
@@ -1752,6 +2453,7 @@ class CompleteSurveillanceSystem:
                 return
 
             self.email_config['enabled'] = True
+            self.start_mail_worker()
 
             self.save_email_config()
             messagebox.showinfo("✅ Saved", "Gmail configuration saved!\n\nAutomatic threat alerts enabled.")
@@ -1871,6 +2573,9 @@ class CompleteSurveillanceSystem:
                 self.executor.shutdown(wait=False)
         except Exception:
             pass
+        if self.inference_worker is not None:
+            self.inference_worker.stop()
+        self.stop_mail_worker()
         try:
             self.root.quit()
             self.root.destroy()
@@ -1885,56 +2590,55 @@ def preload_models():
     models = {}
     try:
         print("🔄 Preloading AI models (this may take a moment)...")
+        import_ai_libraries()
         if YOLO_AVAILABLE:
-            weapon_paths = [
-                "AI_models/Object_detection/best.pt",
-                "AI_models/Object_detection/yolov8n.pt",
-                "Object_detection/best.pt",
-                "yolov8n.pt"
-            ]
-            for path in weapon_paths:
+            warm_up_filter_boxes()
+            model_paths = resolve_models()
+            weapon_path = None
+            for path in model_paths.get('weapon', []):
                 try:
-                    if os.path.exists(path):
-                        models['weapon'] = YOLO(path)
-                        print(f"✅ Weapon model loaded: {path}")
-                        # try move to CUDA if available
-                        try:
-                            if TORCH_AVAILABLE and torch.cuda.is_available():
-                                m = models['weapon']
-                                if hasattr(m, 'model') and hasattr(m.model, 'to'):
-                                    m.model.to('cuda')
-                                    print("🔧 Weapon model moved to CUDA")
-                        except Exception:
-                            pass
-                        break
+                    models['weapon'] = load_yolo(path)
+                    weapon_path = path
+                    print(f"✅ Weapon model loaded: {path}")
+                    # try move to CUDA if available
+                    try:
+                        if TORCH_AVAILABLE and torch.cuda.is_available():
+                            m = models['weapon']
+                            if hasattr(m, 'model') and hasattr(m.model, 'to'):
+                                m.model.to('cuda')
+                                if USE_HALF:
+                                    m.model.half()
+                                print(f"🔧 Weapon model moved to CUDA{' (FP16)' if USE_HALF else ''}")
+                    except Exception:
+                        pass
+                    break
                 except Exception:
                     continue
 
-            crowd_paths = [
-                "AI_models/crowddetection/yolov8s.pt",
-                "AI_models/crowddetection/yolov8n.pt",
-                "crowddetection/yolov8s.pt",
-                "yolov8n.pt"
-            ]
-            for path in crowd_paths:
+            for path in model_paths.get('crowd', []):
                 try:
-                    if os.path.exists(path):
-                        models['crowd'] = YOLO(path)
-                        print(f"✅ Crowd model loaded: {path}")
-                        try:
-                            if TORCH_AVAILABLE and torch.cuda.is_available():
-                                m = models['crowd']
-                                if hasattr(m, 'model') and hasattr(m.model, 'to'):
-                                    m.model.to('cuda')
-                                    print("🔧 Crowd model moved to CUDA")
-                        except Exception:
-                            pass
+                    if weapon_path and same_weights(path, weapon_path):
+                        models['crowd'] = models['weapon']
+                        print(f"✅ Crowd detection shares the weapon model: {path}")
                         break
+                    models['crowd'] = load_yolo(path)
+                    print(f"✅ Crowd model loaded: {path}")
+                    try:
+                        if TORCH_AVAILABLE and torch.cuda.is_available():
+                            m = models['crowd']
+                            if hasattr(m, 'model') and hasattr(m.model, 'to'):
+                                m.model.to('cuda')
+                                if USE_HALF:
+                                    m.model.half()
+                                print(f"🔧 Crowd model moved to CUDA{' (FP16)' if USE_HALF else ''}")
+                    except Exception:
+                        pass
+                    break
                 except Exception:
                     continue
 
         if FER_AVAILABLE:
-            models['emotion'] = FER(mtcnn=True)
+            models['emotion'] = load_emotion_model()
             print("✅ Emotion model loaded")
 
     except Exception as e:
@@ -1947,6 +2651,191 @@ def preload_models():
     return models
 
 
+def run_detectors(models, frame, log):
+    """Run the detection models on one frame; log is called with status messages"""
+    results = {
+        'weapons': [],
+        'people': [],
+        'faces': [],
+        'emotions': []
+    }
+    
+    # Results of the first weapon pass, reused for people when both
+    # detectors are the same model
+    first_pass = None
+    
+    try:
+        # On CUDA every YOLO pass reads one preallocated, already-uploaded tensor
+        letterbox = yolo_input() if ('weapon' in models or 'crowd' in models) else None
+        source = letterbox.prepare(frame) if letterbox is not None else frame
+        
+        # Upload and inference overlap on separate CUDA streams; results are read
+        # back on the compute stream so .cpu() waits for the right work
+        with letterbox.compute() if letterbox is not None else contextlib.nullcontext():
+            # Enhanced weapon detection - only real weapons (knife, gun, sword, pistol, rifle)
+            if 'weapon' in models:
+                # Higher confidence thresholds to avoid false positives from metals
+                for conf_threshold in [0.45, 0.55, 0.65]:
+                    weapon_results = models['weapon'](source, verbose=False, conf=conf_threshold, half=USE_HALF)
+                    if first_pass is None:
+                        first_pass = weapon_results
+                    for r in weapon_results:
+                        if r.boxes is None:
+                            continue
+                        # Only real weapons (0=knife, 1=gun, 2=sword, 3=pistol, 4=rifle) of a plausible size
+                        boxes = result_boxes(r)
+                        if letterbox is not None:
+                            letterbox.unletterbox(boxes)
+                        weapon_rows, _ = filter_boxes(boxes, WEAPON_CLASS_MASK, conf_threshold, PERSON_CLASS, 1.0)
+                        for i in weapon_rows:
+                            x1, y1, x2, y2, conf, cls = boxes[i]
+                            conf = float(conf)
+                            cls = int(cls)
+                            results['weapons'].append({
+                                'bbox': (int(x1), int(y1), int(x2), int(y2)),
+                                'confidence': conf,
+                                'class': cls
+                            })
+                            weapon_names = {0: "KNIFE", 1: "GUN", 2: "SWORD", 3: "PISTOL", 4: "RIFLE"}
+                            weapon_type = weapon_names.get(cls, "WEAPON")
+                            log(f"🔍 REAL WEAPON FOUND: {weapon_type} (Class={cls}), Conf={conf:.3f}")
+                    # If weapons found, break to avoid duplicates
+                    if results['weapons']:
+                        break
+        
+            # People detection
+            if 'crowd' in models:
+                # The 0.45 weapon pass keeps every box the > 0.5 person filter needs
+                if first_pass is not None and models['crowd'] is models['weapon']:
+                    people_results = first_pass
+                else:
+                    people_results = models['crowd'](source, verbose=False, half=USE_HALF)
+                for r in people_results:
+                    if r.boxes is None:
+                        continue
+                    boxes = result_boxes(r)
+                    if letterbox is not None:
+                        letterbox.unletterbox(boxes)
+                    # The weapon threshold of 1.0 never matches; only person rows are used
+                    _, person_rows = filter_boxes(boxes, WEAPON_CLASS_MASK, 1.0, PERSON_CLASS, 0.5)
+                    for i in person_rows:
+                        x1, y1, x2, y2, conf = boxes[i, :5]
+                        results['people'].append({
+                            'bbox': (int(x1), int(y1), int(x2), int(y2)),
+                            'confidence': float(conf)
+                        })
+        
+        # Emotion detection
+        if 'emotion' in models:
+            try:
+                emotion_results = models['emotion'].detect_emotions(frame)
+                for face in emotion_results:
+                    x, y, w, h = face['box']
+                    dominant = max(face['emotions'], key=face['emotions'].get)
+                    results['faces'].append({
+                        'bbox': (x, y, x+w, y+h),
+                        'emotions': face['emotions'],
+                        'dominant': dominant,
+                        'confidence': face['emotions'][dominant]
+                    })
+            except Exception:
+                pass  # FER can be unstable
+    
+    except Exception as e:
+        log(f"❌ Detection error: {e}")
+    
+    return results
+
+
+# Frames handed to the inference process go through a shared-memory ring;
+# each slot fits up to a 1080p BGR frame
+RING_SLOTS = 2
+SLOT_BYTES = 1920 * 1080 * 3
+
+
+def inference_worker_main(shm_name, cmd_q, result_q, status_q):
+    """Inference process: load the detectors once, then run them on ring frames"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        models = preload_models()
+        status_q.put(('ready', sorted(models)))
+        
+        def log(message):
+            status_q.put(('log', message))
+        
+        while True:
+            cmd = cmd_q.get()
+            if cmd is None:
+                break
+            slot, shape = cmd
+            # No lasting reference to the view, so shm.close() can release the buffer
+            result_q.put(run_detectors(
+                models, np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * SLOT_BYTES), log))
+    finally:
+        shm.close()
+
+
+class InferenceWorker:
+    """Runs the detection models in their own process so inference never
+    competes with capture and the Tk GUI for the GIL. Frames are copied into
+    shared memory; only slot numbers and detection results are pickled.
+    """
+    
+    def __init__(self):
+        self.shm = shared_memory.SharedMemory(create=True, size=RING_SLOTS * SLOT_BYTES)
+        self.cmd_q = multiprocessing.Queue()
+        self.result_q = multiprocessing.Queue()
+        self.status_q = multiprocessing.Queue()
+        self.next_slot = 0
+        self.process = multiprocessing.Process(
+            target=inference_worker_main,
+            args=(self.shm.name, self.cmd_q, self.result_q, self.status_q),
+            daemon=True
+        )
+        self.process.start()
+    
+    def submit(self, frame):
+        """Copy a frame into the next ring slot and queue it; False if it doesn't fit"""
+        if frame.nbytes > SLOT_BYTES or not self.process.is_alive():
+            return False
+        slot = self.next_slot
+        self.next_slot = (slot + 1) % RING_SLOTS
+        view = np.ndarray(frame.shape, dtype=np.uint8, buffer=self.shm.buf, offset=slot * SLOT_BYTES)
+        np.copyto(view, frame)
+        self.cmd_q.put((slot, frame.shape))
+        return True
+    
+    def poll(self):
+        """Return the next finished result, or None if none is ready"""
+        try:
+            return self.result_q.get_nowait()
+        except queue.Empty:
+            return None
+    
+    def stop(self):
+        """Shut down the worker process and release the shared memory"""
+        if self.shm is None:
+            return
+        try:
+            self.cmd_q.put(None)
+            self.process.join(timeout=2)
+            if self.process.is_alive():
+                self.process.terminate()
+        finally:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+def start_inference_worker():
+    """Start the inference process; returns None if it can't be started"""
+    try:
+        return InferenceWorker()
+    except Exception as e:
+        print(f"⚠️ Inference process unavailable, running detection in-process: {e}")
+        return None
+
+
 def main():
     """Main application entry point"""
     print("🛡️ Complete Smart Surveillance System")
@@ -1954,11 +2843,17 @@ def main():
     
     # Initialize database
     db_manager = DatabaseManager()
+    inference_worker = None
     
     try:
-        # Preload AI models before asking user to login (faster UX after login)
+        # Load AI models before asking user to login (faster UX after login);
+        # the inference process loads its own copy while the login window is up
         print("🔄 Preloading AI models before authentication...")
-        preloaded = preload_models()
+        inference_worker = start_inference_worker()
+        preload_future = None
+        if inference_worker is None:
+            # No inference process: load in a thread while the user types credentials
+            preload_future = concurrent.futures.ThreadPoolExecutor(max_workers=1).submit(preload_models)
 
         # Step 1: User Authentication (runs after models begin loading)
         print("🔐 User authentication required...")
@@ -1974,11 +2869,13 @@ def main():
 
         # Step 2: Start Complete Surveillance System with preloaded models
         print("🛡️ Starting Complete Surveillance System...")
+        preloaded = preload_future.result() if preload_future else {}
         system = CompleteSurveillanceSystem(
             db_manager,
             auth_window.user_id,
             auth_window.user_email,
-            preloaded_models=preloaded
+            preloaded_models=preloaded,
+            inference_worker=inference_worker
         )
         
         print("🚀 System ready! Starting GUI...")
@@ -1990,6 +2887,10 @@ def main():
         print(f"❌ System error: {e}")
         messagebox.showerror("System Error", f"Critical error: {e}")
     
+    finally:
+        if inference_worker is not None:
+            inference_worker.stop()
+    
     print("🛡️ Complete Surveillance System stopped")
 
 if __name__ == "__main__":